@@ -11,6 +11,7 @@ import time
 from typing import Any, cast
 
 import jwt
+from lru import LRU
 
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -24,7 +25,13 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN, REFRESH_TOKEN_EXPIRATION
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_CACHE_TTL,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+    REFRESH_TOKEN_EXPIRATION,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .models import AuthFlowContext, AuthFlowResult
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
@@ -189,6 +196,12 @@ class AuthManager:
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
         self._expire_callback: CALLBACK_TYPE | None = None
+        # Verified access tokens -> (refresh token id, valid until)
+        self._access_token_cache: LRU[str, tuple[str, float]] = LRU(
+            ACCESS_TOKEN_CACHE_SIZE
+        )
+        self._access_token_cache_hits = 0
+        self._access_token_cache_misses = 0
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
         )
@@ -354,6 +367,7 @@ class AuthManager:
         if tasks:
             await asyncio.gather(*tasks)
 
+        self._async_invalidate_access_tokens(set(user.refresh_tokens))
         await self._store.async_remove_user(user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
@@ -402,6 +416,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(set(user.refresh_tokens))
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -530,6 +545,7 @@ class AuthManager:
     def async_remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
         """Delete a refresh token."""
         self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens({refresh_token.id})
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, ())
         for revoke_callback in callbacks:
@@ -650,7 +666,30 @@ class AuthManager:
 
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        Verified tokens are remembered until they expire, at most for
+        ACCESS_TOKEN_CACHE_TTL seconds, to skip verifying the signature
+        and claims of tokens which are used over and over again.
+        """
+        now = time.time()
+        if (cached := self._access_token_cache.get(token)) is not None:
+            refresh_token_id, valid_until = cached
+            if (
+                valid_until > now
+                and (
+                    refresh_token := self._store.async_get_refresh_token(
+                        refresh_token_id
+                    )
+                )
+                is not None
+                and refresh_token.user.is_active
+            ):
+                self._access_token_cache_hits += 1
+                return refresh_token
+            del self._access_token_cache[token]
+        self._access_token_cache_misses += 1
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -668,7 +707,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -677,8 +716,28 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._access_token_cache[token] = (
+            refresh_token.id,
+            min(claims["exp"], now + ACCESS_TOKEN_CACHE_TTL),
+        )
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(self, refresh_token_ids: set[str]) -> None:
+        """Forget the verified access tokens of refresh tokens."""
+        for token, (refresh_token_id, _) in self._access_token_cache.items():
+            if refresh_token_id in refresh_token_ids:
+                del self._access_token_cache[token]
+
+    @callback
+    def async_access_token_cache_info(self) -> dict[str, int]:
+        """Return the hits, misses and size of the access token cache."""
+        return {
+            "hits": self._access_token_cache_hits,
+            "misses": self._access_token_cache_misses,
+            "size": len(self._access_token_cache),
+        }
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -8,7 +8,7 @@ import itertools
 from logging import getLogger
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -43,6 +43,28 @@ INITIAL_LOAD_SAVE_DELAY = 300
 DEFAULT_SAVE_DELAY = 1
 
 
+@callback
+def _entity_registry_change_affects_permissions(
+    event_data: er.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Return if an entity registry change can change entity permissions."""
+    return (
+        event_data["action"] != "update"
+        or "device_id" in event_data["changes"]
+        or "old_entity_id" in event_data
+    )
+
+
+@callback
+def _device_registry_change_affects_permissions(
+    event_data: dr.EventDeviceRegistryUpdatedData,
+) -> bool:
+    """Return if a device registry change can change entity permissions."""
+    return event_data["action"] == "remove" or (
+        event_data["action"] == "update" and "area_id" in event_data["changes"]
+    )
+
+
 class AuthStore:
     """Stores authentication info.
 
@@ -308,6 +330,25 @@ class AuthStore:
         credentials.data = data
         self._async_schedule_save()
 
+    @callback
+    def _async_track_permission_changes(self, perm_lookup: PermissionLookup) -> None:
+        """Track registry changes which can change entity permissions."""
+
+        @callback
+        def _async_permissions_changed(_: Event) -> None:
+            perm_lookup.generation += 1
+
+        self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            _async_permissions_changed,
+            event_filter=_entity_registry_change_affects_permissions,
+        )
+        self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            _async_permissions_changed,
+            event_filter=_device_registry_change_affects_permissions,
+        )
+
     async def async_load(self) -> None:
         """Load the users."""
         if self._loaded:
@@ -320,6 +361,7 @@ class AuthStore:
 
         perm_lookup = PermissionLookup(ent_reg, dev_reg)
         self._perm_lookup = perm_lookup
+        self._async_track_permission_changes(perm_lookup)
 
         if data is None or not isinstance(data, dict):
             self._set_defaults()
@@ -6,6 +6,10 @@ ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 REFRESH_TOKEN_EXPIRATION = timedelta(days=90).total_seconds()
 
+# Verified access tokens which are remembered and for how many seconds
+ACCESS_TOKEN_CACHE_SIZE = 512
+ACCESS_TOKEN_CACHE_TTL = 300
+
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
 GROUP_ID_READ_ONLY = "system-read-only"
@@ -7,7 +7,12 @@ from collections.abc import Callable
 import voluptuous as vol
 
 from .const import CAT_ENTITIES
-from .entities import ENTITY_POLICY_SCHEMA, compile_entities
+from .entities import (
+    ENTITY_AREAS,
+    ENTITY_DEVICE_IDS,
+    ENTITY_POLICY_SCHEMA,
+    compile_entities,
+)
 from .merge import merge_policies
 from .models import PermissionLookup
 from .types import PolicyType
@@ -15,6 +20,9 @@ from .util import test_all
 
 POLICY_SCHEMA = vol.Schema({vol.Optional(CAT_ENTITIES): ENTITY_POLICY_SCHEMA})
 
+# Maximum number of entity ids with a remembered permission per policy key
+ENTITY_RESULTS_CACHE_SIZE = 16384
+
 __all__ = [
     "POLICY_SCHEMA",
     "AbstractPermissions",
@@ -54,10 +62,43 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        entity_policy = policy.get(CAT_ENTITIES)
+        # Only area and device policies depend on the registries
+        self._uses_registries = isinstance(entity_policy, dict) and (
+            ENTITY_AREAS in entity_policy or ENTITY_DEVICE_IDS in entity_policy
+        )
+        self._access_all: dict[str, bool] = {}
+        self._entity_results: dict[str, dict[str, bool]] = {}
+        self._entity_results_generation = 0
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
-        return test_all(self._policy.get(CAT_ENTITIES), key)
+        if (access_all := self._access_all.get(key)) is None:
+            access_all = self._access_all[key] = test_all(
+                self._policy.get(CAT_ENTITIES), key
+            )
+        return access_all
+
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity.
+
+        The result is remembered until the registries change in a way which
+        can change the permissions of areas and devices, so checking the
+        same entities again is a dictionary lookup.
+        """
+        if (
+            self._uses_registries
+            and self._entity_results_generation != self._perm_lookup.generation
+        ):
+            self._entity_results.clear()
+            self._entity_results_generation = self._perm_lookup.generation
+        if (results := self._entity_results.get(key)) is None:
+            results = self._entity_results[key] = {}
+        if (allowed := results.get(entity_id)) is None:
+            if len(results) >= ENTITY_RESULTS_CACHE_SIZE:
+                results.clear()
+            allowed = results[entity_id] = super().check_entity(entity_id, key)
+        return allowed
 
     def _entity_func(self) -> Callable[[str, str], bool]:
         """Return a function that can test entity access."""
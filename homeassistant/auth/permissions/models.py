@@ -16,3 +16,6 @@ class PermissionLookup:
 
     entity_registry: er.EntityRegistry = attr.ib()
     device_registry: dr.DeviceRegistry = attr.ib()
+    # Increased when a registry change can change the entity permissions
+    # of areas and devices
+    generation: int = attr.ib(default=0)
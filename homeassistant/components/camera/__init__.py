@@ -713,7 +713,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return bytes of camera image."""
-        return await self.hass.async_add_executor_job(
+        return await self.hass.async_add_priority_executor_job(
             partial(self.camera_image, width=width, height=height)
         )
 
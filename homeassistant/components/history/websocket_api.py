@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -14,6 +15,10 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.websocket_api import ActiveConnection, messages
+from homeassistant.components.websocket_api.stream_hub import (
+    LiveStreamSubscriber,
+    async_get_live_stream_hub,
+)
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_LAST_CHANGED,
@@ -38,7 +43,7 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import DOMAIN, EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,10 +53,8 @@ _LOGGER = logging.getLogger(__name__)
 class HistoryLiveStream:
     """Track a history live stream."""
 
-    stream_queue: asyncio.Queue[Event]
-    subscriptions: list[CALLBACK_TYPE]
+    subscriber: LiveStreamSubscriber | None = None
     end_time_unsub: CALLBACK_TYPE | None = None
-    task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
 
 
@@ -161,7 +164,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -284,7 +287,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -327,40 +330,13 @@ def _events_to_compressed_states(
     return states_by_entity_ids
 
 
-async def _async_events_consumer(
-    subscriptions_setup_complete_time: dt,
-    connection: ActiveConnection,
-    msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    no_attributes: bool,
-) -> None:
-    """Stream events from the queue."""
-    subscriptions_setup_complete_timestamp = (
-        subscriptions_setup_complete_time.timestamp()
-    )
-    while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
-                )
-            )
+def _async_events_to_stream_message(
+    events: list[Event], no_attributes: bool
+) -> dict[str, Any] | None:
+    """Convert live events to a history stream message."""
+    if history_states := _events_to_compressed_states(events, no_attributes):
+        return {"states": history_states}
+    return None
 
 
 @callback
@@ -477,20 +453,14 @@ async def ws_stream(
         )
         return
 
-    subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_HISTORY_STATES)
-    live_stream = HistoryLiveStream(
-        subscriptions=subscriptions, stream_queue=stream_queue
-    )
+    live_stream = HistoryLiveStream()
 
     @callback
     def _unsub(*_utc_time: Any) -> None:
         """Unsubscribe from all events."""
-        for subscription in subscriptions:
-            subscription()
-        subscriptions.clear()
-        if live_stream.task:
-            live_stream.task.cancel()
+        if live_stream.subscriber:
+            live_stream.subscriber.async_unsubscribe()
+            live_stream.subscriber = None
         if live_stream.wait_sync_task:
             live_stream.wait_sync_task.cancel()
         if live_stream.end_time_unsub:
@@ -502,27 +472,32 @@ async def ws_stream(
             hass, _unsub, end_time
         )
 
-    @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            _LOGGER.debug(
-                "Client exceeded max pending messages of %s",
-                MAX_PENDING_HISTORY_STATES,
-            )
-            _unsub()
-
-    _async_subscribe_events(
-        hass,
-        subscriptions,
-        _queue_or_cancel,
-        entity_ids,
-        significant_changes_only=significant_changes_only,
-        minimal_response=minimal_response,
+    # Identical live streams share one set of listeners and
+    # each state change is only compressed and serialized once
+    subscriber = live_stream.subscriber = async_get_live_stream_hub(
+        hass
+    ).async_subscribe(
+        (
+            DOMAIN,
+            tuple(sorted({entity_id.lower() for entity_id in entity_ids})),
+            significant_changes_only or minimal_response,
+            no_attributes,
+        ),
+        partial(
+            _async_subscribe_events,
+            hass,
+            entity_ids=entity_ids,
+            significant_changes_only=significant_changes_only,
+            minimal_response=minimal_response,
+        ),
+        lambda: partial(_async_events_to_stream_message, no_attributes=no_attributes),
+        connection,
+        msg_id,
+        _unsub,
+        coalesce_time=EVENT_COALESCE_TIME,
+        max_pending=MAX_PENDING_HISTORY_STATES,
     )
-    subscriptions_setup_complete_time = dt_util.utcnow()
+    subscriptions_setup_complete_time = subscriber.setup_complete_time
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
     # Fetch everything from history
@@ -544,15 +519,7 @@ async def ws_stream(
         # Unsubscribe happened while sending historical states
         return
 
-    live_stream.task = create_eager_task(
-        _async_events_consumer(
-            subscriptions_setup_complete_time,
-            connection,
-            msg_id,
-            stream_queue,
-            no_attributes,
-        )
-    )
+    subscriber.async_go_live()
 
     live_stream.wait_sync_task = create_eager_task(
         get_instance(hass).async_block_till_done()
@@ -1,5 +1,6 @@
 """Home Assistant trigger dispatcher."""
 
+from collections.abc import Hashable
 from typing import cast
 
 from homeassistant.const import CONF_PLATFORM
@@ -34,6 +35,16 @@ async def async_validate_trigger_config(
     return platform.TRIGGER_SCHEMA(config)  # type: ignore[no-any-return]
 
 
+async def async_get_trigger_key(
+    hass: HomeAssistant, config: ConfigType
+) -> Hashable | None:
+    """Return a key of the trigger to share it between automations."""
+    platform = await _async_get_trigger_platform(hass, config[CONF_PLATFORM])
+    if hasattr(platform, "async_get_trigger_key"):
+        return await platform.async_get_trigger_key(hass, config)
+    return None
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from datetime import timedelta
 import logging
 
@@ -29,7 +29,11 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
     process_state_match,
 )
-from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.trigger import (
+    TriggerActionType,
+    TriggerInfo,
+    trigger_config_key,
+)
 from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -91,6 +95,19 @@ async def async_validate_trigger_config(
     return config
 
 
+async def async_get_trigger_key(
+    hass: HomeAssistant, config: ConfigType
+) -> Hashable | None:
+    """Return a key of the trigger to share it between automations.
+
+    Triggers with a duration are not shared, each attach starts its own
+    timers when the state changes after it was attached.
+    """
+    if CONF_FOR in config:
+        return None
+    return trigger_config_key(config)
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
 from datetime import datetime
 from typing import Any
 
@@ -11,7 +12,11 @@ from homeassistant.const import CONF_PLATFORM
 from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_change
-from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.trigger import (
+    TriggerActionType,
+    TriggerInfo,
+    trigger_config_key,
+)
 from homeassistant.helpers.typing import ConfigType
 
 CONF_HOURS = "hours"
@@ -61,6 +66,13 @@ TRIGGER_SCHEMA = vol.All(
 )
 
 
+async def async_get_trigger_key(
+    hass: HomeAssistant, config: ConfigType
+) -> Hashable | None:
+    """Return a key of the trigger to share it between automations."""
+    return trigger_config_key(config)
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -67,6 +67,7 @@ from .decorators import require_admin  # noqa: F401
 from .forwarded import async_setup_forwarded
 from .headers import setup_headers
 from .request_context import setup_request_context
+from .request_stats import setup_request_stats
 from .security_filter import setup_security_filter
 from .static import CACHE_HEADERS, CachingStaticResource
 from .web_runner import HomeAssistantTCPSite
@@ -398,6 +399,8 @@ class HomeAssistantHTTP:
 
         setup_request_context(self.app, current_request)
 
+        setup_request_stats(self.app)
+
         if is_ban_enabled:
             setup_bans(self.hass, self.app, login_threshold)
 
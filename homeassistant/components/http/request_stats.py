@@ -0,0 +1,221 @@
+"""Middleware that records the latency and size of responses per route."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from functools import partial
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Final
+
+from aiohttp.web import (
+    AppKey,
+    Application,
+    Request,
+    StreamResponse,
+    WebSocketResponse,
+    middleware,
+)
+from aiohttp.web_exceptions import HTTPException
+from aiohttp.web_urldispatcher import AbstractResource
+
+from homeassistant.core import callback
+
+KEY_REQUEST_STATS = AppKey["RequestStats"]("ha_request_stats")
+
+# Upper bounds in seconds of the buckets of the latency histograms, the last
+# bucket counts everything slower
+LATENCY_BUCKETS: Final = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Name of the requests which did not match a route
+UNMATCHED_ROUTE: Final = "unmatched"
+
+
+class RouteStats:
+    """Latency histogram, requests in flight and bytes sent of a route."""
+
+    __slots__ = (
+        "errors",
+        "in_flight",
+        "latency_buckets",
+        "max_latency",
+        "requests",
+        "response_bytes",
+        "total_latency",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.response_bytes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @callback
+    def async_add(self, latency: float, response_bytes: int, error: bool) -> None:
+        """Add a handled request."""
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.requests += 1
+        self.response_bytes += response_bytes
+        self.total_latency += latency
+        self.max_latency = max(latency, self.max_latency)
+        if error:
+            self.errors += 1
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Return the upper bound of the bucket containing a latency percentile.
+
+        Returns None if there were no requests or the percentile is in the
+        last bucket, which has no upper bound.
+        """
+        if not self.requests:
+            return None
+        rank = self.requests * percentile / 100
+        count = 0
+        for upper_bound, bucket_count in zip(
+            LATENCY_BUCKETS, self.latency_buckets, strict=False
+        ):
+            count += bucket_count
+            if count >= rank:
+                return upper_bound
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dictionary."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "response_bytes": self.response_bytes,
+            "total_latency": self.total_latency,
+            "max_latency": self.max_latency,
+            "latency_p50": self.latency_percentile(50),
+            "latency_p95": self.latency_percentile(95),
+            "latency_buckets": list(self.latency_buckets),
+        }
+
+
+class RequestStats:
+    """Stats of the requests handled per route.
+
+    Routes are named after the canonical path of their resource, which is the
+    URL of the view with its placeholders, e.g. /api/history/period/{datetime}.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.routes: dict[str, RouteStats] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dictionary."""
+        return {
+            "latency_buckets": LATENCY_BUCKETS,
+            "routes": {
+                name: route_stats.as_dict() for name, route_stats in self.routes.items()
+            },
+        }
+
+
+@callback
+def _async_record_sent_response(
+    route_stats: RouteStats,
+    start: float,
+    response: StreamResponse,
+    error: bool,
+    _: asyncio.Task[Any],
+) -> None:
+    """Record a response once it was sent."""
+    size = response.content_length
+    route_stats.async_add(
+        monotonic() - start, response.body_length if size is None else size, error
+    )
+
+
+@callback
+def setup_request_stats(app: Application) -> None:
+    """Create request stats middleware for the app.
+
+    The latency is the time until the response was sent, the size is its
+    content length or the bytes written when it has none. Websocket
+    connections and streams are only counted while they are in flight.
+    """
+    stats = app[KEY_REQUEST_STATS] = RequestStats()
+    routes = stats.routes
+    # Stats of each resource, looked up once per resource
+    resource_stats: dict[AbstractResource | None, RouteStats] = {}
+
+    @middleware
+    async def request_stats_middleware(
+        request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
+    ) -> StreamResponse:
+        """Record the latency and size of the response."""
+        resource = request.match_info.route.resource
+        if (route_stats := resource_stats.get(resource)) is None:
+            name = UNMATCHED_ROUTE if resource is None else resource.canonical
+            if (route_stats := routes.get(name)) is None:
+                route_stats = routes[name] = RouteStats()
+            resource_stats[resource] = route_stats
+
+        # aiohttp sends the response in the task of the request after the
+        # middlewares returned it
+        task = asyncio.current_task()
+        if TYPE_CHECKING:
+            assert task is not None
+        route_stats.in_flight += 1
+        start = monotonic()
+        try:
+            response = await handler(request)
+        except HTTPException as err:
+            task.add_done_callback(
+                partial(
+                    _async_record_sent_response,
+                    route_stats,
+                    start,
+                    err,
+                    err.status >= 500,
+                )
+            )
+            raise
+        except asyncio.CancelledError:
+            # The client disconnected before the response was ready
+            raise
+        except BaseException:
+            route_stats.async_add(monotonic() - start, 0, True)
+            raise
+        finally:
+            route_stats.in_flight -= 1
+
+        # Streams are sent by the handler itself for as long as the client
+        # is connected, their latency would only skew the histogram
+        if type(response) is StreamResponse or type(response) is WebSocketResponse:
+            return response
+        task.add_done_callback(
+            partial(
+                _async_record_sent_response,
+                route_stats,
+                start,
+                response,
+                response.status >= 500,
+            )
+        )
+        return response
+
+    app.middlewares.append(request_stats_middleware)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from http import HTTPStatus
 from pathlib import Path
+from time import monotonic
 from typing import Final
 
+from aiohttp.abc import AbstractStreamWriter
 from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.web import BaseRequest, FileResponse, Request, StreamResponse
 from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -16,10 +19,52 @@ CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
+# Time the ETag of a served file is trusted without looking at the file again
+ETAG_CACHE_TIME: Final = 60
+# ETags of served files mapped to the time they expire and the last modified time
+ETAG_CACHE: LRU[Path, dict[str, tuple[float, float]]] = LRU(512)
 
 _GUESSER = CONTENT_TYPES.guess_file_type
 
 
+class _ETagCachingFileResponse(FileResponse):
+    """File response which remembers the ETag of the file it served."""
+
+    async def prepare(self, request: BaseRequest) -> AbstractStreamWriter | None:
+        """Prepare the response and remember the ETag of the file."""
+        writer = await super().prepare(request)
+        if (etag := self.etag) is not None and (last_modified := self.last_modified):
+            file_path: Path = self._path
+            if (etags := ETAG_CACHE.get(file_path)) is None:
+                etags = ETAG_CACHE[file_path] = {}
+            # Precompressed variants of the file have their own ETag
+            etags[etag.value] = (
+                monotonic() + ETAG_CACHE_TIME,
+                last_modified.timestamp(),
+            )
+        return writer
+
+
+def _not_modified_response(request: Request, file_path: Path) -> StreamResponse | None:
+    """Return a not modified response if the client has a current ETag.
+
+    Only ETags seen recently are trusted, which avoids looking at the file in
+    the executor when clients revalidate their cached files.
+    """
+    if not (if_none_match := request.if_none_match) or not (
+        etags := ETAG_CACHE.get(file_path)
+    ):
+        return None
+    now = monotonic()
+    for etag in if_none_match:
+        if (cached := etags.get(etag.value)) is not None and cached[0] > now:
+            response = StreamResponse(status=HTTPStatus.NOT_MODIFIED)
+            response.etag = etag.value
+            response.last_modified = cached[1]
+            return response
+    return None
+
+
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
@@ -27,12 +72,15 @@ class CachingStaticResource(StaticResource):
         """Wrap base handler to cache file path resolution and content type guess."""
         rel_url = request.match_info["filename"]
         key = (rel_url, self._directory)
-        response: StreamResponse
+        response: StreamResponse | None
 
         if key in RESPONSE_CACHE:
             file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
+            if (response := _not_modified_response(request, file_path)) is None:
+                response = _ETagCachingFileResponse(
+                    file_path, chunk_size=self._chunk_size
+                )
+                response.headers[CONTENT_TYPE] = content_type
         else:
             response = await super()._handle(request)
             if not isinstance(response, FileResponse):
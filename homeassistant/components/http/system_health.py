@@ -0,0 +1,49 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .request_stats import KEY_REQUEST_STATS, RouteStats
+
+SLOWEST_ROUTES = 3
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+def _p95_sort_key(route_stats: RouteStats) -> float:
+    """Return the 95th latency percentile, slower than any bucket if unbounded."""
+    if (latency := route_stats.latency_percentile(95)) is None:
+        return float("inf")
+    return latency
+
+
+def _format_p95(route_stats: RouteStats) -> str:
+    """Format the 95th latency percentile of a route."""
+    if (latency := route_stats.latency_percentile(95)) is None:
+        return f"> {route_stats.max_latency * 1000:g} ms"
+    return f"<= {latency * 1000:g} ms"
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    routes = hass.http.app[KEY_REQUEST_STATS].routes
+    handled = [(name, stats) for name, stats in routes.items() if stats.requests]
+    handled.sort(key=lambda item: _p95_sort_key(item[1]), reverse=True)
+
+    return {
+        "requests": sum(stats.requests for stats in routes.values()),
+        "requests_in_flight": sum(stats.in_flight for stats in routes.values()),
+        "slowest_routes": ", ".join(
+            f"{name} ({_format_p95(stats)})" for name, stats in handled[:SLOWEST_ROUTES]
+        ),
+    }
@@ -255,7 +255,7 @@ class ImageEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             self._cached_image = image
             self._attr_content_type = image.content_type
             return image.content
-        return await self.hass.async_add_executor_job(self.image)
+        return await self.hass.async_add_priority_executor_job(self.image)
 
     @property
     @final
@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 from typing import Any
 
@@ -14,11 +15,16 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.websocket_api import ActiveConnection, messages
+from homeassistant.components.websocket_api.stream_hub import (
+    LiveStreamSubscriber,
+    async_get_live_stream_hub,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.event_type import EventType
 
 from .const import DOMAIN
 from .helpers import (
@@ -43,10 +49,8 @@ _LOGGER = logging.getLogger(__name__)
 class LogbookLiveStream:
     """Track a logbook live stream."""
 
-    stream_queue: asyncio.Queue[Event]
-    subscriptions: list[CALLBACK_TYPE]
+    subscriber: LiveStreamSubscriber | None = None
     end_time_unsub: CALLBACK_TYPE | None = None
-    task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
 
 
@@ -163,7 +167,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -206,42 +210,37 @@ def _ws_stream_get_events(
     return json_bytes(messages.event_message(msg_id, message)), last_time
 
 
-async def _async_events_consumer(
-    subscriptions_setup_complete_time: dt,
-    connection: ActiveConnection,
-    msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    event_processor: EventProcessor,
-) -> None:
-    """Stream events from the queue."""
-    subscriptions_setup_complete_timestamp = (
-        subscriptions_setup_complete_time.timestamp()
+@callback
+def _async_live_event_processor(
+    hass: HomeAssistant,
+    event_types: tuple[EventType[Any] | str, ...],
+    entity_ids: list[str] | None,
+    device_ids: list[str] | None,
+) -> Callable[[list[Event]], dict[str, Any] | None]:
+    """Return a function that converts live events to a stream message.
+
+    The processor is shared by all subscribers of the same live
+    stream, so it starts out in live mode and never memoizes contexts.
+    """
+    event_processor = EventProcessor(
+        hass,
+        event_types,
+        entity_ids,
+        device_ids,
+        None,
+        timestamp=True,
+        include_entity_name=False,
     )
-    while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
+    event_processor.switch_to_live()
 
+    def _process(events: list[Event]) -> dict[str, Any] | None:
         if logbook_events := event_processor.humanify(
             async_event_to_row(e) for e in events
         ):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"events": logbook_events},
-                    )
-                )
-            )
+            return {"events": logbook_events}
+        return None
+
+    return _process
 
 
 @websocket_api.websocket_command(
@@ -315,20 +314,14 @@ async def ws_event_stream(
         )
         return
 
-    subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
-    live_stream = LogbookLiveStream(
-        subscriptions=subscriptions, stream_queue=stream_queue
-    )
+    live_stream = LogbookLiveStream()
 
     @callback
     def _unsub(*time: Any) -> None:
         """Unsubscribe from all events."""
-        for subscription in subscriptions:
-            subscription()
-        subscriptions.clear()
-        if live_stream.task:
-            live_stream.task.cancel()
+        if live_stream.subscriber:
+            live_stream.subscriber.async_unsubscribe()
+            live_stream.subscriber = None
         if live_stream.wait_sync_task:
             live_stream.wait_sync_task.cancel()
         if live_stream.end_time_unsub:
@@ -340,33 +333,41 @@ async def ws_event_stream(
             hass, _unsub, end_time
         )
 
-    @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            _LOGGER.debug(
-                "Client exceeded max pending messages of %s",
-                MAX_PENDING_LOGBOOK_EVENTS,
-            )
-            _unsub()
-
     entities_filter: Callable[[str], bool] | None = None
     if not event_processor.limited_select:
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         entities_filter = logbook_config.entity_filter
 
-    async_subscribe_events(
-        hass,
-        subscriptions,
-        _queue_or_cancel,
-        event_types,
-        entities_filter,
-        entity_ids,
-        device_ids,
+    # Identical live streams share one set of listeners and
+    # each event is only converted and serialized once. The event
+    # types depend on the registries at the time of subscribing,
+    # so they are part of the key
+    subscriber = live_stream.subscriber = async_get_live_stream_hub(
+        hass
+    ).async_subscribe(
+        (
+            DOMAIN,
+            tuple(sorted(entity_ids)) if entity_ids else None,
+            tuple(sorted(device_ids)) if device_ids else None,
+            frozenset(event_types),
+            entities_filter,
+        ),
+        partial(
+            async_subscribe_events,
+            hass,
+            event_types=event_types,
+            entities_filter=entities_filter,
+            entity_ids=entity_ids,
+            device_ids=device_ids,
+        ),
+        partial(_async_live_event_processor, hass, event_types, entity_ids, device_ids),
+        connection,
+        msg_id,
+        _unsub,
+        coalesce_time=EVENT_COALESCE_TIME,
+        max_pending=MAX_PENDING_LOGBOOK_EVENTS,
     )
-    subscriptions_setup_complete_time = dt_util.utcnow()
+    subscriptions_setup_complete_time = subscriber.setup_complete_time
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
     # Fetch everything from history
@@ -389,15 +390,7 @@ async def ws_event_stream(
         # Unsubscribe happened while sending historical events
         return
 
-    live_stream.task = create_eager_task(
-        _async_events_consumer(
-            subscriptions_setup_complete_time,
-            connection,
-            msg_id,
-            stream_queue,
-            event_processor,
-        )
-    )
+    subscriber.async_go_live()
 
     live_stream.wait_sync_task = create_eager_task(
         get_instance(hass).async_block_till_done()
@@ -501,7 +494,7 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -58,16 +58,21 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_DB_READ_WORKERS = 4
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
+CONF_DB_READ_WORKERS = "db_read_workers"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_SPILL_BACKLOG = "spill_backlog"
+CONF_COMMIT_LATENCY_TARGET = "commit_latency_target"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -108,6 +113,10 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_WORKERS): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=16)
+                    ),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -120,6 +129,10 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SPILL_BACKLOG, default=False): cv.boolean,
+                    vol.Optional(CONF_COMMIT_LATENCY_TARGET): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, min_included=False)
+                    ),
                 }
             ),
         )
@@ -152,6 +165,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    db_read_url = conf.get(CONF_DB_READ_URL)
+    db_read_workers = conf.get(
+        CONF_DB_READ_WORKERS, DEFAULT_DB_READ_WORKERS if db_read_url else 0
+    )
     exclude = conf[CONF_EXCLUDE]
     exclude_event_types: set[EventType[Any] | str] = set(
         exclude.get(CONF_EVENT_TYPES, [])
@@ -170,6 +187,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        spill_backlog=conf[CONF_SPILL_BACKLOG],
+        commit_latency_target=conf.get(CONF_COMMIT_LATENCY_TARGET),
+        db_read_url=db_read_url,
+        db_read_workers=db_read_workers,
     )
     get_instance.cache_clear()
     instance.async_initialize()
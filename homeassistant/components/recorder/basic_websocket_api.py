@@ -30,6 +30,7 @@ def ws_info(
     """Return status of the recorder."""
     if instance := get_instance(hass):
         backlog = instance.backlog
+        attributes_cache = instance.state_attributes_manager.as_dict()
         migration_in_progress = instance.migration_in_progress
         migration_is_live = instance.migration_is_live
         recording = instance.recording
@@ -37,20 +38,28 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        spill = instance.spill_info
+        commit = instance.commit_info
     else:
         backlog = None
+        attributes_cache = None
         migration_in_progress = False
         migration_is_live = False
         recording = False
         is_running = False
         max_backlog = None
+        spill = None
+        commit = None
 
     recorder_info = {
+        "attributes_cache": attributes_cache,
         "backlog": backlog,
+        "commit": commit,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
         "recording": recording,
+        "spill": spill,
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
@@ -0,0 +1,65 @@
+"""A bloom filter of integer hashes."""
+
+from __future__ import annotations
+
+# Bits per expected item; with 4 probes this gives a false positive
+# rate of roughly 0.2% until the filter reaches its capacity
+BITS_PER_ITEM = 10
+NUM_PROBES = 4
+
+MIN_BITS = 1 << 16
+MAX_BITS = 1 << 27
+
+# Odd constant used to derive the probe step from the hash
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+class HashBloomFilter:
+    """A bloom filter for hashes that are already well distributed.
+
+    The recorder content-addresses rows with fnv1a_32 hashes so
+    there is no need to hash the items again; the probes are derived
+    from the hash with double hashing.
+    """
+
+    __slots__ = ("_bits", "_mask", "capacity", "count")
+
+    def __init__(self, expected_items: int) -> None:
+        """Initialize a filter sized for twice the expected items."""
+        wanted = max(expected_items, 1) * 2 * BITS_PER_ITEM
+        num_bits = MIN_BITS
+        while num_bits < wanted and num_bits < MAX_BITS:
+            num_bits <<= 1
+        self._mask = num_bits - 1
+        self._bits = bytearray(num_bits >> 3)
+        self.capacity = num_bits // BITS_PER_ITEM
+        self.count = 0
+
+    def _probes(self, item: int) -> list[int]:
+        """Return the bit positions for an item."""
+        step = (((item * _GOLDEN) & _MASK_64) >> 32) | 1
+        mask = self._mask
+        return [(item + i * step) & mask for i in range(NUM_PROBES)]
+
+    def add(self, item: int) -> None:
+        """Add an item to the filter."""
+        bits = self._bits
+        for bit in self._probes(item):
+            bits[bit >> 3] |= 1 << (bit & 7)
+        self.count += 1
+
+    def __contains__(self, item: int) -> bool:
+        """Return False if the item was definitely never added."""
+        bits = self._bits
+        return all(bits[bit >> 3] & (1 << (bit & 7)) for bit in self._probes(item))
+
+    @property
+    def is_full(self) -> bool:
+        """Return if the false positive rate exceeds the design rate."""
+        return self.count > self.capacity
+
+    @property
+    def can_grow(self) -> bool:
+        """Return if a filter for more items would have more bits."""
+        return self._mask + 1 < MAX_BITS
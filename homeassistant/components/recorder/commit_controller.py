@@ -0,0 +1,144 @@
+"""Size recorder transactions from the measured commit latency.
+
+With a fixed commit interval the size of each transaction depends only
+on how many events arrive in that interval. Under bursty load this
+either produces many small commits that are bound by fsync (SQLite) or
+very large commits that hold locks for a long time (MariaDB/PostgreSQL).
+
+The controller tracks how long commits take and adjusts the maximum
+number of events in a transaction so commits stay close to the
+configured latency target. When commits are slower than the target and
+there is little pending work, timed commits are deferred so more events
+share the cost of a single commit.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import time
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+# Bounds for the number of events in a single transaction
+MIN_TRANSACTION_SIZE = 50
+MAX_TRANSACTION_SIZE = 20000
+INITIAL_TRANSACTION_SIZE = 1000
+
+# Never defer a commit for longer than this many commit intervals
+MAX_DEFERRED_INTERVALS = 5
+
+# Weight of the newest sample in the moving average of commit latency
+LATENCY_SMOOTHING = 0.3
+
+DECISION_GROW = "grow"
+DECISION_SHRINK = "shrink"
+DECISION_HOLD = "hold"
+
+
+class CommitController:
+    """Adapt the recorder transaction size to the commit latency.
+
+    record_event and record_commit are called from the recorder thread,
+    should_commit is called from the event loop.
+    """
+
+    def __init__(self, commit_interval: int, latency_target: float) -> None:
+        """Initialize the controller."""
+        self.commit_interval = commit_interval
+        self.latency_target = latency_target
+        self.transaction_size = INITIAL_TRANSACTION_SIZE
+        self.pending_events = 0
+        self.commits = 0
+        self.early_commits = 0
+        self.deferred_commits = 0
+        self.last_commit_size = 0
+        self.last_commit_latency: float | None = None
+        self.average_commit_latency: float | None = None
+        self.last_decision: str | None = None
+        self.last_commit: datetime | None = None
+        self._last_commit_monotonic = time.monotonic()
+
+    def record_event(self) -> bool:
+        """Record an event added to the session.
+
+        Returns True if the transaction is full and should be
+        committed now instead of waiting for the next interval.
+        """
+        self.pending_events += 1
+        if self.pending_events >= self.transaction_size:
+            self.early_commits += 1
+            return True
+        return False
+
+    def record_commit(self, latency: float, backlog: int) -> None:
+        """Record a commit and resize the next transactions."""
+        events = self.pending_events
+        self.pending_events = 0
+        self.commits += 1
+        self.last_commit_size = events
+        self.last_commit_latency = latency
+        self.last_commit = dt_util.utcnow()
+        self._last_commit_monotonic = time.monotonic()
+        if self.average_commit_latency is None:
+            self.average_commit_latency = latency
+        else:
+            self.average_commit_latency += LATENCY_SMOOTHING * (
+                latency - self.average_commit_latency
+            )
+        if not events:
+            return
+
+        if latency > self.latency_target:
+            if events >= self.transaction_size // 2:
+                # Large commits hold locks for too long, make them smaller
+                self.transaction_size = max(
+                    MIN_TRANSACTION_SIZE, self.transaction_size // 2
+                )
+                self.last_decision = DECISION_SHRINK
+            else:
+                # Small commits are slow so the fixed cost of the commit
+                # dominates; should_commit defers timed commits instead
+                self.last_decision = DECISION_HOLD
+        elif latency < self.latency_target / 2 and (
+            events >= self.transaction_size or backlog > self.transaction_size
+        ):
+            # There is more work than fits in a transaction and
+            # commits are cheap, allow larger transactions
+            self.transaction_size = min(MAX_TRANSACTION_SIZE, self.transaction_size * 2)
+            self.last_decision = DECISION_GROW
+        else:
+            self.last_decision = DECISION_HOLD
+
+    def should_commit(self, backlog: int) -> bool:
+        """Return if a timed commit should run now."""
+        average = self.average_commit_latency
+        if (
+            average is None
+            or average <= self.latency_target
+            or backlog >= self.transaction_size
+            or self.pending_events >= self.transaction_size // 2
+            or time.monotonic() - self._last_commit_monotonic
+            >= self.commit_interval * MAX_DEFERRED_INTERVALS
+        ):
+            return True
+        # Commits are slow (usually fsync bound) and there is little
+        # pending work; let more events share the next commit
+        self.deferred_commits += 1
+        return False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the controller statistics."""
+        return {
+            "latency_target": self.latency_target,
+            "transaction_size": self.transaction_size,
+            "pending_events": self.pending_events,
+            "commits": self.commits,
+            "early_commits": self.early_commits,
+            "deferred_commits": self.deferred_commits,
+            "last_commit_size": self.last_commit_size,
+            "last_commit_latency": self.last_commit_latency,
+            "average_commit_latency": self.average_commit_latency,
+            "last_decision": self.last_decision,
+            "last_commit": self.last_commit,
+        }
@@ -44,13 +44,16 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .commit_controller import CommitController
 from .const import (
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
@@ -80,6 +83,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .spill import SPILL_DIR, SPILL_DRAIN_BACKLOG, RecorderSpill
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -95,8 +99,10 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    DrainSpillTask,
     ImportStatisticsTask,
     KeepAliveTask,
+    LoadStateAttributesHashesTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
@@ -116,6 +122,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -134,6 +141,7 @@ COMMIT_TASK = CommitTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
+DRAIN_SPILL_TASK = DrainSpillTask()
 
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
@@ -164,6 +172,10 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        spill_backlog: bool = False,
+        commit_latency_target: float | None = None,
+        db_read_url: str | None = None,
+        db_read_workers: int = 0,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -171,6 +183,7 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.thread_id: int | None = None
         self.recorder_and_worker_thread_ids: set[int] = set()
+        self.read_worker_thread_ids: set[int] = set()
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
@@ -181,6 +194,8 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_url = db_read_url
+        self.db_read_workers = db_read_workers
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -191,8 +206,21 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
+        # When enabled, events that would exceed the max backlog
+        # are written to disk instead of being dropped.
+        self._spill: RecorderSpill | None = None
+        if spill_backlog:
+            self._spill = RecorderSpill(hass, hass.config.path(STORAGE_DIR, SPILL_DIR))
+        # When a latency target is set, the size of each transaction
+        # adapts to the measured commit latency.
+        self._commit_controller: CommitController | None = None
+        if commit_interval and commit_latency_target:
+            self._commit_controller = CommitController(
+                commit_interval, commit_latency_target
+            )
 
         # The entity_filter is exposed on the recorder instance so that
         # it can be used to see if an entity is being recorded and is called
@@ -214,12 +242,14 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._read_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -239,6 +269,18 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def spill_info(self) -> dict[str, Any] | None:
+        """Return statistics about events spilled to disk."""
+        return self._spill.as_dict() if self._spill else None
+
+    @property
+    def commit_info(self) -> dict[str, Any] | None:
+        """Return statistics about the adaptive commit controller."""
+        if self._commit_controller is None:
+            return None
+        return self._commit_controller.as_dict()
+
     @cached_property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -257,7 +299,15 @@ class Recorder(threading.Thread):
         return self._event_listener is not None
 
     def get_session(self) -> Session:
-        """Get a new sqlalchemy session."""
+        """Get a new sqlalchemy session.
+
+        Sessions created in a read worker use the read engine.
+        """
+        if (
+            self._get_read_session is not None
+            and threading.get_ident() in self.read_worker_thread_ids
+        ):
+            return self._get_read_session()
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
@@ -279,18 +329,34 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self.db_read_workers:
+            self._read_executor = DBInterruptibleThreadPoolExecutor(
+                self.read_worker_thread_ids,
+                thread_name_prefix=DB_READ_WORKER_PREFIX,
+                max_workers=self.db_read_workers,
+                shutdown_hook=self._shutdown_read_pool,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    def _shutdown_read_pool(self) -> None:
+        """Close the read pool connections in the current thread."""
+        if self.read_engine and hasattr(self.read_engine.pool, "shutdown"):
+            self.read_engine.pool.shutdown()
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put = (
+            self._queue.put_nowait
+            if self._spill is None
+            else self._async_queue_or_spill_event
+        )
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -330,6 +396,16 @@ class Recorder(threading.Thread):
             name="Recorder queue watcher",
         )
 
+    @callback
+    def _async_queue_or_spill_event(self, event: Event) -> None:
+        """Put an event in the queue, or on disk if we are spilling."""
+        if TYPE_CHECKING:
+            assert self._spill is not None
+        if self._spill.active:
+            self._spill.async_put(event)
+        else:
+            self._queue.put_nowait(event)
+
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
         """Queue a keep alive."""
@@ -343,6 +419,10 @@ class Recorder(threading.Thread):
             self._event_listener
             and not self._database_lock_task
             and self._event_session_has_pending_writes
+            and (
+                self._commit_controller is None
+                or self._commit_controller.should_commit(self.backlog)
+            )
         ):
             self.queue_task(COMMIT_TASK)
 
@@ -353,6 +433,19 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read-only job to the read executor from within the event loop.
+
+        Read jobs run in parallel with each other and with the recorder
+        thread. If there is no read pool, the db executor is used instead.
+        """
+        if self._read_executor is None or self._get_read_session is None:
+            return self.async_add_executor_job(target, *args)
+        return self.hass.loop.run_in_executor(self._read_executor, target, *args)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -360,8 +453,23 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
+        if (spill := self._spill) is not None and spill.active:
+            if not spill.draining and self.backlog < SPILL_DRAIN_BACKLOG:
+                _LOGGER.info("Recorder caught up; replaying events spilled to disk")
+                spill.draining = True
+                spill.async_flush()
+                self.queue_task(DRAIN_SPILL_TASK)
+            return
         if not self._reached_max_backlog():
             return
+        if spill is not None:
+            _LOGGER.warning(
+                "The recorder backlog queue reached the maximum size of %s events; "
+                "new events will be written to disk until the recorder catches up",
+                self.backlog,
+            )
+            spill.async_start()
+            return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
@@ -440,6 +548,11 @@ class Recorder(threading.Thread):
             self._hass_started.set_result(SHUTDOWN_TASK)
         self.queue_task(StopTask())
         self._async_stop_listeners()
+        if (spill := self._spill) is not None and spill.active:
+            # Keep the spilled events on disk so they can be
+            # replayed after the next start
+            spill.async_flush()
+            await spill.async_wait_for_writes()
         await self.hass.async_add_executor_job(self.join)
 
     @callback
@@ -821,6 +934,12 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        if self._spill is not None:
+            # Events spilled by a previous run are older
+            # than anything in the queue
+            for segment in self._spill.leftover_segments():
+                for event in self._spill.read_segment(segment):
+                    self._guarded_process_one_task_or_event_or_recover(event)
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
@@ -1023,6 +1142,37 @@ class Recorder(threading.Thread):
             self.backlog,
         )
 
+    def _drain_spill_segment(self) -> None:
+        """Replay the oldest segment of events spilled to disk."""
+        if TYPE_CHECKING:
+            assert self._spill is not None
+        if (events := self._spill.pop_segment()) is None:
+            self.hass.add_job(self._async_finish_spill_drain)
+            return
+        start = time.monotonic()
+        for event in events:
+            self._guarded_process_one_task_or_event_or_recover(event)
+        self._spill.record_drain(len(events), time.monotonic() - start)
+        # Requeue so other tasks and commits can run between segments
+        self.queue_task(DRAIN_SPILL_TASK)
+
+    async def _async_finish_spill_drain(self) -> None:
+        """Stop spilling once every spilled event has been replayed."""
+        if TYPE_CHECKING:
+            assert self._spill is not None
+        spill = self._spill
+        spill.async_flush()
+        await spill.async_wait_for_writes()
+        if spill.has_segments:
+            self.queue_task(DRAIN_SPILL_TASK)
+            return
+        # Events that arrived while waiting for the last write
+        # are newer than everything replayed so far
+        for event in spill.async_take_buffer():
+            self._queue.put_nowait(event)
+        spill.async_stop()
+        _LOGGER.info("Finished replaying recorder events spilled to disk")
+
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
@@ -1031,7 +1181,11 @@ class Recorder(threading.Thread):
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
-        if not self.commit_interval:
+        # or the transaction reached its adaptive size
+        if not self.commit_interval or (
+            self._commit_controller is not None
+            and self._commit_controller.record_event()
+        ):
             self._commit_event_session_or_retry()
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
@@ -1142,17 +1296,19 @@ class Recorder(threading.Thread):
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
         # Matching attributes id found in the cache
+        elif attributes_id := state_attributes_manager.get_from_cache(shared_attrs):
+            dbstate.attributes_id = attributes_id
+        # Matching attributes are already being looked up
         elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
-            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
-            and (
-                attributes_id := state_attributes_manager.get(
-                    shared_attrs, hash_, session
-                )
-            )
+            deferred := state_attributes_manager.get_deferred(shared_attrs)
+        ) is not None:
+            deferred.append(dbstate)
+        # Attributes that may be in the database are looked up
+        # together for all states at the next commit
+        elif state_attributes_manager.may_exist(
+            hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
         ):
-            dbstate.attributes_id = attributes_id
+            state_attributes_manager.add_deferred(shared_attrs, hash_, dbstate)
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
@@ -1203,10 +1359,24 @@ class Recorder(threading.Thread):
             else:
                 return
 
+    def _resolve_deferred_state_attributes(self, session: Session) -> None:
+        """Link states to the attributes that were looked up at commit time."""
+        state_attributes_manager = self.state_attributes_manager
+        for shared_attrs, hash_, dbstates in state_attributes_manager.resolve_deferred(
+            session
+        ):
+            # No matching attributes found, save them in the DB
+            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            state_attributes_manager.add_pending(dbstate_attributes)
+            self._add_to_session(session, dbstate_attributes)
+            for dbstate in dbstates:
+                dbstate.state_attributes = dbstate_attributes
+
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        self._resolve_deferred_state_attributes(session)
 
         if (
             pending_last_reported
@@ -1223,7 +1393,12 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        start = time.monotonic()
         session.commit()
+        if self._commit_controller is not None:
+            self._commit_controller.record_commit(
+                time.monotonic() - start, self.backlog
+            )
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1232,6 +1407,9 @@ class Recorder(threading.Thread):
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
+        if self.state_attributes_manager.rebuild_known_hashes:
+            self.state_attributes_manager.rebuild_known_hashes = False
+            self.queue_task(LoadStateAttributesHashesTask())
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
@@ -1427,6 +1605,68 @@ class Recorder(threading.Thread):
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
+        if self.db_read_workers:
+            self._setup_read_connection()
+
+    def _setup_read_connection(self) -> None:
+        """Create the engine used by the read workers.
+
+        The read engine connects to the replica if one is configured,
+        otherwise to the main database with read-only connections.
+        """
+        read_url = self.db_read_url or self.db_url
+        kwargs: dict[str, Any] = {}
+        if read_url == SQLITE_URL_PREFIX or ":memory:" in read_url:
+            _LOGGER.warning(
+                "A read pool is not supported for in-memory SQLite databases; "
+                "history and statistics will be read by the database executor"
+            )
+            return
+        if read_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["poolclass"] = RecorderPool
+            kwargs["recorder_and_worker_thread_ids"] = self.read_worker_thread_ids
+        else:
+            kwargs["echo"] = False
+            if read_url.startswith(
+                (
+                    MARIADB_URL_PREFIX,
+                    MARIADB_PYMYSQL_URL_PREFIX,
+                    MYSQLDB_URL_PREFIX,
+                    MYSQLDB_PYMYSQL_URL_PREFIX,
+                )
+            ):
+                kwargs["connect_args"] = {"charset": "utf8mb4"}
+                if read_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+                    with contextlib.suppress(ImportError):
+                        kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+
+        read_engine = create_engine(read_url, **kwargs, future=True)
+        if read_engine.dialect.name != self.dialect_name:
+            _LOGGER.error(
+                "The read database uses %s but the recorder database uses %s; "
+                "the read database will not be used",
+                read_engine.dialect.name,
+                self.dialect_name,
+            )
+            read_engine.dispose()
+            return
+        sqlalchemy_event.listen(read_engine, "connect", self._setup_read_db_connection)
+        self.read_engine = read_engine
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=read_engine, future=True)
+        )
+        _LOGGER.debug(
+            "Connected to recorder read database with %s workers", self.db_read_workers
+        )
+
+    def _setup_read_db_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for read connections."""
+        assert self.read_engine is not None
+        setup_read_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection
+        )
 
     def _close_connection(self) -> None:
         """Close the connection."""
@@ -1434,6 +1674,10 @@ class Recorder(threading.Thread):
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        self._get_read_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1443,6 +1687,7 @@ class Recorder(threading.Thread):
             self.states_manager.load_from_db(session)
 
         self._open_event_session()
+        self.queue_task(LoadStateAttributesHashesTask())
 
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
@@ -1480,13 +1725,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
-                # We shutdown the executor without forcefully
-                # joining the threads until after we have tried
-                # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+            executors = [
+                executor
+                for executor in (self._db_executor, self._read_executor)
+                if executor
+            ]
+            # We shutdown the executors without forcefully
+            # joining the threads until after we have tried
+            # to cleanly close the connection.
+            for executor in executors:
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
-                # After the connection is closed, we can join the threads
-                # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+            # After the connection is closed, we can join the threads
+            # or forcefully shutdown the threads if they take too long.
+            for executor in executors:
+                executor.join_threads_or_timeout()
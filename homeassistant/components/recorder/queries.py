@@ -44,6 +44,16 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def select_state_attributes_count() -> Select:
+    """Count the rows in the state attributes table."""
+    return select(func.count(StateAttributes.attributes_id))
+
+
+def select_state_attributes_hashes() -> Select:
+    """Select the hash of every row in the state attributes table."""
+    return select(StateAttributes.hash)
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
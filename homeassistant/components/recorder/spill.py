@@ -0,0 +1,360 @@
+"""Spill recorder events to disk when the backlog grows too large.
+
+When the database is unavailable or slow for a long time (e.g. a long
+MariaDB outage or a migration) the in-memory queue keeps growing until
+the recorder stops recording to avoid running out of memory. With the
+spill enabled, new events are written to append-only segment files
+instead, and replayed in order once the recorder has caught up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import datetime
+import logging
+import os
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Context,
+    Event,
+    EventOrigin,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads_object
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+SPILL_DIR = "recorder_spill"
+SPILL_SEGMENT_SUFFIX = ".jsonl"
+
+# Maximum number of events held in memory before they are written to a segment
+SPILL_BATCH_SIZE = 1000
+
+# Once spilling, the spilled events are replayed when the
+# in-memory backlog has dropped below this many events
+SPILL_DRAIN_BACKLOG = 1000
+
+_ORIGINS = {origin.idx: origin for origin in EventOrigin}
+
+
+def _context_to_spill(context: Context) -> list[str | None]:
+    """Convert a context to its spilled form."""
+    return [context.id, context.user_id, context.parent_id]
+
+
+def _context_from_spill(data: list[str | None]) -> Context:
+    """Convert a spilled context to a Context."""
+    return Context(id=data[0], user_id=data[1], parent_id=data[2])
+
+
+def _state_to_spill(state: State | None) -> list[Any] | None:
+    """Convert a state to its spilled form."""
+    if state is None:
+        return None
+    unrecorded = (
+        sorted(state_info["unrecorded_attributes"])
+        if (state_info := state.state_info)
+        else None
+    )
+    return [
+        state.entity_id,
+        state.state,
+        state.attributes,
+        state.last_changed_timestamp,
+        state.last_updated_timestamp,
+        state.last_reported_timestamp,
+        _context_to_spill(state.context),
+        unrecorded,
+    ]
+
+
+def _state_from_spill(data: list[Any] | None) -> State | None:
+    """Convert a spilled state to a State."""
+    if data is None:
+        return None
+    (
+        entity_id,
+        state,
+        attributes,
+        last_changed_ts,
+        last_updated_ts,
+        last_reported_ts,
+        context,
+        unrecorded,
+    ) = data
+    state_info: StateInfo | None = None
+    if unrecorded is not None:
+        state_info = {"unrecorded_attributes": frozenset(unrecorded)}
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+        last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+        last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+        context=_context_from_spill(context),
+        validate_entity_id=False,
+        state_info=state_info,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+def event_to_spill_bytes(event: Event[Any]) -> bytes:
+    """Serialize an event to a single line of the spill log."""
+    if event.event_type == EVENT_STATE_CHANGED:
+        data: dict[str, Any] = {
+            "entity_id": event.data["entity_id"],
+            "old_state": _state_to_spill(event.data["old_state"]),
+            "new_state": _state_to_spill(event.data["new_state"]),
+        }
+    else:
+        data = event.data
+    return json_bytes(
+        {
+            "t": event.event_type,
+            "d": data,
+            "o": event.origin.idx,
+            "f": event.time_fired_timestamp,
+            "c": _context_to_spill(event.context),
+        }
+    )
+
+
+def event_from_spill_bytes(line: bytes) -> Event[Any]:
+    """Deserialize a line of the spill log to an event."""
+    spilled = json_loads_object(line)
+    event_type: str = spilled["t"]  # type: ignore[assignment]
+    data: dict[str, Any] = spilled["d"]  # type: ignore[assignment]
+    if event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _state_from_spill(data["old_state"]),
+            "new_state": _state_from_spill(data["new_state"]),
+        }
+    return Event(
+        event_type,
+        data,
+        _ORIGINS[spilled["o"]],  # type: ignore[index]
+        spilled["f"],  # type: ignore[arg-type]
+        _context_from_spill(spilled["c"]),  # type: ignore[arg-type]
+    )
+
+
+class RecorderSpill:
+    """Write events that do not fit in the recorder queue to disk.
+
+    Events are buffered in memory on the event loop and written in
+    batches from the executor. Each batch becomes one segment file
+    that the recorder thread reads back, in order, when draining.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the spill."""
+        self.hass = hass
+        self.path = Path(path)
+        self.active = False
+        self.draining = False
+        self._buffer: list[Event[Any]] = []
+        self._run_prefix = f"{time.time_ns():020d}"
+        self._next_segment = 0
+        # Segments that have been completely written and can be drained,
+        # appended from the executor and consumed by the recorder thread
+        self._segments: deque[Path] = deque()
+        self._pending_writes = 0
+        self._write_task: asyncio.Task[None] | None = None
+        self.spilled_events = 0
+        self.drained_events = 0
+        self.dropped_events = 0
+        self.spill_size = 0
+        self.drain_rate: float | None = None
+        self.last_drain: datetime | None = None
+
+    @property
+    def buffered_events(self) -> int:
+        """Return the number of events waiting to be written."""
+        return len(self._buffer)
+
+    @property
+    def has_segments(self) -> bool:
+        """Return if there are segments that are not drained yet."""
+        return bool(self._segments) or self._pending_writes > 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start spilling new events to disk."""
+        self.active = True
+        self.draining = False
+
+    @callback
+    def async_put(self, event: Event[Any]) -> None:
+        """Buffer an event to be written to disk."""
+        self._buffer.append(event)
+        if len(self._buffer) >= SPILL_BATCH_SIZE:
+            self.async_flush()
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the buffered events to a new segment in the executor."""
+        if not self._buffer:
+            return
+        events = self._buffer
+        self._buffer = []
+        segment = self.path.joinpath(
+            f"{self._run_prefix}-{self._next_segment:010d}{SPILL_SEGMENT_SUFFIX}"
+        )
+        self._next_segment += 1
+        self._pending_writes += 1
+        self._write_task = self.hass.async_create_background_task(
+            self._async_write_segment(self._write_task, segment, events),
+            "recorder spill write",
+        )
+
+    async def _async_write_segment(
+        self,
+        previous_write: asyncio.Task[None] | None,
+        segment: Path,
+        events: list[Event[Any]],
+    ) -> None:
+        """Write a segment after the previous one has been written.
+
+        Chaining the writes ensures segments become available
+        to drain in the same order they were flushed.
+        """
+        try:
+            if previous_write:
+                await asyncio.wait((previous_write,))
+            await self.hass.async_add_executor_job(self._write_segment, segment, events)
+        finally:
+            self._pending_writes -= 1
+
+    async def async_wait_for_writes(self) -> None:
+        """Wait for all flushed segments to be written."""
+        if self._write_task:
+            await self._write_task
+
+    @callback
+    def async_take_buffer(self) -> list[Event[Any]]:
+        """Return and clear the events that have not been written yet."""
+        events = self._buffer
+        self._buffer = []
+        return events
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop spilling once everything has been drained."""
+        self.active = False
+        self.draining = False
+
+    def _write_segment(self, segment: Path, events: list[Event[Any]]) -> None:
+        """Write a segment to disk."""
+        lines: list[bytes] = []
+        for event in events:
+            try:
+                lines.append(event_to_spill_bytes(event))
+            except (HomeAssistantError, TypeError, ValueError) as err:
+                _LOGGER.warning(
+                    "Event could not be spilled to disk: %s: %s", event, err
+                )
+                self.dropped_events += 1
+        payload = b"\n".join(lines)
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_segment = segment.with_suffix(".tmp")
+            tmp_segment.write_bytes(payload)
+            os.replace(tmp_segment, segment)
+        except OSError as err:
+            _LOGGER.error(
+                "Could not spill %s recorder events to %s: %s",
+                len(lines),
+                segment,
+                err,
+            )
+            self.dropped_events += len(lines)
+            return
+        self.spilled_events += len(lines)
+        self.spill_size += len(payload)
+        self._segments.append(segment)
+
+    def leftover_segments(self) -> list[Path]:
+        """Return segments left behind by a previous run, oldest first."""
+        try:
+            leftovers = sorted(
+                segment
+                for segment in self.path.glob(f"*{SPILL_SEGMENT_SUFFIX}")
+                if not segment.name.startswith(self._run_prefix)
+            )
+        except OSError:
+            return []
+        if leftovers:
+            _LOGGER.info(
+                "Replaying %s segments of recorder events spilled by a previous run",
+                len(leftovers),
+            )
+        return leftovers
+
+    def pop_segment(self) -> list[Event[Any]] | None:
+        """Read the oldest segment of this run and return its events.
+
+        Returns None if there are no written segments left.
+        This must be called from the recorder thread.
+        """
+        try:
+            segment = self._segments.popleft()
+        except IndexError:
+            return None
+        return self.read_segment(segment)
+
+    def read_segment(self, segment: Path) -> list[Event[Any]]:
+        """Read a segment, remove it and return its events.
+
+        This must be called from the recorder thread.
+        """
+        try:
+            payload = segment.read_bytes()
+            segment.unlink()
+        except OSError as err:
+            _LOGGER.error("Could not read spilled recorder events %s: %s", segment, err)
+            return []
+        self.spill_size = max(self.spill_size - len(payload), 0)
+        events: list[Event[Any]] = []
+        for line in payload.splitlines():
+            try:
+                events.append(event_from_spill_bytes(line))
+            except (*JSON_DECODE_EXCEPTIONS, KeyError, ValueError) as err:
+                _LOGGER.warning("Skipping corrupt spilled recorder event: %s", err)
+                self.dropped_events += 1
+        return events
+
+    def record_drain(self, events: int, elapsed: float) -> None:
+        """Record that a segment was drained."""
+        self.drained_events += events
+        self.drain_rate = events / elapsed if elapsed else None
+        self.last_drain = dt_util.utcnow()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the spill statistics."""
+        return {
+            "active": self.active,
+            "draining": self.draining,
+            "buffered_events": self.buffered_events,
+            "segments": len(self._segments),
+            "spill_size": self.spill_size,
+            "spilled_events": self.spilled_events,
+            "drained_events": self.drained_events,
+            "dropped_events": self.dropped_events,
+            "drain_rate": self.drain_rate,
+            "last_drain": self.last_drain,
+        }
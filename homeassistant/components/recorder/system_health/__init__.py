@@ -55,6 +55,20 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_commit_info(instance: Recorder) -> dict[str, Any]:
+    """Get info about the adaptive commit controller."""
+    commit_info: dict[str, Any] = {}
+    if (stats := instance.commit_info) is None:
+        return commit_info
+    commit_info["commit_transaction_size"] = stats["transaction_size"]
+    if (latency := stats["average_commit_latency"]) is not None:
+        commit_info["commit_latency"] = f"{latency * 1000:.1f} ms"
+    if (decision := stats["last_decision"]) is not None:
+        commit_info["commit_decision"] = decision
+    return commit_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -62,6 +76,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     recorder_runs_manager = instance.recorder_runs_manager
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    commit_info = _async_get_commit_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -72,4 +87,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | commit_info
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Collection, Iterable
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -12,13 +12,19 @@ from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
+from ..bloom_filter import HashBloomFilter
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import (
+    get_shared_attributes,
+    select_state_attributes_count,
+    select_state_attributes_hashes,
+)
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
+    from ..db_schema import States
 
 # The number of attribute ids to cache in memory
 #
@@ -28,6 +34,9 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The number of hashes to fetch at a time when building the bloom filter
+HASH_LOAD_YIELD_PER = 10000
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -37,6 +46,136 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # Hashes of every StateAttributes row in the database. A hash
+        # that is not in the filter is known to be new, so its
+        # attributes can be inserted without looking them up.
+        self._known_hashes: HashBloomFilter | None = None
+        # Lookups of attributes that missed the cache are deferred
+        # and resolved in a single query before the next commit
+        self._deferred: dict[str, tuple[int, list[States]]] = {}
+        self.rebuild_known_hashes = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.known_new = 0
+        self.db_lookups = 0
+        self.db_lookup_hashes = 0
+
+    def reset(self) -> None:
+        """Reset the manager after a database error or recovery."""
+        super().reset()
+        self._known_hashes = None
+        self._deferred.clear()
+
+    def load_known_hashes(self, session: Session) -> None:
+        """Build the bloom filter from the hashes in the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        count: int = session.execute(select_state_attributes_count()).scalar_one()
+        known_hashes = HashBloomFilter(count)
+        for (hash_,) in (
+            session.connection()
+            .execute(select_state_attributes_hashes())
+            .yield_per(HASH_LOAD_YIELD_PER)
+        ):
+            if hash_ is not None:
+                known_hashes.add(hash_)
+        # Attributes that are about to be committed may
+        # not be visible to the query yet
+        for pending in self._pending.values():
+            known_hashes.add(cast(int, pending.hash))
+        if known_hashes.is_full:
+            # The filter has the maximum size and would mostly return false
+            # positives; the attributes are looked up in the database instead
+            _LOGGER.debug(
+                "Not using a filter for %s state attribute hashes", known_hashes.count
+            )
+            self._known_hashes = None
+            return
+        self._known_hashes = known_hashes
+        _LOGGER.debug(
+            "Loaded %s state attribute hashes into a filter with capacity %s",
+            known_hashes.count,
+            known_hashes.capacity,
+        )
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve data to the id without accessing the underlying database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is not None:
+            self.cache_hits += 1
+        return attributes_id
+
+    def get_deferred(self, shared_attrs: str) -> list[States] | None:
+        """Return the states waiting for the lookup of shared_attrs.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if deferred := self._deferred.get(shared_attrs):
+            return deferred[1]
+        return None
+
+    def may_exist(self, data_hash: int) -> bool:
+        """Return if attributes with data_hash may already be in the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.cache_misses += 1
+        if (known_hashes := self._known_hashes) is None or data_hash in known_hashes:
+            return True
+        self.known_new += 1
+        return False
+
+    def add_deferred(self, shared_attrs: str, data_hash: int, dbstate: States) -> None:
+        """Defer looking up the attributes of dbstate until the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._deferred[shared_attrs] = (data_hash, [dbstate])
+
+    def resolve_deferred(self, session: Session) -> list[tuple[str, int, list[States]]]:
+        """Resolve the deferred lookups with a single query.
+
+        Returns the attributes that are not in the database and
+        must be inserted for the states waiting on them.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (deferred := self._deferred):
+            return []
+        self._deferred = {}
+        found = self._load_from_hashes(
+            {data_hash for data_hash, _ in deferred.values()}, session
+        )
+        missing: list[tuple[str, int, list[States]]] = []
+        for shared_attrs, (data_hash, dbstates) in deferred.items():
+            if (attributes_id := found.get(shared_attrs)) is None:
+                missing.append((shared_attrs, data_hash, dbstates))
+                continue
+            for dbstate in dbstates:
+                dbstate.attributes_id = attributes_id
+        return missing
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache statistics."""
+        known_hashes = self._known_hashes
+        return {
+            "cache_size": len(self._id_map),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "known_new": self.known_new,
+            "db_lookups": self.db_lookups,
+            "db_lookup_hashes": self.db_lookup_hashes,
+            "known_hashes": known_hashes.count if known_hashes else None,
+        }
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -105,8 +244,10 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
+        self.db_lookup_hashes += len(hashes)
         with session.no_autoflush:
             for hashs_chunk in chunked_or_all(hashes, self.recorder.max_bind_vars):
+                self.db_lookups += 1
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
                     session, get_shared_attributes(hashs_chunk), orm_rows=False
                 ):
@@ -132,9 +273,18 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        known_hashes = self._known_hashes
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            if known_hashes is not None:
+                known_hashes.add(cast(int, db_state_attributes.hash))
         self._pending.clear()
+        if known_hashes is not None and known_hashes.is_full:
+            # Too many false positives; the recorder rebuilds the filter
+            # with room for more hashes unless it already has the maximum
+            # size, then the attributes are looked up in the database
+            self._known_hashes = None
+            self.rebuild_known_hashes = known_hashes.can_grow
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -326,6 +326,29 @@ class SynchronizeTask(RecorderTask):
         instance.hass.loop.call_soon_threadsafe(self.event.set)
 
 
+@dataclass(slots=True)
+class DrainSpillTask(RecorderTask):
+    """Replay the oldest segment of events spilled to disk."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._drain_spill_segment()  # noqa: SLF001
+
+
+@dataclass(slots=True)
+class LoadStateAttributesHashesTask(RecorderTask):
+    """Build the filter of state attribute hashes in the database."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            instance.state_attributes_manager.load_known_hashes(session)
+
+
 @dataclass(slots=True)
 class AdjustLRUSizeTask(RecorderTask):
     """An object to insert into the recorder queue to adjust the LRU size."""
@@ -570,6 +570,26 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_connection_for_dialect(
+    instance: Recorder,
+    dialect_name: str,
+    dbapi_connection: DBAPIConnection,
+) -> None:
+    """Execute statements needed for a read-only dialect connection."""
+    setup_connection_for_dialect(instance, dialect_name, dbapi_connection, False)
+    if dialect_name == SupportedDialect.SQLITE:
+        # Readers never block the writer in WAL mode; make sure
+        # these connections can never take the write lock.
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection,
+            "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY",
+        )
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -21,7 +21,11 @@ from homeassistant.helpers import discovery
 from homeassistant.helpers.device import (
     async_remove_stale_devices_links_keep_current_device,
 )
-from homeassistant.helpers.reload import async_reload_integration_platforms
+from homeassistant.helpers.reload import (
+    async_get_platform_without_config_entry,
+    async_reload_integration_platforms,
+    async_reload_platforms_in_place,
+)
 from homeassistant.helpers.service import async_register_admin_service
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_integration
@@ -67,10 +71,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if conf is None:
             return
 
-        await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
+        # Platforms are reloaded together with the entities set up from the
+        # template config so unchanged entities of both are kept
+        async with async_reload_platforms_in_place(hass, DOMAIN, PLATFORMS):
+            await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
 
-        if DOMAIN in conf:
-            await _process_config(hass, conf)
+            if DOMAIN in conf:
+                await _process_config(hass, conf, reload=True)
 
         hass.bus.async_fire(f"event_{DOMAIN}_reloaded", context=call.context)
 
@@ -116,8 +123,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
 
-async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
-    """Process config."""
+async def _process_config(
+    hass: HomeAssistant, hass_config: ConfigType, reload: bool = False
+) -> None:
+    """Process config.
+
+    When reloading, platforms which are already loaded are set up directly
+    so the entities are added before the reload finishes.
+    """
     coordinators = hass.data.pop(DATA_COORDINATORS, None)
 
     # Remove old ones
@@ -133,6 +146,7 @@ async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
         return coordinator
 
     coordinator_tasks: list[Coroutine[Any, Any, TriggerUpdateCoordinator]] = []
+    platform_tasks: list[Coroutine[Any, Any, None]] = []
 
     for conf_section in hass_config[DOMAIN]:
         if CONF_TRIGGER in conf_section:
@@ -140,27 +154,35 @@ async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
             continue
 
         for platform_domain in PLATFORMS:
-            if platform_domain in conf_section:
-                hass.async_create_task(
-                    discovery.async_load_platform(
-                        hass,
-                        platform_domain,
-                        DOMAIN,
-                        {
-                            "unique_id": conf_section.get(CONF_UNIQUE_ID),
-                            "entities": [
-                                {
-                                    **entity_conf,
-                                    "raw_blueprint_inputs": conf_section.raw_blueprint_inputs,
-                                    "raw_configs": conf_section.raw_config,
-                                }
-                                for entity_conf in conf_section[platform_domain]
-                            ],
-                        },
-                        hass_config,
-                    ),
-                    eager_start=True,
+            if platform_domain not in conf_section:
+                continue
+            discovery_info = {
+                "unique_id": conf_section.get(CONF_UNIQUE_ID),
+                "entities": [
+                    {
+                        **entity_conf,
+                        "raw_blueprint_inputs": conf_section.raw_blueprint_inputs,
+                        "raw_configs": conf_section.raw_config,
+                    }
+                    for entity_conf in conf_section[platform_domain]
+                ],
+            }
+            if reload and (
+                platform := async_get_platform_without_config_entry(
+                    hass, DOMAIN, platform_domain
                 )
+            ):
+                platform_tasks.append(platform.async_setup({}, discovery_info))
+                continue
+            hass.async_create_task(
+                discovery.async_load_platform(
+                    hass, platform_domain, DOMAIN, discovery_info, hass_config
+                ),
+                eager_start=True,
+            )
 
     if coordinator_tasks:
         hass.data[DATA_COORDINATORS] = await asyncio.gather(*coordinator_tasks)
+
+    if platform_tasks:
+        await asyncio.gather(*platform_tasks)
@@ -301,6 +301,11 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
             self._friendly_name_template = config.get(CONF_NAME)
             self._run_variables = config.get(CONF_VARIABLES, {})
             self._blueprint_inputs = config.get("raw_blueprint_inputs")
+            # The raw config of the whole template section is not used by the
+            # entity and must not cause a reload when other entities change
+            self._reload_config = {
+                key: value for key, value in config.items() if key != "raw_configs"
+            }
 
         class DummyState(State):
             """None-state for template entities not yet added to the state machine."""
@@ -506,7 +506,7 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
 
         Return a tuple of file extension and data as bytes.
         """
-        return await self.hass.async_add_executor_job(
+        return await self.hass.async_add_priority_executor_job(
             partial(self.get_tts_audio, message, language, options=options)
         )
 
@@ -892,7 +892,7 @@ class SpeechManager:
                 return speech.read()
 
         try:
-            data = await self.hass.async_add_executor_job(load_speech)
+            data = await self.hass.async_add_priority_executor_job(load_speech)
         except OSError as err:
             del self.file_cache[cache_key]
             raise HomeAssistantError(f"Can't read {voice_file}") from err
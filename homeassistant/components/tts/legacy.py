@@ -249,6 +249,6 @@ class Provider:
         """
         if TYPE_CHECKING:
             assert self.hass
-        return await self.hass.async_add_executor_job(
+        return await self.hass.async_add_priority_executor_job(
             partial(self.get_tts_audio, message, language, options=options)
         )
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from functools import lru_cache, partial
+import hashlib
 import json
 import logging
-from typing import Any, cast
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
+from homeassistant.components.http.request_stats import KEY_REQUEST_STATS
 from homeassistant.const import (
     EVENT_STATE_CHANGED,
     MATCH_ALL,
@@ -25,6 +28,7 @@ from homeassistant.core import (
     HomeAssistant,
     ServiceResponse,
     State,
+    StateMachine,
     callback,
 )
 from homeassistant.exceptions import (
@@ -52,6 +56,7 @@ from homeassistant.helpers.json import (
     json_bytes,
     json_fragment,
 )
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
@@ -64,6 +69,7 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .http import WebSocketSendStats
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -98,6 +104,10 @@ def async_register_commands(
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
+    async_reg(hass, handle_poll_timeline)
+    async_reg(hass, handle_executor_stats)
+    async_reg(hass, handle_websocket_stats)
+    async_reg(hass, handle_http_stats)
 
 
 def pong_message(iden: int) -> dict[str, Any]:
@@ -374,9 +384,13 @@ def _forward_entity_changes(
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
+    state_machine: StateMachine | None,
     event: Event[EventStateChangedData],
 ) -> None:
-    """Forward entity state changed events to websocket."""
+    """Forward entity state changed events to websocket.
+
+    The change sequence is added to the events when a state machine is passed.
+    """
     entity_id = event.data["entity_id"]
     if (entity_ids and entity_id not in entity_ids) or (
         entity_filter and not entity_filter(entity_id)
@@ -391,7 +405,17 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    if state_machine is None:
+        send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+        return
+    send_message(
+        messages.cached_state_diff_message_with_sequence(
+            message_id_as_bytes,
+            event,
+            state_machine.change_run_id,
+            state_machine.async_change_sequence(),
+        )
+    )
 
 
 @callback
@@ -399,20 +423,57 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("since"): str,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    Clients passing the change sequence token of the last event they
+    received in since only get the states changed and entities removed after
+    it, unless the changes since then are no longer known, e.g. because the
+    token is of a previous run, and all states are sent.
+    """
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    sequence_fields = b""
+    removed_entity_ids: list[str] = []
+    state_machine: StateMachine | None = None
+    if (since := msg.get("since")) is None:
+        states = _async_get_allowed_states(hass, connection)
+    else:
+        state_machine = hass.states
+        changes = None
+        if (parsed := messages.parse_change_sequence_token(since)) is not None:
+            changes = state_machine.async_changes_since(*parsed)
+        if changes is None:
+            states = _async_get_allowed_states(hass, connection)
+        else:
+            states, removed_entity_ids = _async_filter_allowed_changes(
+                connection, entity_ids, entity_filter, *changes
+            )
+        sequence_fields = b"".join(
+            (
+                b',"s":',
+                json_bytes(
+                    messages.change_sequence_token(
+                        state_machine.change_run_id,
+                        state_machine.async_change_sequence(),
+                    )
+                ),
+                b',"f":',
+                b"true" if changes is None else b"false",
+                b',"r":',
+                json_bytes(removed_entity_ids),
+            )
+        )
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
     connection.subscriptions[msg_id] = hass.bus.async_listen(
@@ -424,6 +485,7 @@ def handle_subscribe_entities(
             entity_filter,
             connection.user,
             message_id_as_bytes,
+            state_machine,
         ),
     )
     connection.send_result(msg_id)
@@ -446,7 +508,7 @@ def handle_subscribe_entities(
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection, message_id_as_bytes, serialized_states, sequence_fields
         )
         return
 
@@ -463,14 +525,49 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection, message_id_as_bytes, serialized_states, sequence_fields
     )
 
 
+@callback
+def _async_filter_allowed_changes(
+    connection: ActiveConnection,
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    states: list[State],
+    removed_entity_ids: list[str],
+) -> tuple[list[State], list[str]]:
+    """Return the changed states and removed entities the user may read.
+
+    Removed entities are also filtered here, the changed states are filtered
+    by the entity ids and filter when they are serialized.
+    """
+    user = connection.user
+    if not user.is_admin and not user.permissions.access_all_entities(POLICY_READ):
+        entity_perm = user.permissions.check_entity
+        states = [
+            state for state in states if entity_perm(state.entity_id, POLICY_READ)
+        ]
+        removed_entity_ids = [
+            entity_id
+            for entity_id in removed_entity_ids
+            if entity_perm(entity_id, POLICY_READ)
+        ]
+    if entity_ids or entity_filter:
+        removed_entity_ids = [
+            entity_id
+            for entity_id in removed_entity_ids
+            if (not entity_ids or entity_id in entity_ids)
+            and (not entity_filter or entity_filter(entity_id))
+        ]
+    return states, removed_entity_ids
+
+
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
     serialized_states: list[bytes],
+    sequence_fields: bytes = b"",
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -480,34 +577,126 @@ def _send_handle_entities_init_response(
                 message_id_as_bytes,
                 b',"type":"event","event":{"a":{',
                 b",".join(serialized_states),
-                b"}}}",
+                b"}",
+                sequence_fields,
+                b"}}",
             )
         )
     )
 
 
-async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
-    """Return JSON of descriptions (i.e. user documentation) for all service calls."""
-    descriptions = await async_get_all_descriptions(hass)
-    if ALL_SERVICE_DESCRIPTIONS_JSON_CACHE in hass.data:
-        cached_descriptions, cached_json_payload = hass.data[
-            ALL_SERVICE_DESCRIPTIONS_JSON_CACHE
+@dataclass(slots=True)
+class _ServiceDescriptionsCatalog:
+    """Service descriptions serialized per domain.
+
+    Domains whose descriptions did not change keep their serialized JSON and
+    hash, only changed domains are serialized again.
+    """
+
+    descriptions: dict[str, dict[str, Any]]
+    domain_json: dict[str, bytes]
+    hashes: dict[str, str]
+    version: str
+    payload: bytes
+
+    def delta_payload(self, known_hashes: dict[str, str]) -> bytes:
+        """Return JSON of the domains which differ from the known hashes."""
+        changed = [
+            json_bytes(domain) + b":" + domain_json
+            for domain, domain_json in self.domain_json.items()
+            if known_hashes.get(domain) != self.hashes[domain]
         ]
-        # If the descriptions are the same, return the cached JSON payload
-        if cached_descriptions is descriptions:
-            return cast(bytes, cached_json_payload)
-    json_payload = json_bytes(descriptions)
-    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, json_payload)
-    return json_payload
+        removed = [domain for domain in known_hashes if domain not in self.hashes]
+        return b"".join(
+            (
+                b'{"version":',
+                json_bytes(self.version),
+                b',"hashes":',
+                json_bytes(self.hashes),
+                b',"services":{',
+                b",".join(changed),
+                b'},"removed":',
+                json_bytes(removed),
+                b"}",
+            )
+        )
+
 
+def _domain_unchanged(
+    previous: dict[str, Any] | None, descriptions: dict[str, Any]
+) -> bool:
+    """Return if the descriptions of a domain are the same objects as before."""
+    return (
+        previous is not None
+        and previous.keys() == descriptions.keys()
+        and all(
+            previous[service] is description
+            for service, description in descriptions.items()
+        )
+    )
 
-@decorators.websocket_command({vol.Required("type"): "get_services"})
+
+async def _async_get_service_descriptions_catalog(
+    hass: HomeAssistant,
+) -> _ServiceDescriptionsCatalog:
+    """Return the catalog of descriptions (i.e. user documentation) of services."""
+    descriptions = await async_get_all_descriptions(hass)
+    catalog: _ServiceDescriptionsCatalog | None = hass.data.get(
+        ALL_SERVICE_DESCRIPTIONS_JSON_CACHE
+    )
+    if catalog is not None and catalog.descriptions is descriptions:
+        return catalog
+
+    domain_json: dict[str, bytes] = {}
+    hashes: dict[str, str] = {}
+    for domain, domain_descriptions in descriptions.items():
+        if catalog is not None and _domain_unchanged(
+            catalog.descriptions.get(domain), domain_descriptions
+        ):
+            domain_json[domain] = catalog.domain_json[domain]
+            hashes[domain] = catalog.hashes[domain]
+            continue
+        domain_json[domain] = json_bytes(domain_descriptions)
+        hashes[domain] = hashlib.blake2b(domain_json[domain], digest_size=8).hexdigest()
+
+    catalog = _ServiceDescriptionsCatalog(
+        descriptions,
+        domain_json,
+        hashes,
+        hashlib.blake2b(json_bytes(sorted(hashes.items())), digest_size=8).hexdigest(),
+        b"".join(
+            (
+                b"{",
+                b",".join(
+                    json_bytes(domain) + b":" + json_payload
+                    for domain, json_payload in domain_json.items()
+                ),
+                b"}",
+            )
+        ),
+    )
+    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = catalog
+    return catalog
+
+
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "get_services",
+        # Hashes of the domains the client has cached, only other domains
+        # are returned
+        vol.Optional("hashes"): {str: str},
+    }
+)
 @decorators.async_response
 async def handle_get_services(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get services command."""
-    payload = await _async_get_all_descriptions_json(hass)
+    catalog = await _async_get_service_descriptions_catalog(hass)
+    if (known_hashes := msg.get("hashes")) is None:
+        payload = catalog.payload
+    else:
+        payload = catalog.delta_payload(known_hashes)
     connection.send_message(construct_result_message(msg["id"], payload))
 
 
@@ -923,3 +1112,44 @@ async def handle_integration_descriptions(
 ) -> None:
     """Get metadata for all brands and integrations."""
     connection.send_result(msg["id"], await async_get_integration_descriptions(hass))
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({"type": "poll_scheduler/timeline"})
+def handle_poll_timeline(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Get the upcoming polls of entity platforms and coordinators."""
+    connection.send_result(msg["id"], async_get_poll_scheduler(hass).async_timeline())
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({"type": "executor/stats"})
+def handle_executor_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Get the queue wait and run time of executor jobs per integration."""
+    connection.send_result(msg["id"], hass.executor_admission.as_dict())
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({"type": "websocket/stats"})
+def handle_websocket_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Get the messages and bytes sent to websocket clients."""
+    stats: WebSocketSendStats = hass.data[const.DATA_SEND_STATS]
+    connection.send_result(msg["id"], stats.as_dict())
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({"type": "http/stats"})
+def handle_http_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Get the latency and size of the HTTP responses per route."""
+    connection.send_result(msg["id"], hass.http.app[KEY_REQUEST_STATS].as_dict())
@@ -34,6 +34,10 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Frames smaller than this are sent uncompressed when the client negotiated
+# permessage-deflate, compressing them costs more time than it saves bytes.
+COMPRESS_MIN_FRAME_SIZE: Final = 128
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -56,5 +60,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the bytes sent to all connections
+DATA_SEND_STATS: Final = f"{DOMAIN}.send_stats"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
 import datetime as dt
 from functools import partial
 import logging
@@ -23,7 +24,9 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_MIN_FRAME_SIZE,
     DATA_CONNECTIONS,
+    DATA_SEND_STATS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -57,6 +60,89 @@ class WebsocketAPIView(HomeAssistantView):
         return await WebSocketHandler(request.app[KEY_HASS], request).async_handle()
 
 
+def _message_type(message: bytes) -> bytes:
+    """Return the type of a serialized message."""
+    # The type is always one of the first keys of the messages we send
+    if (start := message.find(b'"type":"', 0, 64)) == -1:
+        return b"unknown"
+    start += 8
+    return message[start : message.find(b'"', start)]
+
+
+@dataclass(slots=True)
+class WebSocketSendStats:
+    """Messages and frames sent to websocket clients.
+
+    Messages are counted per message type with their serialized size. Frames
+    are counted with their size before compression, and the bytes written to
+    the transport for a frame are counted for the type of its first message.
+    """
+
+    messages: dict[bytes, int] = field(default_factory=dict)
+    message_bytes: dict[bytes, int] = field(default_factory=dict)
+    sent_bytes: dict[bytes, int] = field(default_factory=dict)
+    frames: int = 0
+    compressed_frames: int = 0
+    frame_bytes: int = 0
+
+    @callback
+    def async_add_message(self, message: bytes) -> None:
+        """Count a message queued for sending."""
+        message_type = _message_type(message)
+        messages = self.messages
+        messages[message_type] = messages.get(message_type, 0) + 1
+        message_bytes = self.message_bytes
+        message_bytes[message_type] = message_bytes.get(message_type, 0) + len(message)
+
+    @callback
+    def async_add_frame(self, message: bytes, sent_bytes: int) -> None:
+        """Count a frame and the bytes written to the transport for it."""
+        self.frames += 1
+        self.frame_bytes += len(message)
+        message_type = _message_type(message)
+        sent = self.sent_bytes
+        sent[message_type] = sent.get(message_type, 0) + sent_bytes
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dictionary."""
+        return {
+            "messages": {
+                message_type.decode(errors="replace"): {
+                    "count": self.messages.get(message_type, 0),
+                    "bytes": self.message_bytes.get(message_type, 0),
+                    "sent_bytes": self.sent_bytes.get(message_type, 0),
+                }
+                for message_type in self.messages.keys() | self.sent_bytes.keys()
+            },
+            "frames": self.frames,
+            "compressed_frames": self.compressed_frames,
+            "frame_bytes": self.frame_bytes,
+            "sent_bytes": sum(self.sent_bytes.values()),
+        }
+
+
+class _CountingTransport:
+    """Forward writes to a transport and count the bytes written."""
+
+    def __init__(self, transport: asyncio.Transport) -> None:
+        """Initialize the transport."""
+        self._transport = transport
+        self.written = 0
+
+    def write(self, data: bytes) -> None:
+        """Write data to the transport."""
+        self.written += len(data)
+        self._transport.write(data)
+
+    def is_closing(self) -> bool:
+        """Return if the transport is closing."""
+        return self._transport.is_closing()
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything else to the transport."""
+        return getattr(self._transport, name)
+
+
 class WebSocketAdapter(logging.LoggerAdapter):
     """Add connection id to websocket messages."""
 
@@ -82,6 +168,7 @@ class WebSocketHandler:
         "_ready_future",
         "_release_ready_queue_size",
         "_request",
+        "_stats",
         "_writer_task",
         "_wsock",
     )
@@ -99,6 +186,9 @@ class WebSocketHandler:
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
         self._connection: ActiveConnection | None = None
+        if (stats := hass.data.get(DATA_SEND_STATS)) is None:
+            stats = hass.data[DATA_SEND_STATS] = WebSocketSendStats()
+        self._stats: WebSocketSendStats = stats
 
         # The WebSocketHandler has a single consumer and path
         # to where messages are queued. This allows the implementation
@@ -203,6 +293,7 @@ class WebSocketHandler:
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
+        self._stats.async_add_message(message)
         message_queue = self._message_queue
         message_queue.append(message)
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
@@ -330,7 +421,7 @@ class WebSocketHandler:
         if TYPE_CHECKING:
             assert writer is not None
 
-        send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_text = self._make_send_bytes_text(writer)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -369,6 +460,44 @@ class WebSocketHandler:
 
         return wsock
 
+    def _make_send_bytes_text(
+        self, writer: WebSocketWriter
+    ) -> Callable[[bytes], Coroutine[Any, Any, None]]:
+        """Return a function sending text frames and counting them.
+
+        When the client negotiated permessage-deflate, aiohttp compresses
+        every frame with the compression context shared by all frames of the
+        connection. Small frames are sent uncompressed instead, which the
+        extension allows per frame.
+
+        The transport of the writer is wrapped to count the bytes written for
+        each frame after compression. A control frame written while a text
+        frame is being compressed is counted with that frame.
+        """
+        send_frame = writer.send_frame
+        stats = self._stats
+        compress = writer.compress
+        transport = _CountingTransport(writer.transport)
+        writer.transport = transport  # type: ignore[assignment]
+
+        async def send_bytes_text(message: bytes) -> None:
+            """Send a text frame."""
+            written = transport.written
+            if not compress:
+                await send_frame(message, WSMsgType.TEXT)
+            elif len(message) < COMPRESS_MIN_FRAME_SIZE:
+                writer.compress = 0
+                try:
+                    await send_frame(message, WSMsgType.TEXT)
+                finally:
+                    writer.compress = compress
+            else:
+                await send_frame(message, WSMsgType.TEXT)
+                stats.compressed_frames += 1
+            stats.async_add_frame(message, transport.written - written)
+
+        return send_bytes_text
+
     async def _async_handle_auth_phase(
         self,
         auth: AuthPhase,
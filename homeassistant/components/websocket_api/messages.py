@@ -17,6 +17,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CompressedState, Event, EventStateChangedData
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.compiled_schema import CompiledSchema
 from homeassistant.helpers.json import (
     JSON_DUMP,
     find_paths_unserializable_data,
@@ -29,13 +30,15 @@ from . import const
 _LOGGER: Final = logging.getLogger(__name__)
 
 # Minimal requirements of a message
-MINIMAL_MESSAGE_SCHEMA: Final = vol.Schema(
+MINIMAL_MESSAGE_SCHEMA: Final = CompiledSchema(
     {vol.Required("id"): cv.positive_int, vol.Required("type"): cv.string},
     extra=vol.ALLOW_EXTRA,
 )
 
 # Base schema to extend by message handlers
-BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive_int})
+BASE_COMMAND_MESSAGE_SCHEMA: Final = CompiledSchema(
+    {vol.Required("id"): cv.positive_int}
+)
 
 STATE_DIFF_ADDITIONS = "+"
 STATE_DIFF_REMOVALS = "-"
@@ -43,6 +46,8 @@ STATE_DIFF_REMOVALS = "-"
 ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
+ENTITY_EVENT_SEQUENCE = "s"
+ENTITY_EVENT_FULL = "f"
 
 BASE_ERROR_MESSAGE = {
     "type": const.TYPE_RESULT,
@@ -162,6 +167,46 @@ def cached_state_diff_message(
     )
 
 
+def change_sequence_token(run_id: str, sequence: int) -> str:
+    """Return the token of a change sequence which clients pass in since."""
+    return f"{run_id}:{sequence}"
+
+
+def parse_change_sequence_token(token: str) -> tuple[str, int] | None:
+    """Return the run id and change sequence of a token or None if invalid."""
+    run_id, _, sequence = token.partition(":")
+    if not sequence.isdigit():
+        return None
+    return run_id, int(sequence)
+
+
+def cached_state_diff_message_with_sequence(
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    run_id: str,
+    sequence: int,
+) -> bytes:
+    """Return an event message with the change sequence of the state machine.
+
+    The change sequence token is added to the cached serialized event so
+    clients can subscribe again with the changes since the last event they
+    received.
+    """
+    partial_message = _partial_cached_state_diff_message(event)
+    if partial_message is INVALID_JSON_PARTIAL_MESSAGE:
+        return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
+    return b"".join(
+        (
+            partial_message[:-2],
+            b',"s":"',
+            change_sequence_token(run_id, sequence).encode(),
+            b'"},"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
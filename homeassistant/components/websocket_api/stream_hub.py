@@ -0,0 +1,306 @@
+"""Share live event streams between websocket subscribers.
+
+The logbook and history integrations offer live streams that many
+clients subscribe to with the same filters (e.g. every open dashboard
+streams the same entities). Instead of each subscription listening to
+the bus, filtering, converting and serializing the same events, a
+LiveStreamHub keeps one shared stream per filter key, processes each
+batch of events once and fans the pre-serialized payload out to all
+subscribers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .messages import INVALID_JSON_PARTIAL_MESSAGE, _message_to_json_bytes_or_none
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_LIVE_STREAM_HUB: HassKey[LiveStreamHub] = HassKey(f"{DOMAIN}.live_stream_hub")
+
+type LiveStreamSource = Callable[
+    [list[CALLBACK_TYPE], Callable[[Event[Any]], None]], None
+]
+type LiveStreamProcessor = Callable[[list[Event[Any]]], dict[str, Any] | None]
+
+
+@dataclass(slots=True, frozen=True)
+class LiveStreamBatch:
+    """A batch of events processed once for all subscribers of a stream."""
+
+    events: list[Event[Any]]
+    partial_message: bytes
+    first_timestamp: float
+    last_timestamp: float
+
+
+class LiveStreamSubscriber:
+    """A websocket subscription attached to a shared live stream."""
+
+    __slots__ = (
+        "_connection",
+        "_msg_id_bytes",
+        "_on_overflow",
+        "_pending",
+        "_pending_events",
+        "_stream",
+        "live",
+        "setup_complete_time",
+    )
+
+    def __init__(
+        self,
+        stream: _SharedLiveStream,
+        connection: ActiveConnection,
+        msg_id: int,
+        on_overflow: CALLBACK_TYPE,
+    ) -> None:
+        """Initialize the subscriber."""
+        self._stream = stream
+        self._connection = connection
+        self._msg_id_bytes = str(msg_id).encode()
+        self._on_overflow = on_overflow
+        self._pending: list[bytes] = []
+        self._pending_events = 0
+        self.live = False
+        self.setup_complete_time = dt_util.utcnow()
+
+    @callback
+    def async_deliver(self, batch: LiveStreamBatch) -> None:
+        """Deliver a processed batch to the subscriber."""
+        since = self.setup_complete_time.timestamp()
+        if batch.last_timestamp <= since:
+            # Everything in the batch was already sent from the database
+            return
+        if batch.first_timestamp > since:
+            message = self._with_id(batch.partial_message)
+        elif (
+            partial_message := self._stream.async_process(
+                [e for e in batch.events if e.time_fired_timestamp > since]
+            )
+        ) is None:
+            return
+        else:
+            message = self._with_id(partial_message)
+
+        if self.live:
+            self._connection.send_message(message)
+            return
+
+        # Hold messages until the historical data has been sent
+        self._pending.append(message)
+        self._pending_events += len(batch.events)
+        if self._pending_events > self._stream.max_pending:
+            self.async_overflow()
+
+    @callback
+    def async_overflow(self) -> None:
+        """Cancel the subscription because the client cannot keep up."""
+        _LOGGER.debug(
+            "Client exceeded max pending messages of %s", self._stream.max_pending
+        )
+        self._on_overflow()
+
+    @callback
+    def async_go_live(self) -> None:
+        """Send any held messages and deliver new ones as they arrive."""
+        self.live = True
+        send_message = self._connection.send_message
+        for message in self._pending:
+            send_message(message)
+        self._pending.clear()
+        self._pending_events = 0
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Detach from the shared stream."""
+        self._pending.clear()
+        self._stream.async_remove_subscriber(self)
+
+    def _with_id(self, partial_message: bytes) -> bytes:
+        """Append the message id to a partial message."""
+        return b"".join((partial_message[:-1], b',"id":', self._msg_id_bytes, b"}"))
+
+
+class _SharedLiveStream:
+    """One bus subscription shared by all subscribers with the same filters."""
+
+    __slots__ = (
+        "_cancel_flush",
+        "_coalesce_time",
+        "_hass",
+        "_hub",
+        "_key",
+        "_pending",
+        "_process",
+        "_source_unsubs",
+        "max_pending",
+        "subscribers",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub: LiveStreamHub,
+        key: Hashable,
+        source: LiveStreamSource,
+        process: LiveStreamProcessor,
+        coalesce_time: float,
+        max_pending: int,
+    ) -> None:
+        """Initialize the shared stream and subscribe to its source."""
+        self._hass = hass
+        self._hub = hub
+        self._key = key
+        self._process = process
+        self._coalesce_time = coalesce_time
+        self._pending: list[Event[Any]] = []
+        self._cancel_flush: asyncio.TimerHandle | None = None
+        self.max_pending = max_pending
+        self.subscribers: set[LiveStreamSubscriber] = set()
+        self._source_unsubs: list[CALLBACK_TYPE] = []
+        source(self._source_unsubs, self._async_queue_event)
+
+    @callback
+    def _async_queue_event(self, event: Event[Any]) -> None:
+        """Queue an event and schedule processing of the batch."""
+        self._pending.append(event)
+        if len(self._pending) > self.max_pending:
+            # Every subscriber shares the same batch so
+            # they would all exceed the limit together
+            for subscriber in list(self.subscribers):
+                subscriber.async_overflow()
+            return
+        if self._cancel_flush is None:
+            # Coalesce events so we minimize the number of
+            # websocket messages when the system is overloaded
+            # with an event storm
+            self._cancel_flush = self._hass.loop.call_later(
+                self._coalesce_time, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Process the pending events once and fan them out."""
+        if self._cancel_flush is not None:
+            self._cancel_flush.cancel()
+            self._cancel_flush = None
+        events = self._pending
+        self._pending = []
+        if not events or (partial_message := self.async_process(events)) is None:
+            return
+        self._hub.batches_processed += 1
+        batch = LiveStreamBatch(
+            events,
+            partial_message,
+            events[0].time_fired_timestamp,
+            events[-1].time_fired_timestamp,
+        )
+        for subscriber in list(self.subscribers):
+            subscriber.async_deliver(batch)
+
+    @callback
+    def async_process(self, events: list[Event[Any]]) -> bytes | None:
+        """Convert events to a serialized partial event message."""
+        if not events or not (payload := self._process(events)):
+            return None
+        return (
+            _message_to_json_bytes_or_none({"type": "event", "event": payload})
+            or INVALID_JSON_PARTIAL_MESSAGE
+        )
+
+    @callback
+    def async_remove_subscriber(self, subscriber: LiveStreamSubscriber) -> None:
+        """Remove a subscriber and tear down the stream after the last one."""
+        self.subscribers.discard(subscriber)
+        if self.subscribers:
+            return
+        for unsub in self._source_unsubs:
+            unsub()
+        self._source_unsubs.clear()
+        if self._cancel_flush is not None:
+            self._cancel_flush.cancel()
+            self._cancel_flush = None
+        self._pending.clear()
+        self._hub.async_remove_stream(self._key, self)
+
+
+class LiveStreamHub:
+    """Deduplicate identical live stream subscriptions."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._streams: dict[Hashable, _SharedLiveStream] = {}
+        self.batches_processed = 0
+
+    @property
+    def stream_count(self) -> int:
+        """Return the number of shared streams."""
+        return len(self._streams)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of subscribers across all streams."""
+        return sum(len(stream.subscribers) for stream in self._streams.values())
+
+    @callback
+    def async_subscribe(
+        self,
+        key: Hashable,
+        source: LiveStreamSource,
+        process_factory: Callable[[], LiveStreamProcessor],
+        connection: ActiveConnection,
+        msg_id: int,
+        on_overflow: CALLBACK_TYPE,
+        coalesce_time: float,
+        max_pending: int,
+    ) -> LiveStreamSubscriber:
+        """Attach a subscriber to the stream for key, creating it if needed.
+
+        source, process_factory, coalesce_time and max_pending are only used
+        when this is the first subscriber for key. Subscribers with the same
+        key must therefore produce identical output for the same events, so
+        the key has to include everything the source and processor are built
+        from.
+        """
+        if (stream := self._streams.get(key)) is None:
+            stream = self._streams[key] = _SharedLiveStream(
+                self._hass,
+                self,
+                key,
+                source,
+                process_factory(),
+                coalesce_time,
+                max_pending,
+            )
+        subscriber = LiveStreamSubscriber(stream, connection, msg_id, on_overflow)
+        stream.subscribers.add(subscriber)
+        return subscriber
+
+    @callback
+    def async_remove_stream(self, key: Hashable, stream: _SharedLiveStream) -> None:
+        """Forget a stream that has no subscribers left."""
+        if self._streams.get(key) is stream:
+            del self._streams[key]
+
+
+@callback
+@singleton(DATA_LIVE_STREAM_HUB)
+def async_get_live_stream_hub(hass: HomeAssistant) -> LiveStreamHub:
+    """Return the live stream hub."""
+    return LiveStreamHub(hass)
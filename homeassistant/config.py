@@ -15,6 +15,7 @@ import os
 from pathlib import Path
 import re
 import shutil
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
@@ -28,6 +29,7 @@ from .core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant, callback
 from .core_config import _PACKAGE_DEFINITION_SCHEMA, _PACKAGES_CONFIG_SCHEMA
 from .exceptions import ConfigValidationError, HomeAssistantError
 from .helpers import config_validation as cv
+from .helpers.storage import STORAGE_DIR
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
@@ -35,6 +37,7 @@ from .requirements import RequirementsNotFound, async_get_integration_with_requi
 from .util.async_ import create_eager_task
 from .util.package import is_docker_env
 from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml.cache import YamlCache
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +46,7 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_CACHE_FILE = "core.yaml_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -218,9 +222,10 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     try:
         config = await hass.loop.run_in_executor(
             None,
-            load_yaml_config_file,
+            _load_yaml_config_file_cached,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            hass.config.path(STORAGE_DIR, YAML_CACHE_FILE),
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -288,6 +293,32 @@ def load_yaml_config_file(
     return conf_dict
 
 
+def _load_yaml_config_file_cached(
+    config_path: str, secrets: Secrets, cache_path: str
+) -> dict[Any, Any]:
+    """Parse a YAML configuration file, reusing the files which did not change.
+
+    This method needs to run in an executor.
+    """
+    if not os.path.isdir(os.path.dirname(cache_path)):
+        return load_yaml_config_file(config_path, secrets)
+
+    start = time.monotonic()
+    cache = YamlCache.from_file(cache_path)
+    with cache.activate():
+        config = load_yaml_config_file(config_path, secrets)
+    _LOGGER.debug(
+        "Loaded YAML configuration in %.3f seconds, %d files parsed, %d unchanged",
+        time.monotonic() - start,
+        len(cache.parsed),
+        len(cache.unchanged),
+    )
+    if cache.parsed:
+        _LOGGER.debug("Parsed YAML files: %s", ", ".join(cache.parsed))
+    cache.save(cache_path)
+    return config
+
+
 def process_ha_config_upgrade(hass: HomeAssistant) -> None:
     """Upgrade configuration if necessary.
 
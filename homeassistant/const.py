@@ -249,6 +249,7 @@ CONF_QUOTE: Final = "quote"
 CONF_RADIUS: Final = "radius"
 CONF_RECIPIENT: Final = "recipient"
 CONF_REGION: Final = "region"
+CONF_REORDER: Final = "reorder"
 CONF_REPEAT: Final = "repeat"
 CONF_RESOURCE: Final = "resource"
 CONF_RESOURCE_TEMPLATE: Final = "resource_template"
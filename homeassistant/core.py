@@ -101,6 +101,7 @@ from .util.async_ import (
 )
 from .util.event_type import EventType
 from .util.executor import InterruptibleThreadPoolExecutor
+from .util.executor_admission import ExecutorAdmission
 from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
@@ -129,6 +130,13 @@ DOMAIN = "homeassistant"
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
+# Executor jobs an integration can run at the same time
+MAX_EXECUTOR_JOBS_PER_INTEGRATION = 16
+# Workers of the executor for latency sensitive jobs
+PRIORITY_EXECUTOR_WORKERS = 8
+# Removed entities remembered to tell which entities changed since a sequence
+MAX_RETAINED_STATE_REMOVALS = 4096
+
 type ServiceResponse = JsonObjectType | None
 type EntityServiceResponse = dict[str, ServiceResponse]
 
@@ -454,6 +462,13 @@ class HomeAssistant:
         self.import_executor = InterruptibleThreadPoolExecutor(
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
+        self.priority_executor = InterruptibleThreadPoolExecutor(
+            max_workers=PRIORITY_EXECUTOR_WORKERS,
+            thread_name_prefix="PriorityExecutor",
+        )
+        self.executor_admission = ExecutorAdmission(
+            self.loop, MAX_EXECUTOR_JOBS_PER_INTEGRATION
+        )
         self.loop_thread_id = getattr(self.loop, "_thread_id")
 
     def verify_event_loop_thread(self, what: str) -> None:
@@ -876,9 +891,35 @@ class HomeAssistant:
     def async_add_executor_job[*_Ts, _T](
         self, target: Callable[[*_Ts], _T], *args: *_Ts
     ) -> asyncio.Future[_T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add an executor job from within the event loop.
+
+        Integrations can only run a limited number of executor jobs at
+        the same time, jobs above the limit wait for a free slot or until
+        they waited too long.
+        """
+        task = self.executor_admission.run_in_executor(None, target, *args)
+        return self._async_track_executor_task(task)
 
+    @callback
+    def async_add_priority_executor_job[*_Ts, _T](
+        self, target: Callable[[*_Ts], _T], *args: *_Ts
+    ) -> asyncio.Future[_T]:
+        """Add a latency sensitive executor job from within the event loop.
+
+        The job runs in a small separate executor which is not shared with
+        polling, and is not limited by the number of executor jobs its
+        integration is running.
+        """
+        task = self.executor_admission.run_in_executor(
+            self.priority_executor, target, *args, limit=False
+        )
+        return self._async_track_executor_task(task)
+
+    @callback
+    def _async_track_executor_task[_T](
+        self, task: asyncio.Future[_T]
+    ) -> asyncio.Future[_T]:
+        """Track an executor task in the task set of the calling task."""
         tracked = asyncio.current_task() in self._tasks
         task_bucket = self._tasks if tracked else self._background_tasks
         task_bucket.add(task)
@@ -1222,6 +1263,7 @@ class HomeAssistant:
 
         self.set_state(CoreState.stopped)
         self.import_executor.shutdown()
+        self.priority_executor.shutdown()
 
         if self._stopped is not None:
             self._stopped.set()
@@ -2066,7 +2108,18 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_bus",
+        "_change_sequence",
+        "_entity_sequences",
+        "_loop",
+        "_removal_sequences",
+        "_removals_retained_since",
+        "_reservations",
+        "_states",
+        "_states_data",
+        "change_run_id",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2077,6 +2130,14 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Every state change and removal increases the change sequence.
+        # Sequences are only comparable within a run, the run id tells
+        # them apart from the sequences of a previous run.
+        self.change_run_id = ulid_now()
+        self._change_sequence = 0
+        self._entity_sequences: dict[str, int] = {}
+        self._removal_sequences: dict[str, int] = {}
+        self._removals_retained_since = 0
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2189,6 +2250,13 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._change_sequence += 1
+        del self._entity_sequences[entity_id]
+        removal_sequences = self._removal_sequences
+        removal_sequences[entity_id] = self._change_sequence
+        if len(removal_sequences) > MAX_RETAINED_STATE_REMOVALS:
+            oldest = next(iter(removal_sequences))
+            self._removals_retained_since = removal_sequences.pop(oldest)
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2201,6 +2269,45 @@ class StateMachine:
         )
         return True
 
+    @callback
+    def async_change_sequence(self) -> int:
+        """Return the sequence of the last state change or removal.
+
+        This method must be run in the event loop.
+        """
+        return self._change_sequence
+
+    @callback
+    def async_changes_since(
+        self, run_id: str, sequence: int
+    ) -> tuple[list[State], list[str]] | None:
+        """Return the states changed and entities removed after a sequence.
+
+        Returns None if the sequence is of another run than change_run_id or
+        the removals since the sequence are no longer known.
+
+        This method must be run in the event loop.
+        """
+        if (
+            run_id != self.change_run_id
+            or sequence < self._removals_retained_since
+            or sequence > self._change_sequence
+        ):
+            return None
+        states = self._states_data
+        return (
+            [
+                states[entity_id]
+                for entity_id, entity_sequence in self._entity_sequences.items()
+                if entity_sequence > sequence
+            ],
+            [
+                entity_id
+                for entity_id, removal_sequence in self._removal_sequences.items()
+                if removal_sequence > sequence
+            ],
+        )
+
     def set(
         self,
         entity_id: str,
@@ -2374,7 +2481,11 @@ class StateMachine:
         )
         if old_state is not None:
             old_state.expire()
+        elif self._removal_sequences:
+            self._removal_sequences.pop(entity_id, None)
         self._states[entity_id] = state
+        self._change_sequence += 1
+        self._entity_sequences[entity_id] = self._change_sequence
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
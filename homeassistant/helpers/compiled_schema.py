@@ -0,0 +1,167 @@
+"""Voluptuous schemas with a specialized validator for valid data."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import inspect
+from typing import Any
+
+import voluptuous as vol
+
+type _Validator = Callable[[Any], Any]
+
+# Faster versions of validators, keyed by the validator they replace
+_FAST_VALIDATORS: dict[Any, _Validator] = {}
+
+_SIMPLE_MARKERS = (vol.Required, vol.Optional, vol.Remove)
+
+
+def register_fast_validator(validator: Any, fast_validator: _Validator) -> None:
+    """Register a faster version of a validator for compiled schemas.
+
+    The fast validator must return the same value as the validator or raise
+    vol.Invalid for values it does not handle, which are then passed to the
+    validator.
+    """
+    _FAST_VALIDATORS[validator] = fast_validator
+
+
+class CompiledSchema(vol.Schema):
+    """Schema which validates valid data without the generic voluptuous engine.
+
+    Mappings with literal string keys are turned into a validator which looks
+    up the validator of each key and calls it directly. Values which are not
+    valid for that validator are passed to the regular voluptuous validation,
+    which raises exactly the errors a vol.Schema raises.
+    """
+
+    def __init__(
+        self, schema: Any, required: bool = False, extra: int = vol.PREVENT_EXTRA
+    ) -> None:
+        """Initialize the schema."""
+        super().__init__(schema, required, extra)
+        if (fast_validate := _compile_mapping(self, schema)) is None:
+            return
+        validate = self._compiled
+
+        def validate_compiled(path: list, data: Any) -> Any:
+            """Validate with the compiled validator, fall back on invalid data."""
+            try:
+                return fast_validate(data)
+            except (vol.Invalid, ValueError):
+                return validate(path, data)
+
+        self._compiled = validate_compiled
+
+
+def _compile_value(schema: vol.Schema, value_schema: Any) -> _Validator:
+    """Return a validator for the value of a key."""
+    compiled = schema._compile(value_schema)  # noqa: SLF001
+
+    def validate_regular(value: Any) -> Any:
+        """Validate a value with voluptuous."""
+        return compiled([], value)
+
+    try:
+        fast_validator = _FAST_VALIDATORS.get(value_schema)
+    except TypeError:
+        # Unhashable schemas like lists
+        fast_validator = None
+
+    if fast_validator is not None:
+
+        def validate_fast(value: Any) -> Any:
+            """Validate a value with the fast validator if it handles it."""
+            try:
+                return fast_validator(value)
+            except vol.Invalid:
+                return validate_regular(value)
+
+        return validate_fast
+
+    if isinstance(value_schema, dict) and not isinstance(value_schema, vol.Object):
+        return _compile_mapping(schema, value_schema) or validate_regular
+
+    if inspect.isclass(value_schema):
+
+        def validate_instance(value: Any) -> Any:
+            """Validate the type of a value."""
+            if isinstance(value, value_schema):
+                return value
+            raise vol.Invalid("unexpected type")
+
+        return validate_instance
+
+    if callable(value_schema) and not hasattr(value_schema, "__voluptuous_compile__"):
+        # Plain validators like cv.string can be called directly, validators
+        # with sub validators are much faster with their compiled version.
+        return value_schema  # type: ignore[no-any-return]
+
+    return validate_regular
+
+
+def _compile_mapping(schema: vol.Schema, mapping: Any) -> _Validator | None:
+    """Return a validator for a mapping with literal string keys.
+
+    Returns None if the mapping can not be compiled, e.g. because it uses
+    keys which are validators or groups of exclusion or inclusion.
+    """
+    if not isinstance(mapping, Mapping) or isinstance(mapping, vol.Object):
+        return None
+
+    validators: dict[str, tuple[bool, _Validator]] = {}
+    required_keys: list[str] = []
+    # Use the iteration order of voluptuous when inserting default values
+    defaults: list[tuple[str, Callable[[], Any]]] = [
+        (key.schema, key.default)
+        for key in {
+            key for key in mapping if isinstance(key, (vol.Required, vol.Optional))
+        }
+        if type(key) in (vol.Required, vol.Optional)
+        and key.default is not vol.UNDEFINED
+    ]
+
+    for key, value_schema in mapping.items():
+        if type(key) is str:
+            name = key
+            remove = False
+            required = schema.required
+        elif type(key) in _SIMPLE_MARKERS and type(key.schema) is str:
+            name = key.schema
+            remove = type(key) is vol.Remove
+            required = type(key) is vol.Required and key.default is vol.UNDEFINED
+        else:
+            return None
+        if name in validators:
+            return None
+        validators[name] = (remove, _compile_value(schema, value_schema))
+        if required:
+            required_keys.append(name)
+
+    extra = schema.extra
+
+    def validate_mapping(data: Any) -> Any:
+        """Validate a mapping."""
+        if not isinstance(data, dict):
+            raise vol.Invalid("expected a dictionary")
+        out = data.__class__()
+        for key, value in data.items():
+            if (key_validator := validators.get(key)) is None:
+                if extra == vol.ALLOW_EXTRA:
+                    out[key] = value
+                elif extra != vol.REMOVE_EXTRA:
+                    raise vol.Invalid("extra keys not allowed")
+                continue
+            remove, validate = key_validator
+            validated = validate(value)
+            if not remove:
+                out[key] = validated
+        for key in required_keys:
+            if key not in data:
+                raise vol.Invalid("required key not provided")
+        for key, default in defaults:
+            if key not in data:
+                out[key] = validators[key][1](default())
+        return out
+
+    return validate_mapping
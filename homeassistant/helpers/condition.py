@@ -11,6 +11,7 @@ import functools as ft
 import logging
 import re
 import sys
+from time import perf_counter
 from typing import Any, Protocol, cast
 
 import voluptuous as vol
@@ -34,6 +35,7 @@ from homeassistant.const import (
     CONF_FOR,
     CONF_ID,
     CONF_MATCH,
+    CONF_REORDER,
     CONF_STATE,
     CONF_VALUE_TEMPLATE,
     CONF_WEEKDAY,
@@ -92,6 +94,22 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Estimated time in seconds to evaluate conditions which have not been
+# sampled yet, conditions of other types are never reordered
+_CONDITION_COSTS = {
+    "numeric_state": 1e-5,
+    "state": 5e-6,
+    "sun": 2e-4,
+    "template": 1e-4,
+    "time": 2e-5,
+    "trigger": 2e-6,
+    "zone": 2e-5,
+}
+# Weight of a new sample in the moving average of the time a condition takes
+_COST_SAMPLE_WEIGHT = 0.2
+# Number of evaluations after which the order of the conditions is updated
+_REPLAN_INTERVAL = 16
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -263,6 +281,8 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    if config.get(CONF_REORDER):
+        return _planned_condition("and", checks, config["conditions"])
 
     @trace_condition_function
     def if_and_condition(
@@ -294,6 +314,8 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    if config.get(CONF_REORDER):
+        return _planned_condition("or", checks, config["conditions"])
 
     @trace_condition_function
     def if_or_condition(
@@ -320,6 +342,150 @@ async def async_or_from_config(
     return if_or_condition
 
 
+def _condition_cost(config: ConfigType) -> float | None:
+    """Return the estimated cost of a condition, or None if it can't be reordered."""
+    condition = config[CONF_CONDITION]
+    if condition in ("and", "or", "not"):
+        costs = [_condition_cost(entry) for entry in config["conditions"]]
+        if None in costs:
+            return None
+        return sum(cast(list[float], costs))
+    return _CONDITION_COSTS.get(condition)
+
+
+class _ConditionPlan:
+    """The order to evaluate the conditions of an and/or condition in.
+
+    Conditions which can end the evaluation early and are cheap to
+    evaluate are evaluated first. The cost of a condition starts as an
+    estimate from its type and is then sampled each time it is evaluated.
+    Conditions which are not known to be free of side effects, like
+    device conditions, keep their position and the conditions are only
+    reordered between them.
+    """
+
+    __slots__ = (
+        "_evaluations",
+        "_runs",
+        "_segments",
+        "_short_circuits",
+        "costs",
+        "order",
+    )
+
+    def __init__(self, configs: list[ConfigType]) -> None:
+        """Initialize the plan."""
+        costs = [_condition_cost(config) for config in configs]
+        self.costs = [cost or 0.0 for cost in costs]
+        self._evaluations = [0] * len(configs)
+        self._short_circuits = [0] * len(configs)
+        self._runs = 0
+        self._segments: list[list[int]] = []
+        segment: list[int] = []
+        for index, cost in enumerate(costs):
+            if cost is not None:
+                segment.append(index)
+                continue
+            if segment:
+                self._segments.append(segment)
+            self._segments.append([index])
+            segment = []
+        if segment:
+            self._segments.append(segment)
+        self.order: list[int] = []
+        self._plan()
+
+    def _rank(self, index: int) -> float:
+        """Return the expected cost of finding a condition which ends the evaluation."""
+        # Conditions which were not evaluated yet end it half of the time
+        rate = (self._short_circuits[index] + 1) / (self._evaluations[index] + 2)
+        return self.costs[index] / rate
+
+    def _plan(self) -> None:
+        """Order the conditions."""
+        self.order = [
+            index
+            for segment in self._segments
+            for index in sorted(segment, key=self._rank)
+        ]
+
+    def record(self, index: int, duration: float, short_circuit: bool) -> None:
+        """Record the evaluation of a condition."""
+        if self._evaluations[index]:
+            self.costs[index] += (duration - self.costs[index]) * _COST_SAMPLE_WEIGHT
+        else:
+            self.costs[index] = duration
+        self._evaluations[index] += 1
+        if short_circuit:
+            self._short_circuits[index] += 1
+
+    def finish(self) -> None:
+        """Finish an evaluation of all conditions."""
+        self._runs += 1
+        if self._runs % _REPLAN_INTERVAL == 0:
+            self._plan()
+
+
+def _planned_condition(
+    condition: str, checks: list[ConditionCheckerType], configs: list[ConfigType]
+) -> ConditionCheckerType:
+    """Create an and/or condition which evaluates its conditions by cost.
+
+    The result is the same as evaluating the conditions in the declared
+    order, and the trace of each condition keeps its declared index.
+    """
+    plan = _ConditionPlan(configs)
+    # The result which ends the evaluation
+    short_circuit = condition == "or"
+
+    @trace_condition_function
+    def if_planned_condition(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test conditions in the planned order."""
+        errors = []
+        order = plan.order
+        started = perf_counter()
+        try:
+            for index in order:
+                check_started = perf_counter()
+                try:
+                    with trace_path(["conditions", str(index)]):
+                        result = checks[index](hass, variables)
+                except ConditionError as ex:
+                    plan.record(index, perf_counter() - check_started, False)
+                    errors.append(
+                        ConditionErrorIndex(
+                            condition, index=index, total=len(checks), error=ex
+                        )
+                    )
+                    continue
+                plan.record(
+                    index, perf_counter() - check_started, result is short_circuit
+                )
+                if result is short_circuit:
+                    # Estimate the declared order evaluating all conditions
+                    # up to this one, assuming none of them ends it earlier
+                    declared_cost = sum(plan.costs[: index + 1])
+                    condition_trace_update_result(
+                        order=order,
+                        saved_time=max(declared_cost - (perf_counter() - started), 0),
+                    )
+                    return short_circuit
+        finally:
+            plan.finish()
+
+        condition_trace_update_result(order=order, saved_time=0)
+        # Raise the errors if no check ended the evaluation
+        if errors:
+            errors.sort(key=lambda error: error.index)
+            raise ConditionErrorContainer(condition, errors=errors)
+
+        return not short_circuit
+
+    return if_planned_condition
+
+
 async def async_not_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
@@ -64,6 +64,7 @@ from homeassistant.const import (
     CONF_MATCH,
     CONF_PARALLEL,
     CONF_PLATFORM,
+    CONF_REORDER,
     CONF_REPEAT,
     CONF_RESPONSE_VARIABLE,
     CONF_SCAN_INTERVAL,
@@ -112,6 +113,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.yaml.objects import NodeStrClass
 
 from . import script_variables as script_variables_helper, template as template_helper
+from .compiled_schema import CompiledSchema, register_fast_validator
 from .frame import get_integration_logger
 from .typing import VolDictType, VolSchemaType
 
@@ -1276,7 +1278,7 @@ def platform_only_config_schema(domain: str) -> Callable[[dict], dict]:
     )
 
 
-PLATFORM_SCHEMA = vol.Schema(
+PLATFORM_SCHEMA = CompiledSchema(
     {
         vol.Required(CONF_PLATFORM): string,
         vol.Optional(CONF_ENTITY_NAMESPACE): string,
@@ -1286,51 +1288,84 @@ PLATFORM_SCHEMA = vol.Schema(
 
 PLATFORM_SCHEMA_BASE = PLATFORM_SCHEMA.extend({}, extra=vol.ALLOW_EXTRA)
 
+# Either accept static entity IDs, a single dynamic template or a mixed list
+# of static and dynamic templates. While this could be solved with a single
+# complex template, handling it like this, keeps config validation useful.
+_entity_id_service_field = vol.Any(
+    comp_entity_ids, dynamic_template, vol.All(list, template_complex)
+)
+# Same as _entity_id_service_field but supports specifying entity by entity
+# registry ID.
+_entity_id_or_uuid_service_field = vol.Any(
+    comp_entity_ids_or_uuids, dynamic_template, vol.All(list, template_complex)
+)
+_target_ids_service_field = vol.Any(
+    ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
+)
+
 ENTITY_SERVICE_FIELDS: VolDictType = {
-    # Either accept static entity IDs, a single dynamic template or a mixed list
-    # of static and dynamic templates. While this could be solved with a single
-    # complex template, handling it like this, keeps config validation useful.
-    vol.Optional(ATTR_ENTITY_ID): vol.Any(
-        comp_entity_ids, dynamic_template, vol.All(list, template_complex)
-    ),
-    vol.Optional(ATTR_DEVICE_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
-    vol.Optional(ATTR_AREA_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
-    vol.Optional(ATTR_FLOOR_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
-    vol.Optional(ATTR_LABEL_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
+    vol.Optional(ATTR_ENTITY_ID): _entity_id_service_field,
+    vol.Optional(ATTR_DEVICE_ID): _target_ids_service_field,
+    vol.Optional(ATTR_AREA_ID): _target_ids_service_field,
+    vol.Optional(ATTR_FLOOR_ID): _target_ids_service_field,
+    vol.Optional(ATTR_LABEL_ID): _target_ids_service_field,
 }
 
 TARGET_SERVICE_FIELDS = {
-    # Same as ENTITY_SERVICE_FIELDS but supports specifying entity by entity registry
-    # ID.
-    # Either accept static entity IDs, a single dynamic template or a mixed list
-    # of static and dynamic templates. While this could be solved with a single
-    # complex template, handling it like this, keeps config validation useful.
-    vol.Optional(ATTR_ENTITY_ID): vol.Any(
-        comp_entity_ids_or_uuids, dynamic_template, vol.All(list, template_complex)
-    ),
-    vol.Optional(ATTR_DEVICE_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
-    vol.Optional(ATTR_AREA_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
-    vol.Optional(ATTR_FLOOR_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
-    vol.Optional(ATTR_LABEL_ID): vol.Any(
-        ENTITY_MATCH_NONE, vol.All(ensure_list, [vol.Any(dynamic_template, str)])
-    ),
+    vol.Optional(ATTR_ENTITY_ID): _entity_id_or_uuid_service_field,
+    vol.Optional(ATTR_DEVICE_ID): _target_ids_service_field,
+    vol.Optional(ATTR_AREA_ID): _target_ids_service_field,
+    vol.Optional(ATTR_FLOOR_ID): _target_ids_service_field,
+    vol.Optional(ATTR_LABEL_ID): _target_ids_service_field,
 }
 
 
+def _fast_positive_int(value: Any) -> int:
+    """Validate a positive int which needs no coercion."""
+    if type(value) is int and value >= 0:
+        return value
+    raise vol.Invalid("not handled")
+
+
+def _fast_entity_id_service_field(
+    value: Any, validator: Callable[[str | list], list[str]]
+) -> str | list[str]:
+    """Validate static entity IDs of a service call."""
+    if type(value) is str:
+        if (lowered := value.lower()) in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE):
+            return lowered
+        return validator(value)
+    if type(value) is list:
+        return validator(value)
+    raise vol.Invalid("not handled")
+
+
+def _fast_target_ids_service_field(value: Any) -> str | list[str]:
+    """Validate static device, area, floor or label IDs of a service call."""
+    if type(value) is str:
+        if value == ENTITY_MATCH_NONE:
+            return value
+        value = [value]
+    elif type(value) is not list:
+        raise vol.Invalid("not handled")
+    for item in value:
+        if type(item) is not str or template_helper.is_template_string(item):
+            raise vol.Invalid("not handled")
+    return list(value)
+
+
+register_fast_validator(positive_int, _fast_positive_int)
+register_fast_validator(
+    _entity_id_service_field,
+    functools.partial(_fast_entity_id_service_field, validator=entity_ids),
+)
+register_fast_validator(
+    _entity_id_or_uuid_service_field,
+    functools.partial(_fast_entity_id_service_field, validator=entity_ids_or_uuids),
+)
+register_fast_validator(_target_ids_service_field, _fast_target_ids_service_field)
+
+
 _HAS_ENTITY_SERVICE_FIELD = has_at_least_one_key(*ENTITY_SERVICE_FIELDS)
 
 
@@ -1356,7 +1391,7 @@ def is_entity_service_schema(validator: VolSchemaType) -> bool:
 def _make_entity_service_schema(schema: dict, extra: int) -> VolSchemaType:
     """Create an entity service schema."""
     validator = vol.All(
-        vol.Schema(
+        CompiledSchema(
             {
                 # The frontend stores data here. Don't use in core.
                 vol.Remove("metadata"): dict,
@@ -1603,6 +1638,7 @@ AND_CONDITION_SCHEMA = vol.Schema(
     {
         **CONDITION_BASE_SCHEMA,
         vol.Required(CONF_CONDITION): "and",
+        vol.Optional(CONF_REORDER): boolean,
         vol.Required(CONF_CONDITIONS): vol.All(
             ensure_list,
             # pylint: disable-next=unnecessary-lambda
@@ -1614,6 +1650,7 @@ AND_CONDITION_SCHEMA = vol.Schema(
 AND_CONDITION_SHORTHAND_SCHEMA = vol.Schema(
     {
         **CONDITION_BASE_SCHEMA,
+        vol.Optional(CONF_REORDER): boolean,
         vol.Required("and"): vol.All(
             ensure_list,
             # pylint: disable-next=unnecessary-lambda
@@ -1626,6 +1663,7 @@ OR_CONDITION_SCHEMA = vol.Schema(
     {
         **CONDITION_BASE_SCHEMA,
         vol.Required(CONF_CONDITION): "or",
+        vol.Optional(CONF_REORDER): boolean,
         vol.Required(CONF_CONDITIONS): vol.All(
             ensure_list,
             # pylint: disable-next=unnecessary-lambda
@@ -1637,6 +1675,7 @@ OR_CONDITION_SCHEMA = vol.Schema(
 OR_CONDITION_SHORTHAND_SCHEMA = vol.Schema(
     {
         **CONDITION_BASE_SCHEMA,
+        vol.Optional(CONF_REORDER): boolean,
         vol.Required("or"): vol.All(
             ensure_list,
             # pylint: disable-next=unnecessary-lambda
@@ -514,6 +514,27 @@ class Entity(
     # Job type cache
     _job_types: dict[str, HassJobType] | None = None
 
+    # Set by integrations which may write the state of the entity several
+    # times in the same event loop iteration, e.g. from multiple coordinator
+    # callbacks. The writes are then collapsed into a single state write at
+    # the end of the iteration.
+    _coalesce_state_writes: bool = False
+    # If a coalesced state write is scheduled
+    _state_write_pending = False
+    # Number of state writes avoided by coalescing
+    _state_writes_coalesced = 0
+
+    # The attributes which do not depend on the state, and the values
+    # they were calculated from. They are only rebuilt when the registry
+    # entry, device entry or one of the values changes.
+    _static_attributes_key: tuple[Any, ...] | None = None
+    _static_attributes: dict[str, Any] | None = None
+
+    # Set by integrations to the configuration the entity was created from.
+    # When the platform is reloaded, an entity which is added again with the
+    # same unique id and an equal configuration is kept instead of recreated.
+    _reload_config: Any = None
+
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
     # and removes the need for constant None checks or asserts.
@@ -1020,6 +1041,19 @@ class Entity(
             self._async_verify_state_writable()
         if self.hass.loop_thread_id != threading.get_ident():
             report_non_thread_safe_operation("async_write_ha_state")
+        if self._coalesce_state_writes:
+            if self._state_write_pending:
+                self._state_writes_coalesced += 1
+                return
+            self._state_write_pending = True
+            self.hass.loop.call_soon(self._async_write_coalesced_ha_state)
+            return
+        self._async_write_ha_state()
+
+    @callback
+    def _async_write_coalesced_ha_state(self) -> None:
+        """Write the state after all writes in a loop iteration were collapsed."""
+        self._state_write_pending = False
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -1089,36 +1123,79 @@ class Entity(
             if extra_state_attributes := self.extra_state_attributes:
                 attr.update(extra_state_attributes)
 
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
+        original_device_class = self.device_class
+        supported_features = self.supported_features
+        static_key = (
+            entry,
+            self.device_entry,
+            self.unit_of_measurement,
+            self.assumed_state,
+            self.attribution,
+            original_device_class,
+            self.entity_picture,
+            self.icon,
+            self.name,
+            self.has_entity_name,
+            supported_features,
+        )
+        if (static_attr := self._static_attributes) is None or (
+            static_key != self._static_attributes_key
+        ):
+            static_attr = self._static_attributes = self._async_static_attributes(
+                *static_key
+            )
+            self._static_attributes_key = static_key
+        attr.update(static_attr)
+
+        return (state, attr, capability_attr, original_device_class, supported_features)
+
+    def _async_static_attributes(
+        self,
+        entry: er.RegistryEntry | None,
+        device_entry: dr.DeviceEntry | None,
+        unit_of_measurement: str | None,
+        assumed_state: bool,
+        attribution: str | None,
+        original_device_class: str | None,
+        entity_picture: str | None,
+        icon: str | None,
+        name: str | UndefinedType | None,
+        has_entity_name: bool,
+        supported_features: int | None,
+    ) -> dict[str, Any]:
+        """Calculate the attributes which do not depend on the state."""
+        attr: dict[str, Any] = {}
+        if unit_of_measurement is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        if assumed_state := self.assumed_state:
+        if assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
+        if attribution is not None:
             attr[ATTR_ATTRIBUTION] = attribution
 
-        original_device_class = self.device_class
         if (
             device_class := (entry and entry.device_class) or original_device_class
         ) is not None:
             attr[ATTR_DEVICE_CLASS] = str(device_class)
 
-        if (entity_picture := self.entity_picture) is not None:
+        if entity_picture is not None:
             attr[ATTR_ENTITY_PICTURE] = entity_picture
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
+        if (icon := (entry and entry.icon) or icon) is not None:
             attr[ATTR_ICON] = icon
 
+        # The device entry, name and has_entity_name
+        # are used to calculate the friendly name
         if (
-            name := (entry and entry.name) or self._friendly_name_internal()
+            friendly_name := (entry and entry.name) or self._friendly_name_internal()
         ) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
+            attr[ATTR_FRIENDLY_NAME] = friendly_name
 
-        if (supported_features := self.supported_features) is not None:
+        if supported_features is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr, capability_attr, original_device_class, supported_features)
+        return attr
 
     @callback
     def _async_write_ha_state(self) -> None:
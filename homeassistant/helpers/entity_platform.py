@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import timedelta
 from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any, Protocol
@@ -47,6 +48,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .poll_scheduler import async_get_poll_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -109,6 +111,28 @@ class EntityPlatformModule(Protocol):
     ) -> None:
         """Set up an integration platform from a config entry."""
 
+    async def async_handle_entity_service_batch(
+        self,
+        hass: HomeAssistant,
+        entities: list[Entity],
+        method: str,
+        data: dict[str, Any],
+    ) -> bool:
+        """Call an entity service method on several entities at once.
+
+        Return False to have the method called on each entity instead.
+        """
+
+
+@dataclass(slots=True)
+class PlatformReloadStats:
+    """Entities of a platform which were kept, recreated, removed or added."""
+
+    kept: int = 0
+    recreated: int = 0
+    removed: int = 0
+    added: int = 0
+
 
 class EntityPlatform:
     """Manage the entities for a single platform.
@@ -154,6 +178,10 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Entities which can be kept during a reload, indexed by unique id
+        self._reload_entities: dict[str, Entity] | None = None
+        self._reload_stats: PlatformReloadStats | None = None
+        self._reload_depth = 0
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -634,6 +662,9 @@ class EntityPlatform:
         if not new_entities:  # type: ignore[truthy-iterable]
             return
 
+        if self._reload_entities is not None:
+            new_entities = await self._async_reload_entities(new_entities)
+
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
         coros: list[Coroutine[Any, Any, None]] = []
@@ -672,18 +703,26 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+        self._async_schedule_poll()
+
+    @callback
+    def _async_schedule_poll(self, last_poll: float | None = None) -> None:
+        """Schedule the next poll in the slot of this platform."""
+        name = f"{self.domain}.{self.platform_name}"
+        if self.config_entry:
+            name = f"{name}.{self.config_entry.entry_id}"
+        self._async_polling_timer = self.hass.loop.call_at(
+            async_get_poll_scheduler(self.hass).async_next_poll(
+                self, name, self.scan_interval_seconds, last_poll
+            ),
             self._async_handle_interval_callback,
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        assert self._async_polling_timer is not None
+        self._async_schedule_poll(self._async_polling_timer.when())
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -926,6 +965,95 @@ class EntityPlatform:
 
         await entity.add_to_platform_finish()
 
+    async def async_begin_reload(self) -> None:
+        """Start reloading the platform with a new configuration.
+
+        Entities with a unique id and a reload config are kept until the
+        reload is finished. When an entity with the same unique id and an
+        equal reload config is added during the reload, the existing entity
+        is kept and the new one is discarded. All other entities are removed
+        like when the platform is reset.
+
+        Reloads can be nested, only the outermost reload removes entities.
+        Polling is stopped like when the platform is reset, so entities are
+        not polled with the old configuration, and is started again when the
+        reload is finished.
+        """
+        self._reload_depth += 1
+        if self._reload_depth > 1:
+            return
+        self.async_cancel_retry_setup()
+        self.async_unsub_polling()
+        self._reload_entities = {}
+        self._reload_stats = PlatformReloadStats()
+        for entity in list(self.entities.values()):
+            if entity.unique_id is not None and entity._reload_config is not None:  # noqa: SLF001
+                self._reload_entities[entity.unique_id] = entity
+                continue
+            self._reload_stats.removed += 1
+            await self._async_remove_reloaded_entity(entity)
+        self._setup_complete = False
+
+    async def async_finish_reload(self) -> PlatformReloadStats | None:
+        """Finish a reload and remove the entities which were not added again.
+
+        Returns None when an outer reload is still in progress.
+        """
+        self._reload_depth -= 1
+        if self._reload_depth > 0:
+            return None
+        stats = self._reload_stats or PlatformReloadStats()
+        reload_entities = self._reload_entities or {}
+        self._reload_entities = None
+        self._reload_stats = None
+        for entity in reload_entities.values():
+            await self._async_remove_reloaded_entity(entity)
+        stats.removed += len(reload_entities)
+        if not self.entities:
+            self.async_unsub_polling()
+        elif (
+            self._async_polling_timer is None
+            and not (self.config_entry and self.config_entry.pref_disable_polling)
+            and any(entity.should_poll for entity in self.entities.values())
+        ):
+            # Only added entities start polling, kept entities may need it
+            self._async_schedule_poll()
+        return stats
+
+    async def _async_reload_entities(
+        self, new_entities: Iterable[Entity]
+    ) -> list[Entity]:
+        """Return the entities added during a reload which have to be added."""
+        assert self._reload_entities is not None
+        assert self._reload_stats is not None
+        to_add: list[Entity] = []
+        for entity in new_entities:
+            if (
+                entity.unique_id is None
+                or (existing := self._reload_entities.pop(entity.unique_id, None))
+                is None
+            ):
+                self._reload_stats.added += 1
+                to_add.append(entity)
+                continue
+            if (
+                entity._reload_config is not None  # noqa: SLF001
+                and entity._reload_config == existing._reload_config  # noqa: SLF001
+            ):
+                self._reload_stats.kept += 1
+                continue
+            self._reload_stats.recreated += 1
+            await self._async_remove_reloaded_entity(existing)
+            to_add.append(entity)
+        return to_add
+
+    async def _async_remove_reloaded_entity(self, entity: Entity) -> None:
+        """Remove an entity which is not kept during a reload."""
+        try:
+            await entity.async_remove()
+        except Exception:
+            self.logger.exception("Error while removing entity %s", entity.entity_id)
+
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
 
@@ -957,6 +1085,7 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+            async_get_poll_scheduler(self.hass).async_remove(self)
 
     @callback
     def async_prepare(self) -> None:
@@ -1044,25 +1173,33 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
-
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
+            start = self.hass.loop.time()
+            try:
+                await self._async_poll_entities()
+            finally:
+                async_get_poll_scheduler(self.hass).async_record_poll(
+                    self, self.hass.loop.time() - start
                 )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+
+    async def _async_poll_entities(self) -> None:
+        """Poll the entities, respecting the parallel updates of the platform."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
+
+        if tasks := [
+            create_eager_task(entity.async_update_ha_state(True), loop=self.hass.loop)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
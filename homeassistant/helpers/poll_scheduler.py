@@ -0,0 +1,135 @@
+"""Spread polling across the poll interval.
+
+Entity platforms and data update coordinators which poll with the same
+interval would otherwise all poll at the same moment, for example every
+30 seconds after startup. Each poller gets a fixed slot in its interval
+which is derived from a hash of its name, so polls are spread evenly
+and a poller keeps its slot across restarts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Any
+import zlib
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey("poll_scheduler")
+
+# Length of the timeline in seconds and the width of each histogram bucket
+TIMELINE_WINDOW = 60
+TIMELINE_BUCKET = 1
+
+# Fraction of the interval a poll may start after its slot and still be in it
+SLOT_TOLERANCE = 0.1
+
+
+@dataclass(slots=True)
+class PollSlot:
+    """A poller and its slot in the poll interval."""
+
+    name: str
+    interval: float
+    offset: float
+    next_poll: float
+    polls: int = 0
+    last_duration: float | None = None
+
+
+def poll_offset(name: str, interval: float) -> float:
+    """Return the offset of a poller in its interval."""
+    return zlib.crc32(name.encode()) / 2**32 * interval
+
+
+class PollScheduler:
+    """Track the slots of all pollers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._loop = hass.loop
+        self._slots: dict[object, PollSlot] = {}
+
+    @callback
+    def async_next_poll(
+        self,
+        poller: object,
+        name: str,
+        interval: float,
+        last_poll: float | None = None,
+    ) -> float:
+        """Return the loop time of the next poll of a poller.
+
+        The first poll is in the next slot of the poller, later polls are in
+        the first slot at least one interval after the last poll so a poll
+        requested just before a slot does not poll again right away.
+        """
+        now = self._loop.time()
+        slot = self._slots.get(poller)
+        if slot is None or slot.interval != interval or slot.name != name:
+            slot = self._slots[poller] = PollSlot(
+                name, interval, poll_offset(name, interval), now
+            )
+        if interval <= 0:
+            next_poll = now
+        elif last_poll is None:
+            next_poll = now - (now - slot.offset) % interval + interval
+        else:
+            # A poll which started a bit late is still in its slot
+            earliest = max(last_poll + interval * (1 - SLOT_TOLERANCE), now)
+            next_poll = (
+                slot.offset + math.ceil((earliest - slot.offset) / interval) * interval
+            )
+        slot.next_poll = next_poll
+        return next_poll
+
+    @callback
+    def async_record_poll(self, poller: object, duration: float) -> None:
+        """Record how long a poll took."""
+        if slot := self._slots.get(poller):
+            slot.polls += 1
+            slot.last_duration = duration
+
+    @callback
+    def async_remove(self, poller: object) -> None:
+        """Remove a poller which stopped polling."""
+        self._slots.pop(poller, None)
+
+    @callback
+    def async_timeline(self) -> dict[str, Any]:
+        """Return the upcoming polls and a histogram of polls per bucket."""
+        now = self._loop.time()
+        histogram = [0] * (TIMELINE_WINDOW // TIMELINE_BUCKET)
+        for slot in self._slots.values():
+            due = slot.next_poll - now
+            while 0 <= due < TIMELINE_WINDOW:
+                histogram[int(due // TIMELINE_BUCKET)] += 1
+                if slot.interval <= 0:
+                    break
+                due += slot.interval
+        return {
+            "bucket_seconds": TIMELINE_BUCKET,
+            "histogram": histogram,
+            "pollers": [
+                {
+                    "name": slot.name,
+                    "interval": slot.interval,
+                    "offset": round(slot.offset, 3),
+                    "next_poll": round(slot.next_poll - now, 3),
+                    "polls": slot.polls,
+                    "last_duration": slot.last_duration,
+                }
+                for slot in sorted(self._slots.values(), key=lambda s: s.next_poll)
+            ],
+        }
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler."""
+    return PollScheduler(hass)
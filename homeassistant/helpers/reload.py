@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 import logging
+import time
 from typing import Any, Literal, overload
 
 from homeassistant import config as conf_util
@@ -131,9 +133,69 @@ async def _async_reconfig_platform(
     platform: EntityPlatform, platform_configs: list[dict[str, Any]]
 ) -> None:
     """Reconfigure an already loaded platform."""
-    await platform.async_reset()
-    tasks = [platform.async_setup(p_config) for p_config in platform_configs]
-    await asyncio.gather(*tasks)
+    async with _async_platforms_reload([platform]):
+        tasks = [platform.async_setup(p_config) for p_config in platform_configs]
+        await asyncio.gather(*tasks)
+
+
+@asynccontextmanager
+async def _async_platforms_reload(
+    platforms: Iterable[EntityPlatform],
+) -> AsyncIterator[None]:
+    """Keep unchanged entities of platforms which are set up again in the block.
+
+    The logged duration of a platform is the time to begin and finish its own
+    reload and the time to set up the block, which all platforms share.
+    """
+    durations: dict[EntityPlatform, float] = {}
+    for platform in platforms:
+        start = time.monotonic()
+        await platform.async_begin_reload()
+        durations[platform] = time.monotonic() - start
+    setup_start = time.monotonic()
+    try:
+        yield
+    finally:
+        setup_duration = time.monotonic() - setup_start
+        for platform, duration in durations.items():
+            start = time.monotonic()
+            if (stats := await platform.async_finish_reload()) is None:
+                continue
+            _LOGGER.info(
+                "Reloaded %s platform %s in %.3f seconds: %d entities kept, "
+                "%d recreated, %d removed, %d added",
+                platform.domain,
+                platform.platform_name,
+                duration + setup_duration + time.monotonic() - start,
+                stats.kept,
+                stats.recreated,
+                stats.removed,
+                stats.added,
+            )
+
+
+@asynccontextmanager
+async def async_reload_platforms_in_place(
+    hass: HomeAssistant, integration_domain: str, platform_domains: Iterable[str]
+) -> AsyncIterator[None]:
+    """Reload the loaded platforms of an integration set up again in the block.
+
+    Entities which are added again with the same unique id and an equal
+    reload config are kept, all other entities of the platforms are
+    recreated or removed. This allows an integration to reload its platforms
+    and entities set up from its own configuration as a single reload.
+    """
+    platforms = [
+        platform
+        for platform_domain in platform_domains
+        if (
+            platform := async_get_platform_without_config_entry(
+                hass, integration_domain, platform_domain
+            )
+        )
+    ]
+    async with _async_platforms_reload(platforms):
+        yield
 
 
 @overload
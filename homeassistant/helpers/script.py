@@ -500,7 +500,9 @@ class _ScriptRun:
                 if self._stop.done():
                     return
 
-                action = cv.determine_script_action(self._action)
+                action = self._script._step_actions[  # noqa: SLF001
+                    self._step
+                ] or cv.determine_script_action(self._action)
 
                 if CONF_ENABLED in self._action:
                     enabled = self._action[CONF_ENABLED]
@@ -732,9 +734,9 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        params = self._script._get_service_call(  # noqa: SLF001
+            self._step
+        ).async_render(self._variables)
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -1394,6 +1396,17 @@ class ScriptRunResult:
     variables: dict[str, Any]
 
 
+def _script_action_or_none(action: dict[str, Any]) -> str | None:
+    """Return the action type of a step, or None if it can't be determined.
+
+    Steps without a known action type raise when the step is run.
+    """
+    try:
+        return cv.determine_script_action(action)
+    except ValueError:
+        return None
+
+
 class Script:
     """Representation of a script."""
 
@@ -1459,6 +1472,8 @@ class Script:
         self._if_data: dict[int, _IfData] = {}
         self._parallel_scripts: dict[int, list[Script]] = {}
         self._sequence_scripts: dict[int, Script] = {}
+        self._service_calls: dict[int, service.CompiledServiceCall] = {}
+        self._step_actions = [_script_action_or_none(action) for action in sequence]
         self.variables = variables
         self._variables_dynamic = template.is_complex(variables)
         self._copy_variables_on_run = copy_variables
@@ -1856,6 +1871,12 @@ class Script:
         sub_script.change_listener = partial(self._chain_change_listener, sub_script)
         return sub_script
 
+    def _get_service_call(self, step: int) -> service.CompiledServiceCall:
+        if not (service_call := self._service_calls.get(step)):
+            service_call = service.CompiledServiceCall(self._hass, self.sequence[step])
+            self._service_calls[step] = service_call
+        return service_call
+
     def _get_repeat_script(self, step: int) -> Script:
         if not (sub_script := self._repeat_script.get(step)):
             sub_script = self._prep_repeat_script(step)
@@ -18,6 +18,7 @@ from homeassistant.util import decorator
 from homeassistant.util.yaml import dumper
 
 from . import config_validation as cv
+from .compiled_schema import CompiledSchema
 
 SELECTORS: decorator.Registry[str, type[Selector]] = decorator.Registry()
 
@@ -1258,7 +1259,7 @@ class TargetSelector(Selector[TargetSelectorConfig]):
         }
     )
 
-    TARGET_SELECTION_SCHEMA = vol.Schema(cv.TARGET_SERVICE_FIELDS)
+    TARGET_SELECTION_SCHEMA = CompiledSchema(cv.TARGET_SERVICE_FIELDS)
 
     def __init__(self, config: TargetSelectorConfig | None = None) -> None:
         """Instantiate a selector."""
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from contextlib import suppress
+from copy import deepcopy
 import dataclasses
 from enum import Enum
 from functools import cache, partial
+import inspect
 import logging
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
@@ -32,6 +36,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -39,6 +44,7 @@ from homeassistant.core import (
     ServiceResponse,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -65,10 +71,12 @@ from . import (
 )
 from .group import expand_entity_ids
 from .selector import TargetSelector
+from .singleton import singleton
 from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -80,6 +88,20 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+DATA_TARGET_INDEX: HassKey[TargetIndex] = HassKey("service_target_index")
+
+# Entity registry changes that can change how targets resolve
+_ENTITY_TARGET_FIELDS = {
+    "area_id",
+    "device_id",
+    "disabled_by",
+    "entity_category",
+    "entity_id",
+    "hidden_by",
+    "labels",
+}
+# Device registry changes that can change how targets resolve
+_DEVICE_TARGET_FIELDS = {"area_id", "labels"}
 
 
 @cache
@@ -359,6 +381,19 @@ def async_prepare_call_from_config(
                 f"Invalid config for calling service: {ex}"
             ) from ex
 
+    domain, service = _render_domain_service(config, variables)
+    return {
+        "domain": domain,
+        "service": service,
+        "service_data": _render_service_data(config, variables),
+        "target": _render_target(hass, config, variables),
+    }
+
+
+def _render_domain_service(
+    config: ConfigType, variables: TemplateVarsType
+) -> tuple[str, str]:
+    """Render the domain and service of a service call config."""
     if CONF_ACTION in config:
         domain_service = config[CONF_ACTION]
     else:
@@ -378,7 +413,13 @@ def async_prepare_call_from_config(
             ) from ex
 
     domain, _, service = domain_service.partition(".")
+    return domain, service
 
+
+def _render_target(
+    hass: HomeAssistant, config: ConfigType, variables: TemplateVarsType
+) -> dict[str, Any]:
+    """Render the target of a service call config."""
     target = {}
     if CONF_TARGET in config:
         conf = config[CONF_TARGET]
@@ -405,9 +446,21 @@ def async_prepare_call_from_config(
                 f"Template rendered invalid entity IDs: {target[CONF_ENTITY_ID]}"
             ) from ex
 
+    if CONF_SERVICE_ENTITY_ID in config:
+        target[ATTR_ENTITY_ID] = config[CONF_SERVICE_ENTITY_ID]
+
+    return target
+
+
+def _render_service_data(
+    config: ConfigType,
+    variables: TemplateVarsType,
+    data_keys: Iterable[str] = (CONF_SERVICE_DATA, CONF_SERVICE_DATA_TEMPLATE),
+) -> dict[str, Any]:
+    """Render the data of a service call config."""
     service_data = {}
 
-    for conf in (CONF_SERVICE_DATA, CONF_SERVICE_DATA_TEMPLATE):
+    for conf in data_keys:
         if conf not in config:
             continue
         try:
@@ -420,18 +473,102 @@ def async_prepare_call_from_config(
         except TemplateError as ex:
             raise HomeAssistantError(f"Error rendering data template: {ex}") from ex
 
-    if CONF_SERVICE_ENTITY_ID in config:
-        if target:
-            target[ATTR_ENTITY_ID] = config[CONF_SERVICE_ENTITY_ID]
-        else:
-            target = {ATTR_ENTITY_ID: config[CONF_SERVICE_ENTITY_ID]}
+    return service_data
 
-    return {
-        "domain": domain,
-        "service": service,
-        "service_data": service_data,
-        "target": target,
-    }
+
+def _is_static_target(config: ConfigType) -> bool:
+    """Return if the target of a service call config is the same on every call.
+
+    Targets referring to entities by registry id are resolved on every call
+    because the entity id of the entity can change.
+    """
+    if template.is_complex(config.get(CONF_TARGET)):
+        return False
+    if CONF_ENTITY_ID not in (target := config.get(CONF_TARGET) or {}):
+        return True
+    try:
+        entity_ids = cv.comp_entity_ids_or_uuids(target[CONF_ENTITY_ID])
+    except vol.Invalid:
+        return False
+    return entity_ids in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE) or all(
+        valid_entity_id(entity_id) for entity_id in entity_ids
+    )
+
+
+class CompiledServiceCall:
+    """A service call config with the parts without templates resolved once.
+
+    Scripts call the same service call config on every run; only the parts
+    of the config which contain templates are rendered for each call.
+    """
+
+    __slots__ = (
+        "_config",
+        "_data_templates",
+        "_domain_service",
+        "_hass",
+        "_service_data",
+        "_target",
+    )
+
+    def __init__(self, hass: HomeAssistant, config: ConfigType) -> None:
+        """Resolve the static parts of a service call config."""
+        self._hass = hass
+        self._config = config
+        self._domain_service: tuple[str, str] | None = None
+        self._target: dict[str, Any] | None = None
+        self._service_data: dict[str, Any] = {}
+        # Data which has to be rendered on each call; data later in the
+        # config overrides earlier data so once a part has templates all
+        # parts after it are rendered on each call too
+        self._data_templates: list[str] = []
+        for conf in (CONF_SERVICE_DATA, CONF_SERVICE_DATA_TEMPLATE):
+            if conf not in config:
+                continue
+            if self._data_templates or template.is_complex(config[conf]):
+                self._data_templates.append(conf)
+                continue
+            try:
+                self._service_data.update(_render_service_data(config, None, (conf,)))
+            except HomeAssistantError:
+                self._data_templates.append(conf)
+
+        # Static parts which fail to resolve are left to async_render so
+        # the error is raised when the service is called
+        if not isinstance(
+            config.get(CONF_ACTION, config.get(CONF_SERVICE_TEMPLATE)),
+            template.Template,
+        ):
+            with suppress(HomeAssistantError):
+                self._domain_service = _render_domain_service(config, None)
+        if _is_static_target(config):
+            with suppress(HomeAssistantError):
+                self._target = _render_target(hass, config, None)
+
+    @callback
+    def async_render(self, variables: TemplateVarsType = None) -> ServiceParams:
+        """Return the parameters to call the service with."""
+        config = self._config
+        domain, service = self._domain_service or _render_domain_service(
+            config, variables
+        )
+        # The service call may change the data and target it is passed,
+        # including nested lists and dicts
+        service_data = deepcopy(self._service_data)
+        if self._data_templates:
+            service_data.update(
+                _render_service_data(config, variables, self._data_templates)
+            )
+        return {
+            "domain": domain,
+            "service": service,
+            "service_data": service_data,
+            "target": (
+                _render_target(self._hass, config, variables)
+                if self._target is None
+                else deepcopy(self._target)
+            ),
+        }
 
 
 @bind_hass
@@ -501,6 +638,229 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+def _is_targetable(entry: entity_registry.RegistryEntry) -> bool:
+    """Return if an entity can be targeted through an area, device or label.
+
+    Hidden entities and config or diagnostic entities are only
+    targeted by their entity id.
+    """
+    return entry.entity_category is None and entry.hidden_by is None
+
+
+class TargetIndex:
+    """Reverse index from areas, floors, labels and devices to their targets.
+
+    Resolved targets are computed from the registries the first time
+    they are used and kept until a registry update can change them,
+    so repeated service calls resolve in time proportional to the result.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._entities: entity_registry.EntityRegistryItems | None = None
+        self._devices: device_registry.ActiveDeviceRegistryItems | None = None
+        self._areas: area_registry.AreaRegistryItems | None = None
+        # Depend on the entity registry
+        self._device_entities: dict[str, frozenset[str]] = {}
+        self._label_entities: dict[str, frozenset[str]] = {}
+        # Depend on the entity and device registries
+        self._area_entities: dict[str, frozenset[str]] = {}
+        # Depend on the device registry
+        self._area_devices: dict[str, frozenset[str]] = {}
+        self._label_devices: dict[str, frozenset[str]] = {}
+        # Depend on the area registry
+        self._floor_areas: dict[str, frozenset[str]] = {}
+        self._label_areas: dict[str, frozenset[str]] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for registry updates."""
+        bus = self._hass.bus
+        bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_entity_registry_updated,
+        )
+        bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_registry_updated,
+        )
+        bus.async_listen(
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            self._async_area_registry_updated,
+        )
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[entity_registry.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Forget targets which depend on the entity registry."""
+        data = event.data
+        if data["action"] == "update" and not (
+            _ENTITY_TARGET_FIELDS.intersection(data["changes"])
+        ):
+            return
+        self._async_clear_entities()
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[device_registry.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Forget targets which depend on the device registry."""
+        data = event.data
+        if data["action"] == "update" and not (
+            _DEVICE_TARGET_FIELDS.intersection(data["changes"])
+        ):
+            return
+        self._async_clear_devices()
+
+    @callback
+    def _async_area_registry_updated(
+        self, event: Event[area_registry.EventAreaRegistryUpdatedData]
+    ) -> None:
+        """Forget targets which depend on the area registry."""
+        self._async_clear_areas()
+
+    @callback
+    def _async_clear_entities(self) -> None:
+        """Forget targets which depend on the entity registry."""
+        self._device_entities.clear()
+        self._label_entities.clear()
+        self._area_entities.clear()
+
+    @callback
+    def _async_clear_devices(self) -> None:
+        """Forget targets which depend on the device registry."""
+        self._area_entities.clear()
+        self._area_devices.clear()
+        self._label_devices.clear()
+
+    @callback
+    def _async_clear_areas(self) -> None:
+        """Forget targets which depend on the area registry."""
+        self._floor_areas.clear()
+        self._label_areas.clear()
+
+    @callback
+    def async_refresh(
+        self,
+        entities: entity_registry.EntityRegistryItems,
+        devices: device_registry.ActiveDeviceRegistryItems,
+        areas: area_registry.AreaRegistryItems,
+    ) -> None:
+        """Forget everything if a registry was loaded or replaced."""
+        if entities is not self._entities:
+            self._entities = entities
+            self._async_clear_entities()
+        if devices is not self._devices:
+            self._devices = devices
+            self._async_clear_devices()
+        if areas is not self._areas:
+            self._areas = areas
+            self._async_clear_areas()
+
+    @callback
+    def async_device_entities(self, device_id: str) -> frozenset[str]:
+        """Return the targetable entities of a device."""
+        if (entity_ids := self._device_entities.get(device_id)) is None:
+            assert self._entities is not None
+            entity_ids = self._device_entities[device_id] = frozenset(
+                entry.entity_id
+                for entry in self._entities.get_entries_for_device_id(device_id)
+                if _is_targetable(entry)
+            )
+        return entity_ids
+
+    @callback
+    def async_area_devices(self, area_id: str) -> frozenset[str]:
+        """Return the devices in an area."""
+        if (device_ids := self._area_devices.get(area_id)) is None:
+            assert self._devices is not None
+            device_ids = self._area_devices[area_id] = frozenset(
+                device_entry.id
+                for device_entry in self._devices.get_devices_for_area_id(area_id)
+            )
+        return device_ids
+
+    @callback
+    def async_area_entities(self, area_id: str) -> frozenset[str]:
+        """Return the targetable entities in an area.
+
+        Entities of devices in the area are included
+        unless the entity has its own area.
+        """
+        if (entity_ids := self._area_entities.get(area_id)) is None:
+            assert self._entities is not None
+            entities = self._entities
+            found = {
+                entry.entity_id
+                for entry in entities.get_entries_for_area_id(area_id)
+                if _is_targetable(entry)
+            }
+            found.update(
+                entry.entity_id
+                for device_id in self.async_area_devices(area_id)
+                for entry in entities.get_entries_for_device_id(device_id)
+                if _is_targetable(entry) and not entry.area_id
+            )
+            entity_ids = self._area_entities[area_id] = frozenset(found)
+        return entity_ids
+
+    @callback
+    def async_floor_areas(self, floor_id: str) -> frozenset[str]:
+        """Return the areas on a floor."""
+        if (area_ids := self._floor_areas.get(floor_id)) is None:
+            assert self._areas is not None
+            area_ids = self._floor_areas[floor_id] = frozenset(
+                area_entry.id
+                for area_entry in self._areas.get_areas_for_floor(floor_id)
+            )
+        return area_ids
+
+    @callback
+    def async_label_entities(self, label_id: str) -> frozenset[str]:
+        """Return the targetable entities with a label."""
+        if (entity_ids := self._label_entities.get(label_id)) is None:
+            assert self._entities is not None
+            entity_ids = self._label_entities[label_id] = frozenset(
+                entry.entity_id
+                for entry in self._entities.get_entries_for_label(label_id)
+                if _is_targetable(entry)
+            )
+        return entity_ids
+
+    @callback
+    def async_label_devices(self, label_id: str) -> frozenset[str]:
+        """Return the devices with a label."""
+        if (device_ids := self._label_devices.get(label_id)) is None:
+            assert self._devices is not None
+            device_ids = self._label_devices[label_id] = frozenset(
+                device_entry.id
+                for device_entry in self._devices.get_devices_for_label(label_id)
+            )
+        return device_ids
+
+    @callback
+    def async_label_areas(self, label_id: str) -> frozenset[str]:
+        """Return the areas with a label."""
+        if (area_ids := self._label_areas.get(label_id)) is None:
+            assert self._areas is not None
+            area_ids = self._label_areas[label_id] = frozenset(
+                area_entry.id
+                for area_entry in self._areas.get_areas_for_label(label_id)
+            )
+        return area_ids
+
+
+@callback
+@singleton(DATA_TARGET_INDEX)
+def async_get_target_index(hass: HomeAssistant) -> TargetIndex:
+    """Return the target index."""
+    index = TargetIndex(hass)
+    index.async_setup()
+    return index
+
+
 @bind_hass
 def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
@@ -526,9 +886,12 @@ def async_extract_referenced_entity_ids(
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
+    index = async_get_target_index(hass)
+    index.async_refresh(
+        entity_registry.async_get(hass).entities, dev_reg.devices, area_reg.areas
+    )
 
     if selector.floor_ids:
         floor_reg = floor_registry.async_get(hass)
@@ -550,26 +913,13 @@ def async_extract_referenced_entity_ids(
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
-
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
-
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
+            selected.indirectly_referenced.update(index.async_label_entities(label_id))
+            selected.referenced_devices.update(index.async_label_devices(label_id))
+            selected.referenced_areas.update(index.async_label_areas(label_id))
 
     # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
+    for floor_id in selector.floor_ids:
+        selected.referenced_areas.update(index.async_floor_areas(floor_id))
 
     selected.referenced_areas.update(selector.area_ids)
     selected.referenced_devices.update(selector.device_ids)
@@ -578,53 +928,14 @@ def async_extract_referenced_entity_ids(
         return selected
 
     # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (entry.entity_category is None and entry.hidden_by is None)
-    )
+    for device_id in selected.referenced_devices:
+        selected.indirectly_referenced.update(index.async_device_entities(device_id))
 
-    # Find devices for targeted areas
-    referenced_devices_by_area: set[str] = set()
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            referenced_devices_by_area.update(
-                device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
-            )
-    selected.referenced_devices.update(referenced_devices_by_area)
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by area through device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in referenced_devices_by_area
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-            )
-        )
-    )
+    # Find devices for targeted areas and add indirectly
+    # referenced by area, directly or through a device
+    for area_id in selected.referenced_areas:
+        selected.referenced_devices.update(index.async_area_devices(area_id))
+        selected.indirectly_referenced.update(index.async_area_entities(area_id))
 
     return selected
 
@@ -1012,6 +1323,13 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    start = time.monotonic()
+    batches: dict[EntityPlatform, list[Entity]] = {}
+    if isinstance(func, str) and not return_response:
+        batches = _get_entity_batches(entities)
+    batched = {entity for batch in batches.values() for entity in batch}
+    single_entities = [entity for entity in entities if entity not in batched]
+
     # Use asyncio.gather here to ensure the returned results
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
@@ -1019,16 +1337,32 @@ async def entity_service_call(
             entity.async_request_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
-            for entity in entities
+            for entity in single_entities
+        ],
+        *[
+            _handle_entity_batch(hass, batch, cast(str, func), data, call.context)
+            for batch in batches.values()
         ],
         return_exceptions=True,
     )
 
     response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
+    for entity, result in zip(single_entities, results, strict=False):
         if isinstance(result, BaseException):
             raise result from None
         response_data[entity.entity_id] = result
+    for result in results[len(single_entities) :]:
+        if isinstance(result, BaseException):
+            raise result from None
+
+    _LOGGER.debug(
+        "Service %s.%s called on %s entities with %s batches in %.3f seconds",
+        call.domain,
+        call.service,
+        len(entities),
+        len(batches),
+        time.monotonic() - start,
+    )
 
     tasks: list[asyncio.Task[None]] = []
 
@@ -1050,6 +1384,64 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+def _get_entity_batches(entities: list[Entity]) -> dict[EntityPlatform, list[Entity]]:
+    """Group entities by platforms which can handle a service call in one go."""
+    by_platform: dict[EntityPlatform, list[Entity]] = {}
+    for entity in entities:
+        if (platform := entity.platform) is not None:
+            by_platform.setdefault(platform, []).append(entity)
+    return {
+        platform: batch
+        for platform, batch in by_platform.items()
+        if len(batch) > 1
+        and inspect.iscoroutinefunction(
+            getattr(platform.platform, "async_handle_entity_service_batch", None)
+        )
+    }
+
+
+async def _handle_entity_batch(
+    hass: HomeAssistant,
+    entities: list[Entity],
+    func: str,
+    data: dict | ServiceCall,
+    context: Context,
+) -> None:
+    """Handle calling a service method on entities of the same platform.
+
+    The platform handles the call for all entities at once, for example
+    with a single request to a bridge or a multicast. If the platform
+    declines, the service method is called on each entity.
+
+    The batch takes one slot of the platform's parallel updates semaphore,
+    which all entities of the platform share.
+    """
+    platform = entities[0].platform.platform
+    assert platform is not None
+    for entity in entities:
+        entity.async_set_context(context)
+
+    if await entities[0].async_request_call(
+        platform.async_handle_entity_service_batch(
+            hass, entities, func, cast(dict[str, Any], data)
+        )
+    ):
+        return
+
+    results = await asyncio.gather(
+        *[
+            entity.async_request_call(
+                _handle_entity_call(hass, entity, func, data, context)
+            )
+            for entity in entities
+        ],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result from None
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -5,33 +5,55 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable, Mapping
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
 import logging
+import os
 import pathlib
 import string
+import sys
 from typing import Any
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import Event, HomeAssistant, async_get_hass, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    Event,
+    HomeAssistant,
+    async_get_hass,
+    callback,
+)
+from homeassistant.generated.languages import LANGUAGES
 from homeassistant.loader import (
     Integration,
     async_get_config_flows,
     async_get_integrations,
     bind_hass,
 )
-from homeassistant.util.json import load_json
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
+from homeassistant.util.json import json_loads, load_json
 
 from . import singleton
+from .json import json_bytes
+from .storage import STORAGE_DIR
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+TRANSLATION_PACKS_DIR = "translation_packs"
+TRANSLATION_PACK_VERSION = 3
+# Delay writing a translation pack so loads close together are saved once
+TRANSLATION_PACK_SAVE_DELAY = 10
+
+type _TranslationSource = tuple[Any, ...]
+
 
 def recursive_flatten(
     prefix: str, data: dict[str, dict[str, Any] | str]
@@ -42,7 +64,8 @@ def recursive_flatten(
         if isinstance(value, dict):
             output.update(recursive_flatten(f"{prefix}{key}.", value))
         else:
-            output[f"{prefix}{key}"] = value
+            # Keys are the same for every language, share them between the caches
+            output[sys.intern(f"{prefix}{key}")] = value
     return output
 
 
@@ -131,6 +154,107 @@ async def _async_get_component_strings(
     return translations_by_language
 
 
+def _file_signature(path: pathlib.Path) -> tuple[int, int] | None:
+    """Return the modification time and size of a file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_translation_sources(
+    languages: Iterable[str], integrations: dict[str, Integration]
+) -> dict[str, _TranslationSource]:
+    """Return what the translations of integrations are built from."""
+    return {
+        domain: (
+            integration.name,
+            str(integration.file_path),
+            *(
+                _file_signature(
+                    integration.file_path / "translations" / f"{language}.json"
+                )
+                if integration.has_translations
+                else None
+                for language in languages
+            ),
+        )
+        for domain, integration in integrations.items()
+    }
+
+
+@dataclass(slots=True)
+class _TranslationPack:
+    """Flattened translations of a language which are stored on disk.
+
+    Every category is encoded as JSON on its own and only decoded when it
+    is requested, so categories which are never used are not kept as dicts.
+    """
+
+    # Sources of the components stored in the pack
+    sources: dict[str, _TranslationSource]
+    packed: dict[str, str]
+    # Components in each category of the pack
+    category_components: dict[str, frozenset[str]] = field(default_factory=dict)
+    unpacked: dict[str, dict[str, dict[str, str]]] = field(default_factory=dict)
+    # Components taken from the pack
+    accepted: set[str] = field(default_factory=set)
+    # Sources of the components loaded since the start
+    current_sources: dict[str, _TranslationSource] = field(default_factory=dict)
+    save_handle: asyncio.TimerHandle | None = None
+    unsub_final_write: CALLBACK_TYPE | None = None
+
+
+def _source_from_json(source: list[Any]) -> _TranslationSource:
+    """Return the source of a component stored in a pack."""
+    return tuple(tuple(item) if isinstance(item, list) else item for item in source)
+
+
+def _read_translation_pack(config_dir: str, language: str) -> _TranslationPack | None:
+    """Read the translation pack of a language.
+
+    Returns None if packs can not be stored because there is no storage
+    directory.
+    """
+    storage_dir = os.path.join(config_dir, STORAGE_DIR)
+    if not os.path.isdir(storage_dir):
+        return None
+    path = os.path.join(storage_dir, TRANSLATION_PACKS_DIR, f"{language}.pack")
+    try:
+        with open(path, "rb") as file:
+            data = json_loads(file.read())
+        if data["version"] != TRANSLATION_PACK_VERSION:
+            return _TranslationPack({}, {})
+        sources = {
+            domain: _source_from_json(source)
+            for domain, source in data["sources"].items()
+        }
+        category_components = {
+            category: frozenset(components)
+            for category, components in data["category_components"].items()
+        }
+        packed: dict[str, str] = data["packed"]
+    except FileNotFoundError:
+        return _TranslationPack({}, {})
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Ignoring invalid translation pack %s", path, exc_info=True)
+        return _TranslationPack({}, {})
+    return _TranslationPack(sources, packed, category_components)
+
+
+def _write_translation_pack(config_dir: str, language: str, data: bytes) -> None:
+    """Write the translation pack of a language."""
+    packs_dir = os.path.join(config_dir, STORAGE_DIR, TRANSLATION_PACKS_DIR)
+    try:
+        os.makedirs(packs_dir, exist_ok=True)
+        write_utf8_file_atomic(
+            os.path.join(packs_dir, f"{language}.pack"), data, mode="wb"
+        )
+    except (OSError, WriteError) as err:
+        _LOGGER.debug("Unable to write translation pack for %s: %s", language, err)
+
+
 @dataclass(slots=True)
 class _TranslationsCacheData:
     """Data for the translation cache.
@@ -142,6 +266,7 @@ class _TranslationsCacheData:
 
     loaded: dict[str, set[str]]
     cache: dict[str, dict[str, dict[str, dict[str, str]]]]
+    packs: dict[str, _TranslationPack | None] = field(default_factory=dict)
 
 
 class _TranslationCache:
@@ -196,6 +321,8 @@ class _TranslationCache:
         components: set[str],
     ) -> dict[str, str]:
         """Read resources from the cache."""
+        if (pack := self.cache_data.packs.get(language)) and category in pack.packed:
+            self._unpack_category(language, pack, category)
         category_cache = self.cache_data.cache.get(language, {}).get(category, {})
         # If only one component was requested, return it directly
         # to avoid merging the dictionaries and keeping additional
@@ -210,15 +337,11 @@ class _TranslationCache:
 
     async def _async_load(self, language: str, components: set[str]) -> None:
         """Populate the cache for a given set of components."""
-        loaded = self.cache_data.loaded
         _LOGGER.debug(
             "Cache miss for %s: %s",
             language,
             components,
         )
-        # Fetch the English resources, as a fallback for missing keys
-        languages = [LOCALE_EN] if language == LOCALE_EN else [LOCALE_EN, language]
-
         integrations: dict[str, Integration] = {}
         ints_or_excs = await async_get_integrations(self.hass, components)
         for domain, int_or_exc in ints_or_excs.items():
@@ -229,6 +352,38 @@ class _TranslationCache:
                 continue
             integrations[domain] = int_or_exc
 
+        await self._async_load_integrations(language, components, integrations)
+
+    async def _async_load_integrations(
+        self,
+        language: str,
+        components: set[str],
+        integrations: dict[str, Integration],
+    ) -> None:
+        """Populate the cache for components from the pack or their files."""
+        loaded = self.cache_data.loaded
+        loaded_components = loaded.setdefault(language, set())
+        # Fetch the English resources, as a fallback for missing keys
+        languages = [LOCALE_EN] if language == LOCALE_EN else [LOCALE_EN, language]
+
+        if (pack := await self._async_get_pack(language)) is not None:
+            sources = await self.hass.async_add_executor_job(
+                _get_translation_sources, languages, integrations
+            )
+            pack.current_sources.update(sources)
+            if packed_components := {
+                domain
+                for domain, source in sources.items()
+                if pack.sources.get(domain) == source
+            }:
+                _LOGGER.debug(
+                    "Using translation pack for %s: %s", language, packed_components
+                )
+                self._accept_packed(language, pack, packed_components)
+                loaded_components.update(packed_components)
+                if not (components := components - packed_components):
+                    return
+
         translation_by_language_strings = await _async_get_component_strings(
             self.hass, languages, components, integrations
         )
@@ -253,7 +408,155 @@ class _TranslationCache:
                 )
                 loaded_english_components.update(components)
 
-        loaded[language].update(components)
+        loaded_components.update(components)
+
+        if pack is not None:
+            self._async_delay_pack_save(language, pack)
+
+    async def _async_get_pack(self, language: str) -> _TranslationPack | None:
+        """Return the translation pack of a language, read it the first time."""
+        packs = self.cache_data.packs
+        if language not in LANGUAGES:
+            # The language is used in the file name of the pack
+            return None
+        if language not in packs:
+            packs[language] = await self.hass.async_add_executor_job(
+                _read_translation_pack, self.hass.config.config_dir, language
+            )
+        return packs[language]
+
+    @callback
+    def _accept_packed(
+        self, language: str, pack: _TranslationPack, components: set[str]
+    ) -> None:
+        """Use the translations of components stored in a pack."""
+        pack.accepted.update(components)
+        cached = self.cache_data.cache.setdefault(language, {})
+        for category, packed_components in pack.unpacked.items():
+            category_cache = cached.setdefault(category, {})
+            for component in components.intersection(packed_components):
+                category_cache[component] = packed_components[component]
+
+    @callback
+    def _unpack_category(
+        self, language: str, pack: _TranslationPack, category: str
+    ) -> None:
+        """Decode a category of a translation pack into the cache."""
+        packed_components: dict[str, dict[str, str]] = {
+            component: {sys.intern(key): value for key, value in resources.items()}
+            for component, resources in json_loads(pack.packed.pop(category)).items()
+        }
+        pack.unpacked[category] = packed_components
+        category_cache = self.cache_data.cache.setdefault(language, {}).setdefault(
+            category, {}
+        )
+        for component in pack.accepted.intersection(packed_components):
+            category_cache[component] = packed_components[component]
+
+    @callback
+    def _async_delay_pack_save(self, language: str, pack: _TranslationPack) -> None:
+        """Write the translation pack of a language after a delay.
+
+        A pack which was not written when Home Assistant stops is written
+        during the final write, no write is started after it.
+        """
+        if pack.unsub_final_write is None:
+            pack.unsub_final_write = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE,
+                partial(self._async_final_write_pack, language),
+            )
+        if pack.save_handle is None and self.hass.state is not CoreState.stopping:
+            pack.save_handle = self.hass.loop.call_later(
+                TRANSLATION_PACK_SAVE_DELAY, self._async_schedule_pack_save, language
+            )
+
+    @callback
+    def _async_schedule_pack_save(self, language: str) -> None:
+        """Write the translation pack of a language in the background."""
+        if (pack := self.cache_data.packs.get(language)) is not None:
+            pack.save_handle = None
+        if self.hass.state is CoreState.stopping:
+            # Written during the final write
+            return
+        self.hass.async_create_background_task(
+            self._async_save_pack(language), f"translation pack save {language}"
+        )
+
+    async def _async_final_write_pack(self, language: str, _event: Event) -> None:
+        """Write the translation pack of a language before Home Assistant stops."""
+        if (pack := self.cache_data.packs.get(language)) is not None:
+            pack.unsub_final_write = None
+        await self._async_save_pack(language)
+
+    async def _async_save_pack(self, language: str) -> None:
+        """Write the loaded translations of a language to its pack.
+
+        Categories of the pack which did not change are written as they were
+        read, only the categories with changed components are decoded and
+        encoded again.
+        """
+        if (pack := self.cache_data.packs.get(language)) is None:
+            return
+        if pack.save_handle is not None:
+            pack.save_handle.cancel()
+            pack.save_handle = None
+        if pack.unsub_final_write is not None:
+            pack.unsub_final_write()
+            pack.unsub_final_write = None
+        components = self.cache_data.loaded.get(language, set()).intersection(
+            pack.current_sources
+        )
+        # Components of the pack which were not loaded since the start are
+        # kept as they are, they are checked when they are loaded
+        not_loaded = set(pack.sources).difference(pack.current_sources)
+        unchanged = pack.accepted | not_loaded
+        loaded_from_files = components - pack.accepted
+        cached = self.cache_data.cache.get(language, {})
+        packed: dict[str, str] = {}
+        category_components: dict[str, frozenset[str]] = {}
+        for category in list(pack.packed):
+            kept = pack.category_components[category]
+            if kept <= unchanged and loaded_from_files.isdisjoint(
+                cached.get(category, ())
+            ):
+                packed[category] = pack.packed[category]
+                category_components[category] = kept
+            else:
+                self._unpack_category(language, pack, category)
+        for category, category_cache in cached.items():
+            if category in packed:
+                continue
+            resources = {
+                component: category_cache[component]
+                for component in components.intersection(category_cache)
+            }
+            if unpacked := pack.unpacked.get(category):
+                for component in not_loaded.intersection(unpacked):
+                    resources[component] = unpacked[component]
+            packed[category] = json_bytes(resources).decode()
+            category_components[category] = frozenset(resources)
+        sources = {
+            component: pack.current_sources[component] for component in components
+        }
+        for component in not_loaded:
+            sources[component] = pack.sources[component]
+        await self.hass.async_add_executor_job(
+            _write_translation_pack,
+            self.hass.config.config_dir,
+            language,
+            json_bytes(
+                {
+                    "version": TRANSLATION_PACK_VERSION,
+                    "sources": sources,
+                    "packed": packed,
+                    "category_components": {
+                        category: sorted(components)
+                        for category, components in category_components.items()
+                    },
+                }
+            ),
+        )
+        pack.sources = sources
 
     def _validate_placeholders(
         self,
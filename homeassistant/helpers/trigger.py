@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 from dataclasses import dataclass, field
+from datetime import timedelta
 import functools
 import logging
 from typing import Any, Protocol, TypedDict, cast
@@ -47,6 +48,13 @@ _PLATFORM_ALIASES = {
 DATA_PLUGGABLE_ACTIONS: HassKey[defaultdict[tuple, PluggableActionsEntry]] = HassKey(
     "pluggable_actions"
 )
+DATA_SHARED_TRIGGERS: HassKey[dict[tuple[str, Hashable], SharedTrigger]] = HassKey(
+    "shared_triggers"
+)
+
+# Trigger options which differ per automation and are handled for each
+# automation attached to a shared trigger
+_PER_AUTOMATION_KEYS = {CONF_ALIAS, CONF_ENABLED, CONF_ID, CONF_VARIABLES}
 
 
 class TriggerProtocol(Protocol):
@@ -71,6 +79,15 @@ class TriggerProtocol(Protocol):
     ) -> CALLBACK_TYPE:
         """Attach a trigger."""
 
+    async def async_get_trigger_key(
+        self, hass: HomeAssistant, config: ConfigType
+    ) -> Hashable | None:
+        """Return a key of the trigger to share it, or None to not share it.
+
+        Triggers with the same key are attached once for all automations.
+        Optional.
+        """
+
 
 class TriggerActionType(Protocol):
     """Protocol type for trigger action callback."""
@@ -299,6 +316,140 @@ def _trigger_action_wrapper(
     return wrapper_func
 
 
+class _UnsharableTriggerError(Exception):
+    """Raised when a trigger config can't be shared."""
+
+
+def _freeze_trigger_config(value: Any) -> Hashable:
+    """Return a hashable copy of a trigger config value."""
+    if isinstance(value, Template):
+        raise _UnsharableTriggerError
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                (key, _freeze_trigger_config(item))
+                for key, item in value.items()
+                if key not in _PER_AUTOMATION_KEYS
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_trigger_config(item) for item in value)
+    if isinstance(value, (str, int, float, bool, timedelta)) or value is None:
+        return value
+    raise _UnsharableTriggerError
+
+
+def trigger_config_key(config: ConfigType) -> Hashable | None:
+    """Return a key of a trigger config to share the trigger.
+
+    Options which are handled per automation, like the id and variables,
+    are not part of the key. Triggers with templates are not shared.
+    Platforms must not share triggers which keep state per attach, like
+    the timers of a duration, since a later attach would reuse it.
+    """
+    try:
+        return _freeze_trigger_config(config)
+    except _UnsharableTriggerError:
+        return None
+
+
+class SharedTrigger:
+    """A trigger attached once for all automations with the same trigger.
+
+    The trigger data of each automation replaces the trigger data of the
+    shared trigger when the trigger fires.
+    """
+
+    __slots__ = ("_hass", "attach", "subscribers")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared trigger."""
+        self._hass = hass
+        self.attach: asyncio.Task[CALLBACK_TYPE] | None = None
+        self.subscribers: list[tuple[HassJob, TriggerData]] = []
+
+    @callback
+    def async_fire(
+        self, run_variables: dict[str, Any], context: Context | None = None
+    ) -> None:
+        """Run the action of each automation attached to the trigger."""
+        trigger = run_variables["trigger"]
+        for job, trigger_data in self.subscribers.copy():
+            self._hass.async_run_hass_job(
+                job,
+                {**run_variables, "trigger": {**trigger, **trigger_data}},
+                context,
+            )
+
+
+@callback
+def _async_detach_shared_trigger(attach: asyncio.Task[CALLBACK_TYPE]) -> None:
+    """Detach a shared trigger if it was attached."""
+    if not attach.cancelled() and attach.exception() is None:
+        attach.result()()
+
+
+async def _async_attach_shared_trigger(
+    hass: HomeAssistant,
+    platform: TriggerProtocol,
+    key: Hashable,
+    conf: ConfigType,
+    action: Callable,
+    info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach an automation to the shared trigger of its trigger config."""
+    shared_triggers = hass.data.setdefault(DATA_SHARED_TRIGGERS, {})
+    shared_key = (conf[CONF_PLATFORM], key)
+    if (shared := shared_triggers.get(shared_key)) is None:
+        shared = shared_triggers[shared_key] = SharedTrigger(hass)
+        shared.attach = create_eager_task(
+            platform.async_attach_trigger(
+                hass,
+                conf,
+                shared.async_fire,
+                TriggerInfo(
+                    domain=info["domain"],
+                    name=f"shared {conf[CONF_PLATFORM]} trigger",
+                    home_assistant_start=False,
+                    variables=None,
+                    trigger_data=TriggerData(id="", idx="", alias=None),
+                ),
+            )
+        )
+    subscriber = (
+        HassJob(action, f"shared trigger {info}"),
+        info["trigger_data"],
+    )
+    shared.subscribers.append(subscriber)
+
+    @callback
+    def async_remove() -> None:
+        """Detach the automation from the shared trigger."""
+        shared.subscribers.remove(subscriber)
+        if shared.subscribers:
+            return
+        if shared_triggers.get(shared_key) is shared:
+            del shared_triggers[shared_key]
+        if shared.attach is None:
+            return
+        if shared.attach.done():
+            _async_detach_shared_trigger(shared.attach)
+        else:
+            # Detach once attached, nobody else will
+            shared.attach.add_done_callback(_async_detach_shared_trigger)
+
+    assert shared.attach is not None
+    try:
+        await asyncio.shield(shared.attach)
+    except BaseException:
+        # Don't reuse a trigger which failed to attach
+        async_remove()
+        if shared_triggers.get(shared_key) is shared:
+            del shared_triggers[shared_key]
+        raise
+    return async_remove
+
+
 async def async_initialize_triggers(
     hass: HomeAssistant,
     trigger_config: list[ConfigType],
@@ -337,11 +488,23 @@ async def async_initialize_triggers(
             trigger_data=trigger_data,
         )
 
+        trigger_action = _trigger_action_wrapper(hass, action, conf)
+        if (
+            hasattr(platform, "async_get_trigger_key")
+            and (key := await platform.async_get_trigger_key(hass, conf)) is not None
+        ):
+            triggers.append(
+                create_eager_task(
+                    _async_attach_shared_trigger(
+                        hass, platform, key, conf, trigger_action, info
+                    )
+                )
+            )
+            continue
+
         triggers.append(
             create_eager_task(
-                platform.async_attach_trigger(
-                    hass, conf, _trigger_action_wrapper(hass, action, conf), info
-                )
+                platform.async_attach_trigger(hass, conf, trigger_action, info)
             )
         )
 
@@ -7,7 +7,6 @@ import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
 from datetime import datetime, timedelta
 import logging
-from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol, TypeVar
 import urllib.error
@@ -27,9 +26,10 @@ from homeassistant.exceptions import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity
 from .debounce import Debouncer
 from .frame import report_usage
+from .poll_scheduler import async_get_poll_scheduler
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -97,14 +97,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
-        )
-
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
+        # Loop time of the last refresh, the next one waits an interval after it
+        self._last_refresh: float | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
@@ -174,6 +170,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
         self._async_unsub_refresh()
+        async_get_poll_scheduler(self.hass).async_remove(self)
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
 
@@ -181,6 +178,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     def _unschedule_refresh(self) -> None:
         """Unschedule any pending refresh since there is no longer any listeners."""
         self._async_unsub_refresh()
+        async_get_poll_scheduler(self.hass).async_remove(self)
         self._debounced_refresh.async_cancel()
 
     def async_contexts(self) -> Generator[Any]:
@@ -227,14 +225,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         # We use loop.call_at because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
-        # calling dt_util.utcnow() on every update.
+        # calling dt_util.utcnow() on every update. The refresh
+        # is spread across the interval to avoid a thundering herd.
         hass = self.hass
-        loop = hass.loop
-
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        name = self.name
+        if self.config_entry:
+            name = f"{name}.{self.config_entry.entry_id}"
+        next_refresh = async_get_poll_scheduler(hass).async_next_poll(
+            self, name, self._update_interval_seconds, self._last_refresh
         )
-        self._unsub_refresh = loop.call_at(
+        self._unsub_refresh = hass.loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
 
@@ -362,8 +362,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or (scheduled and self.hass.is_stopping):
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
+        start = monotonic()
+        self._last_refresh = self.hass.loop.time()
 
         auth_failed = False
         previous_update_success = self.last_update_success
@@ -449,7 +449,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
+            if scheduled:
+                async_get_poll_scheduler(self.hass).async_record_poll(
+                    self, monotonic() - start
+                )
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
@@ -497,6 +501,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self.data = data
         self.last_update_success = True
+        self._last_refresh = self.hass.loop.time()
         self.logger.debug(
             "Manually updated %s data",
             self.name,
@@ -7,16 +7,33 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+import pathlib
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+import tracemalloc
 
-from homeassistant import core
+import voluptuous as vol
+
+from homeassistant import auth, config as conf_util, core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_registry as er,
+    script,
+    selector,
+    translation,
+)
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.yaml import Secrets
+from homeassistant.util.yaml.cache import YamlCache
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +325,285 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def write_entity_states(hass: core.HomeAssistant) -> float:
+    """Write the state of 400 power sensors a thousand times."""
+    # The entities are not added with a platform
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.CRITICAL)
+
+    class PowerSensor(Entity):
+        """A power sensor which updates every second."""
+
+        _attr_assumed_state = False
+        _attr_capability_attributes = {"state_class": "measurement"}
+        _attr_device_class = "power"
+        _attr_extra_state_attributes = {"phase": 1}
+        _attr_icon = "mdi:flash"
+        _attr_unit_of_measurement = "W"
+
+    entities = []
+    for idx in range(400):
+        entity = PowerSensor()
+        entity.hass = hass
+        entity.entity_id = f"sensor.power_{idx}"
+        entity._attr_name = f"Power {idx}"  # noqa: SLF001
+        entities.append(entity)
+
+    start = timer()
+
+    for value in range(1000):
+        for entity in entities:
+            entity._attr_state = value  # noqa: SLF001
+            entity.async_write_ha_state()
+
+    return timer() - start
+
+
+@benchmark
+async def run_script(hass: core.HomeAssistant) -> float:
+    """Run a script with 10 service calls ten thousand times."""
+    await er.async_load(hass)
+    calls = 0
+
+    @core.callback
+    def handle_call(call: core.ServiceCall) -> None:
+        nonlocal calls
+        calls += 1
+
+    hass.services.async_register("test", "set_level", handle_call)
+    sequence = [
+        {
+            "action": "test.set_level",
+            "target": {"entity_id": [f"light.kitchen_{idx}", "light.hall"]},
+            "data": {"brightness": idx * 10, "transition": 2},
+        }
+        for idx in range(9)
+    ]
+    sequence.append(
+        {
+            "action": "test.set_level",
+            "target": {"entity_id": "light.hall"},
+            "data": {"brightness": "{{ brightness }}"},
+        }
+    )
+    bench_script = script.Script(
+        hass, cv.SCRIPT_SCHEMA(sequence), "bench", "benchmark", script_mode="parallel"
+    )
+
+    start = timer()
+
+    for _ in range(10**4):
+        await bench_script.async_run({"brightness": 100}, core.Context())
+
+    assert calls == 10**5
+    return timer() - start
+
+
+@benchmark
+async def validate_access_tokens(hass: core.HomeAssistant) -> float:
+    """Validate the access tokens of 100 clients a million times."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = await manager.async_create_user("Bench")
+    access_tokens = []
+    for idx in range(100):
+        refresh_token = await manager.async_create_refresh_token(
+            user,
+            client_name=f"Exporter {idx}",
+            token_type=auth.models.TOKEN_TYPE_LONG_LIVED_ACCESS_TOKEN,
+        )
+        access_tokens.append(manager.async_create_access_token(refresh_token))
+
+    start = timer()
+
+    for _ in range(10**4):
+        for access_token in access_tokens:
+            assert manager.async_validate_access_token(access_token) is not None
+
+    runtime = timer() - start
+    info = manager.async_access_token_cache_info()
+    print(
+        f"Access token cache: {info['hits']} hits, {info['misses']} misses, "
+        f"{info['hits'] / (info['hits'] + info['misses']):.2%} hit rate"
+    )
+    return runtime
+
+
+def _write_yaml_config(config_dir: str) -> None:
+    """Write a configuration including 400 files with 5 template sensors each."""
+    os.mkdir(os.path.join(config_dir, "sensors"))
+    with open(
+        os.path.join(config_dir, conf_util.YAML_CONFIG_FILE), "w", encoding="utf-8"
+    ) as file:
+        file.write("template: !include_dir_merge_list sensors\n")
+    for idx in range(400):
+        with open(
+            os.path.join(config_dir, "sensors", f"sensor_{idx}.yaml"),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.writelines(
+                f"- sensor:\n"
+                f"    - name: Power {idx} {sensor}\n"
+                f"      unique_id: power_{idx}_{sensor}\n"
+                f"      unit_of_measurement: W\n"
+                f"      state: \"{{{{ states('sensor.input_{idx}') | float(0) }}}}\"\n"
+                for sensor in range(5)
+            )
+
+
+def _load_yaml_config(config_dir: str) -> float:
+    """Load the configuration with the YAML cache and return the time it took."""
+    cache_path = os.path.join(config_dir, "yaml_cache")
+    start = timer()
+    cache = YamlCache.from_file(cache_path)
+    with cache.activate():
+        conf_util.load_yaml_config_file(
+            os.path.join(config_dir, conf_util.YAML_CONFIG_FILE), Secrets(config_dir)
+        )
+    cache.save(cache_path)
+    return timer() - start
+
+
+@benchmark
+async def load_yaml_config(hass: core.HomeAssistant) -> float:
+    """Load a configuration of 400 files with a cold and a warm YAML cache."""
+    with TemporaryDirectory() as config_dir:
+        await hass.async_add_executor_job(_write_yaml_config, config_dir)
+        cold = await hass.async_add_executor_job(_load_yaml_config, config_dir)
+        warm = await hass.async_add_executor_job(_load_yaml_config, config_dir)
+
+    print(f"Cold load {cold:.3f}s, warm load {warm:.3f}s")
+    return warm
+
+
+@benchmark
+async def validate_service_schemas(hass: core.HomeAssistant) -> float:
+    """Validate service calls, websocket messages and platform config."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+
+    cases: list[tuple[str, Callable, dict]] = [
+        (
+            "entity service",
+            cv.make_entity_service_schema({}),
+            {"entity_id": ["light.kitchen", "light.living_room"]},
+        ),
+        (
+            "entity service with fields",
+            cv.make_entity_service_schema(
+                {
+                    vol.Optional("brightness"): cv.positive_int,
+                    vol.Optional("transition"): vol.Coerce(float),
+                    vol.Optional("effect"): cv.string,
+                }
+            ),
+            {"entity_id": "light.kitchen", "brightness": 120, "effect": "rainbow"},
+        ),
+        (
+            "target selector",
+            selector.TargetSelector.TARGET_SELECTION_SCHEMA,
+            {"area_id": ["kitchen"], "label_id": "lights"},
+        ),
+        (
+            "websocket message",
+            messages.MINIMAL_MESSAGE_SCHEMA,
+            {"id": 5, "type": "call_service", "domain": "light"},
+        ),
+        (
+            "websocket command",
+            messages.BASE_COMMAND_MESSAGE_SCHEMA.extend(
+                {vol.Required("type"): "get_states"}
+            ),
+            {"id": 5, "type": "get_states"},
+        ),
+        (
+            "platform config",
+            cv.PLATFORM_SCHEMA_BASE,
+            {"platform": "template", "scan_interval": 30, "sensors": {}},
+        ),
+    ]
+
+    runtime = 0.0
+    for name, schema, data in cases:
+        start = timer()
+        for _ in range(10**5):
+            schema(data)
+        case_runtime = timer() - start
+        print(f"{name}: {case_runtime:.3f}s")
+        runtime += case_runtime
+    return runtime
+
+
+def _write_translations(config_dir: str) -> dict[str, loader.Integration]:
+    """Write English and German translations of 300 integrations."""
+    os.mkdir(os.path.join(config_dir, STORAGE_DIR))
+    files: dict[str, set[str]] = {}
+    for idx in range(300):
+        domain = f"bench_{idx}"
+        translations_dir = os.path.join(config_dir, domain, "translations")
+        os.makedirs(translations_dir)
+        for language, word in (("en", "Power"), ("de", "Leistung")):
+            strings = {
+                category: {
+                    f"key_{key}": {"name": f"{word} {key}", "description": word}
+                    for key in range(40)
+                }
+                for category in ("config", "entity", "exceptions", "services")
+            }
+            with open(
+                os.path.join(translations_dir, f"{language}.json"),
+                "w",
+                encoding="utf-8",
+            ) as file:
+                file.write(JSON_DUMP(strings))
+        files[domain] = {"translations"}
+    return files
+
+
+async def _load_translations(
+    hass: core.HomeAssistant,
+    cache: translation._TranslationCache,
+    integrations: dict[str, loader.Integration],
+) -> tuple[float, int]:
+    """Load the entity translations, return the time and memory it took."""
+    tracemalloc.start()
+    start = timer()
+    await cache._async_load_integrations("de", set(integrations), integrations)  # noqa: SLF001
+    cache.get_cached("de", "entity", set(integrations))
+    runtime = timer() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return runtime, memory
+
+
+@benchmark
+async def load_translations(hass: core.HomeAssistant) -> float:
+    """Load the translations of 300 integrations with and without a pack."""
+    loader.async_setup(hass)
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        integrations = {
+            domain: loader.Integration(
+                hass,
+                f"custom_components.{domain}",
+                pathlib.Path(config_dir, domain),
+                {"domain": domain, "name": domain},  # type: ignore[typeddict-item]
+                top_level_files,
+            )
+            for domain, top_level_files in (
+                await hass.async_add_executor_job(_write_translations, config_dir)
+            ).items()
+        }
+        cache = translation._TranslationCache(hass)  # noqa: SLF001
+        cold, cold_memory = await _load_translations(hass, cache, integrations)
+        await cache._async_save_pack("de")  # noqa: SLF001
+        cache = translation._TranslationCache(hass)  # noqa: SLF001
+        warm, warm_memory = await _load_translations(hass, cache, integrations)
+
+    print(
+        f"Without pack {cold:.3f}s {cold_memory / 2**20:.1f} MiB, "
+        f"with pack {warm:.3f}s {warm_memory / 2**20:.1f} MiB"
+    )
+    return warm
@@ -0,0 +1,358 @@
+"""Admission control and timing for executor jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+import time
+from typing import Any
+
+# Upper bounds in seconds of the queue wait and run time histogram buckets,
+# the last bucket holds everything slower
+HISTOGRAM_BUCKETS = (0.001, 0.01, 0.1, 1.0, 10.0)
+
+# Key for jobs which do not belong to an integration
+CORE_KEY = "homeassistant"
+
+# Seconds a job waits for its integration to run fewer jobs before it is
+# started anyway, so a job waiting on another job of its integration can
+# not block forever
+MAX_QUEUE_WAIT = 1.0
+
+
+@lru_cache(maxsize=1024)
+def _module_integration(module: str) -> str | None:
+    """Return the integration a module belongs to."""
+    parts = module.split(".", 3)
+    if len(parts) > 2 and parts[0] == "homeassistant" and parts[1] == "components":
+        return parts[2]
+    if len(parts) > 1 and parts[0] == "custom_components":
+        return parts[1]
+    return None
+
+
+def job_origin(target: Callable[..., Any]) -> tuple[str | None, str]:
+    """Return the integration and the name of an executor job."""
+    while isinstance(target, partial):
+        target = target.func
+    name: str = getattr(target, "__qualname__", None) or type(target).__qualname__
+    if not (module := getattr(target, "__module__", None)):
+        return None, name
+    return _module_integration(module), name
+
+
+def _histogram_bucket(value: float) -> int:
+    """Return the histogram bucket of a duration."""
+    for index, upper in enumerate(HISTOGRAM_BUCKETS):
+        if value <= upper:
+            return index
+    return len(HISTOGRAM_BUCKETS)
+
+
+@dataclass(slots=True)
+class ExecutorJobStats:
+    """Queue wait and run time of executor jobs."""
+
+    jobs: int = 0
+    total_wait: float = 0
+    total_run: float = 0
+    wait_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    )
+    run_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    )
+
+    def record(self, wait: float, run: float) -> None:
+        """Record a finished job."""
+        self.jobs += 1
+        self.total_wait += wait
+        self.total_run += run
+        self.wait_histogram[_histogram_bucket(wait)] += 1
+        self.run_histogram[_histogram_bucket(run)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics."""
+        return {
+            "jobs": self.jobs,
+            "total_wait": round(self.total_wait, 6),
+            "total_run": round(self.total_run, 6),
+            "wait_histogram": self.wait_histogram,
+            "run_histogram": self.run_histogram,
+        }
+
+
+@dataclass(slots=True)
+class IntegrationExecutorStats(ExecutorJobStats):
+    """Executor statistics of an integration and each of its jobs."""
+
+    # Jobs which had to wait because the integration was at its limit
+    throttled: int = 0
+    # Jobs which were started above the limit after waiting too long
+    overdue: int = 0
+    job_stats: dict[str, ExecutorJobStats] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics."""
+        return {
+            **ExecutorJobStats.as_dict(self),
+            "throttled": self.throttled,
+            "overdue": self.overdue,
+            "by_job": {name: stats.as_dict() for name, stats in self.job_stats.items()},
+        }
+
+
+@dataclass(slots=True)
+class _PendingJob:
+    """A job waiting for its integration to run fewer jobs."""
+
+    future: asyncio.Future[Any]
+    executor: Executor | None
+    target: Callable[..., Any]
+    args: tuple[Any, ...]
+    name: str
+    queued_at: float
+    overdue_at: float
+
+
+def _cancel_unstarted(
+    start_token: list[bool],
+    running: asyncio.Future[Any],
+    future: asyncio.Future[Any],
+) -> None:
+    """Cancel a job in the executor if the caller cancelled it before it started.
+
+    A job which already runs keeps running and holds its slot until it returns.
+    """
+    if not future.cancelled():
+        return
+    try:
+        start_token.pop()
+    except IndexError:
+        return
+    running.cancel()
+
+
+class ExecutorAdmission:
+    """Limit the executor jobs an integration runs at the same time.
+
+    Blocking jobs of a single integration could otherwise use every
+    worker of an executor and starve all other integrations. Jobs above
+    the limit wait in the event loop until a job of the same integration
+    finishes, or at most max_queue_wait seconds since a job may wait on
+    another job of its integration. A job belongs to the integration of
+    the module of its target. Jobs which do not belong to an integration
+    are not limited.
+
+    The queue wait and run time of every job is recorded per integration
+    and per job. Must only be used from the event loop.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_jobs_per_integration: int,
+        max_queue_wait: float = MAX_QUEUE_WAIT,
+    ) -> None:
+        """Initialize the admission control."""
+        self._loop = loop
+        self.max_jobs_per_integration = max_jobs_per_integration
+        self.max_queue_wait = max_queue_wait
+        self._running: dict[str, int] = {}
+        self._pending: dict[str, deque[_PendingJob]] = {}
+        self._overdue_timers: dict[str, asyncio.TimerHandle] = {}
+        self.stats: dict[str, IntegrationExecutorStats] = {}
+
+    def run_in_executor(
+        self,
+        executor: Executor | None,
+        target: Callable[..., Any],
+        *args: Any,
+        limit: bool = True,
+    ) -> asyncio.Future[Any]:
+        """Run a job in an executor once its integration is below its limit."""
+        integration, name = job_origin(target)
+        queued_at = time.monotonic()
+        if integration is None or not limit:
+            return self._start(
+                integration, executor, target, args, name, queued_at, [True]
+            )
+        future: asyncio.Future[Any] = self._loop.create_future()
+        running = self._running.get(integration, 0)
+        if running >= self.max_jobs_per_integration:
+            overdue_at = self._loop.time() + self.max_queue_wait
+            if (pending := self._pending.get(integration)) is None:
+                pending = self._pending[integration] = deque()
+                self._overdue_timers[integration] = self._loop.call_at(
+                    overdue_at, self._start_overdue, integration
+                )
+            pending.append(
+                _PendingJob(future, executor, target, args, name, queued_at, overdue_at)
+            )
+            self._get_stats(integration).throttled += 1
+            return future
+        self._running[integration] = running + 1
+        self._start_limited(
+            integration, future, executor, target, args, name, queued_at
+        )
+        return future
+
+    def _get_stats(self, integration: str | None) -> IntegrationExecutorStats:
+        """Return the statistics of an integration."""
+        key = integration or CORE_KEY
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = IntegrationExecutorStats()
+        return stats
+
+    def _start(
+        self,
+        integration: str | None,
+        executor: Executor | None,
+        target: Callable[..., Any],
+        args: tuple[Any, ...],
+        name: str,
+        queued_at: float,
+        start_token: list[bool],
+    ) -> asyncio.Future[Any]:
+        """Start a job in the executor and record its times when it is done.
+
+        The executor thread takes the start token before it runs the target.
+        Whoever takes the token first wins, so a job whose token was taken
+        by a cancellation never runs its target.
+        """
+        started: list[float] = []
+
+        def _run() -> Any:
+            try:
+                start_token.pop()
+            except IndexError:
+                return None
+            started.append(time.monotonic())
+            return target(*args)
+
+        def _done(future: asyncio.Future[Any]) -> None:
+            if started and not future.cancelled():
+                start = started[0]
+                self._record(
+                    integration, name, start - queued_at, time.monotonic() - start
+                )
+
+        future = self._loop.run_in_executor(executor, _run)
+        future.add_done_callback(_done)
+        return future
+
+    def _start_limited(
+        self,
+        integration: str,
+        future: asyncio.Future[Any],
+        executor: Executor | None,
+        target: Callable[..., Any],
+        args: tuple[Any, ...],
+        name: str,
+        queued_at: float,
+    ) -> None:
+        """Start a job which holds a slot of its integration.
+
+        The executor future is not cancelled with the future of the caller
+        while the job runs, so the slot is only released once the job
+        really returned.
+        """
+        start_token = [True]
+        running = self._start(
+            integration, executor, target, args, name, queued_at, start_token
+        )
+        running.add_done_callback(partial(self._limited_job_done, integration, future))
+        future.add_done_callback(partial(_cancel_unstarted, start_token, running))
+
+    def _limited_job_done(
+        self,
+        integration: str,
+        future: asyncio.Future[Any],
+        running: asyncio.Future[Any],
+    ) -> None:
+        """Pass on the result of a job and start the next waiting job."""
+        if not future.done():
+            if running.cancelled():
+                future.cancel()
+            elif (exc := running.exception()) is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(running.result())
+        self._running[integration] -= 1
+        self._start_pending(integration)
+
+    def _start_pending(self, integration: str) -> None:
+        """Start waiting jobs while the integration is below its limit."""
+        if (pending := self._pending.get(integration)) is None:
+            return
+        while pending and self._running[integration] < self.max_jobs_per_integration:
+            self._start_pending_job(integration, pending.popleft())
+        if not pending:
+            self._clear_pending(integration)
+
+    def _start_overdue(self, integration: str) -> None:
+        """Start waiting jobs which waited too long even above the limit."""
+        pending = self._pending[integration]
+        now = self._loop.time()
+        stats = self._get_stats(integration)
+        while pending and pending[0].overdue_at <= now:
+            if not (job := pending.popleft()).future.cancelled():
+                stats.overdue += 1
+                self._start_pending_job(integration, job)
+        if not pending:
+            self._clear_pending(integration)
+            return
+        self._overdue_timers[integration] = self._loop.call_at(
+            pending[0].overdue_at, self._start_overdue, integration
+        )
+
+    def _start_pending_job(self, integration: str, job: _PendingJob) -> None:
+        """Start a job which waited for its integration."""
+        if job.future.cancelled():
+            return
+        self._running[integration] += 1
+        self._start_limited(
+            integration,
+            job.future,
+            job.executor,
+            job.target,
+            job.args,
+            job.name,
+            job.queued_at,
+        )
+
+    def _clear_pending(self, integration: str) -> None:
+        """Remove the empty queue of an integration."""
+        del self._pending[integration]
+        self._overdue_timers.pop(integration).cancel()
+
+    def _record(
+        self, integration: str | None, name: str, wait: float, run: float
+    ) -> None:
+        """Record a finished job."""
+        stats = self._get_stats(integration)
+        stats.record(wait, run)
+        if (job_stats := stats.job_stats.get(name)) is None:
+            job_stats = stats.job_stats[name] = ExecutorJobStats()
+        job_stats.record(wait, run)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of all integrations."""
+        return {
+            "max_jobs_per_integration": self.max_jobs_per_integration,
+            "max_queue_wait": self.max_queue_wait,
+            "histogram_buckets": HISTOGRAM_BUCKETS,
+            "running": dict(self._running),
+            "waiting": {
+                integration: len(pending)
+                for integration, pending in self._pending.items()
+            },
+            "integrations": {
+                integration: stats.as_dict()
+                for integration, stats in self.stats.items()
+            },
+        }
@@ -0,0 +1,426 @@
+"""Cache of parsed YAML files."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import hashlib
+import logging
+import math
+import os
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
+from homeassistant.util.json import json_loads
+
+from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
+
+if TYPE_CHECKING:
+    from .loader import Secrets
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+_ACTIVE_CACHE: ContextVar[YamlCache | None] = ContextVar(
+    "yaml_active_cache", default=None
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SecretReference:
+    """A secret used by a cached file, resolved whenever the file is loaded."""
+
+    requester: str
+    name: str
+
+
+@dataclass(slots=True, frozen=True)
+class FileState:
+    """Modification time, size and content digest of a file."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+def _file_digest(path: str) -> str:
+    """Return the digest of the content of a file."""
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "blake2b").hexdigest()
+
+
+def _file_state(path: str) -> FileState | None:
+    """Return the state of a file or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+        return FileState(stat.st_mtime_ns, stat.st_size, _file_digest(path))
+    except OSError:
+        return None
+
+
+def _file_unchanged(path: str, state: FileState | None) -> bool:
+    """Return if a file has the state it had when it was parsed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return state is None
+    if state is None:
+        return False
+    if stat.st_mtime_ns == state.mtime_ns and stat.st_size == state.size:
+        return True
+    # Touched files are compared by content
+    try:
+        return stat.st_size == state.size and _file_digest(path) == state.digest
+    except OSError:
+        return False
+
+
+@dataclass(slots=True)
+class _Dependencies:
+    """Files, directory listings and environment variables a file depends on."""
+
+    files: dict[str, FileState | None] = field(default_factory=dict)
+    directories: dict[tuple[str, str], tuple[str, ...]] = field(default_factory=dict)
+    env_vars: dict[str, str | None] = field(default_factory=dict)
+
+    def update(self, other: _Dependencies) -> None:
+        """Add the dependencies of another file."""
+        self.files.update(other.files)
+        self.directories.update(other.directories)
+        self.env_vars.update(other.env_vars)
+
+    def as_json(self) -> dict[str, Any]:
+        """Return the dependencies in a form which can be stored as JSON."""
+        return {
+            "files": {
+                path: None
+                if state is None
+                else [state.mtime_ns, state.size, state.digest]
+                for path, state in self.files.items()
+            },
+            "directories": [
+                [path, pattern, files]
+                for (path, pattern), files in self.directories.items()
+            ],
+            "env_vars": self.env_vars,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> _Dependencies:
+        """Return the dependencies stored as JSON."""
+        return cls(
+            {
+                path: None if state is None else FileState(*state)
+                for path, state in data["files"].items()
+            },
+            {
+                (path, pattern): tuple(files)
+                for path, pattern, files in data["directories"]
+            },
+            data["env_vars"],
+        )
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """Parsed content of a file and everything it depends on.
+
+    The content is encoded by _encode, with the names of the files it was
+    parsed from in a separate list.
+    """
+
+    data: Any
+    config_files: list[str]
+    dependencies: _Dependencies
+
+
+def _encode(obj: Any, config_files: dict[str, int]) -> Any:
+    """Encode parsed YAML as JSON, keeping the types and locations of nodes.
+
+    Containers and nodes are encoded as a list starting with a type code.
+    Raises TypeError for values which can not be encoded.
+    """
+    obj_type = type(obj)
+    if obj_type is str or obj_type is bool or obj_type is int or obj is None:
+        return obj
+    if obj_type is float:
+        return obj if math.isfinite(obj) else ["f", repr(obj)]
+    if obj_type is NodeStrClass:
+        return ["s", str(obj), *_encode_location(obj, config_files)]
+    if obj_type is NodeDictClass or obj_type is dict:
+        items: list[Any] = []
+        for key, value in obj.items():
+            items.append(_encode(key, config_files))
+            items.append(_encode(value, config_files))
+        if obj_type is dict:
+            return ["D", items]
+        return ["d", items, *_encode_location(obj, config_files)]
+    if obj_type is NodeListClass or obj_type is list:
+        values = [_encode(value, config_files) for value in obj]
+        if obj_type is list:
+            return ["L", values]
+        return ["l", values, *_encode_location(obj, config_files)]
+    if obj_type is Input:
+        return ["i", obj.name]
+    if obj_type is SecretReference:
+        return [
+            "S",
+            config_files.setdefault(obj.requester, len(config_files)),
+            obj.name,
+        ]
+    raise TypeError(f"Unable to encode {obj_type.__name__}")
+
+
+def _encode_location(
+    obj: NodeDictClass | NodeListClass | NodeStrClass, config_files: dict[str, int]
+) -> tuple[int | None, int | str | None]:
+    """Encode the file and line a node was parsed from."""
+    if (config_file := getattr(obj, "__config_file__", None)) is not None:
+        return config_files.setdefault(config_file, len(config_files)), getattr(
+            obj, "__line__", None
+        )
+    return None, getattr(obj, "__line__", None)
+
+
+def _decode(value: Any, config_files: list[str]) -> Any:
+    """Decode parsed YAML encoded by _encode."""
+    if type(value) is not list:
+        return value
+    code = value[0]
+    if code == "s":
+        return _set_location(NodeStrClass(value[1]), value, config_files)
+    if code in ("d", "D"):
+        items = value[1]
+        obj: Any = NodeDictClass() if code == "d" else {}
+        for index in range(0, len(items), 2):
+            obj[_decode(items[index], config_files)] = _decode(
+                items[index + 1], config_files
+            )
+        return obj if code == "D" else _set_location(obj, value, config_files)
+    if code == "l":
+        return _set_location(
+            NodeListClass(_decode(item, config_files) for item in value[1]),
+            value,
+            config_files,
+        )
+    if code == "L":
+        return [_decode(item, config_files) for item in value[1]]
+    if code == "f":
+        return float(value[1])
+    if code == "i":
+        return Input(value[1])
+    if code == "S":
+        return SecretReference(config_files[value[1]], value[2])
+    raise ValueError(f"Unknown type code {code}")
+
+
+def _set_location[_NodeT: (NodeDictClass, NodeListClass, NodeStrClass)](
+    obj: _NodeT, value: list[Any], config_files: list[str]
+) -> _NodeT:
+    """Set the file and line a decoded node was parsed from."""
+    if (config_file := value[2]) is not None:
+        obj.__config_file__ = config_files[config_file]
+    if (line := value[3]) is not None:
+        obj.__line__ = line
+    return obj
+
+
+def _resolve_secrets(obj: Any, secrets: Secrets) -> Any:
+    """Replace the secret references in parsed YAML by their values."""
+    if isinstance(obj, SecretReference):
+        return secrets.get(obj.requester, obj.name)
+    if isinstance(obj, dict):
+        if any(isinstance(key, SecretReference) for key in obj):
+            items = list(obj.items())
+            obj.clear()
+            for key, value in items:
+                obj[_resolve_secrets(key, secrets)] = _resolve_secrets(value, secrets)
+        else:
+            for key, value in obj.items():
+                obj[key] = _resolve_secrets(value, secrets)
+    elif isinstance(obj, list):
+        for index, value in enumerate(obj):
+            obj[index] = _resolve_secrets(value, secrets)
+    return obj
+
+
+class YamlCache:
+    """Parsed YAML files reused while none of their dependencies changed.
+
+    The parsed content of every loaded file is stored together with the
+    state of the files it includes, the directories it lists and the
+    environment variables it reads. A file is only parsed again when one of
+    those changed, unchanged included files are still taken from the cache.
+
+    The cache is stored as JSON. Secrets are stored as references to their
+    name, which are resolved every time the configuration is loaded, so their
+    values are never written to the cache.
+    """
+
+    def __init__(self, entries: dict[str, _CacheEntry] | None = None) -> None:
+        """Initialize the cache."""
+        self._entries = entries or {}
+        self._stack: list[_Dependencies] = []
+        self._used: set[str] = set()
+        # Files parsed during the last load
+        self.parsed: list[str] = []
+
+    @classmethod
+    def from_file(cls, path: str) -> YamlCache:
+        """Read a cache file, return an empty cache if it is missing or invalid."""
+        try:
+            with open(path, "rb") as file:
+                content = json_loads(file.read())
+            if content["version"] != CACHE_VERSION:
+                return cls()
+            entries = {
+                name: _CacheEntry(
+                    entry["data"],
+                    entry["config_files"],
+                    _Dependencies.from_json(entry["dependencies"]),
+                )
+                for name, entry in content["entries"].items()
+            }
+        except FileNotFoundError:
+            return cls()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Ignoring invalid YAML cache %s", path, exc_info=True)
+            return cls()
+        return cls(entries)
+
+    def save(self, path: str) -> None:
+        """Write the entries used during the last load to a cache file."""
+        if not self.parsed and self._used.issuperset(self._entries):
+            return
+        entries = {
+            name: {
+                "data": entry.data,
+                "config_files": entry.config_files,
+                "dependencies": entry.dependencies.as_json(),
+            }
+            for name, entry in self._entries.items()
+            if name in self._used
+        }
+        try:
+            write_utf8_file_atomic(
+                path,
+                orjson.dumps({"version": CACHE_VERSION, "entries": entries}),
+                private=True,
+                mode="wb",
+            )
+        except WriteError as err:
+            _LOGGER.debug("Unable to write YAML cache %s: %s", path, err)
+
+    @property
+    def unchanged(self) -> list[str]:
+        """Return the files of the last load which were not parsed again."""
+        return sorted(self._used.difference(self.parsed))
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Use the cache for YAML files loaded in the block."""
+        self.parsed = []
+        self._used = set()
+        token = _ACTIVE_CACHE.set(self)
+        try:
+            yield
+        finally:
+            _ACTIVE_CACHE.reset(token)
+
+    def load(
+        self, path: str, parse: Callable[[], Any], secrets: Secrets | None = None
+    ) -> Any:
+        """Return the parsed content of a file from the cache or by parsing it.
+
+        Included files keep the references to their secrets, which are
+        resolved once the outermost file is loaded.
+        """
+        data = self._load(path, parse)
+        if secrets is None or self._stack:
+            return data
+        return _resolve_secrets(data, secrets)
+
+    def _load(self, path: str, parse: Callable[[], Any]) -> Any:
+        """Return the parsed content of a file with references to its secrets."""
+        path = os.path.normpath(path)
+        if (entry := self._entries.get(path)) is not None and self._is_valid(entry):
+            try:
+                data = _decode(entry.data, entry.config_files)
+            except Exception:  # noqa: BLE001
+                _LOGGER.debug("Invalid YAML cache entry for %s", path, exc_info=True)
+            else:
+                self._used.update(entry.dependencies.files)
+                if self._stack:
+                    self._stack[-1].update(entry.dependencies)
+                return data
+
+        dependencies = _Dependencies()
+        self._stack.append(dependencies)
+        try:
+            self.record_file(path)
+            data = parse()
+        finally:
+            self._stack.pop()
+        if self._stack:
+            self._stack[-1].update(dependencies)
+        self.parsed.append(path)
+        self._used.update(dependencies.files)
+        if dependencies.files[path] is None:
+            # Only files which exist on disk can be validated later
+            return data
+        config_files: dict[str, int] = {}
+        try:
+            self._entries[path] = _CacheEntry(
+                _encode(data, config_files), list(config_files), dependencies
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Unable to cache %s", path, exc_info=True)
+            self._entries.pop(path, None)
+        return data
+
+    def record_file(self, path: str) -> None:
+        """Record the file being parsed depends on a file."""
+        if self._stack:
+            path = os.path.normpath(path)
+            self._stack[-1].files[path] = _file_state(path)
+
+    def record_directory(self, path: str, pattern: str, files: list[str]) -> None:
+        """Record the file being parsed depends on the files in a directory."""
+        if self._stack:
+            self._stack[-1].directories[(path, pattern)] = tuple(files)
+
+    def record_env_var(self, name: str) -> None:
+        """Record the file being parsed depends on an environment variable."""
+        if self._stack:
+            self._stack[-1].env_vars[name] = os.environ.get(name)
+
+    def _is_valid(self, entry: _CacheEntry) -> bool:
+        """Return if none of the dependencies of an entry changed."""
+        # pylint: disable-next=import-outside-toplevel
+        from .loader import _find_files
+
+        dependencies = entry.dependencies
+        return (
+            all(
+                _file_unchanged(path, state)
+                for path, state in dependencies.files.items()
+            )
+            and all(
+                tuple(_find_files(path, pattern)) == files
+                for (path, pattern), files in dependencies.directories.items()
+            )
+            and all(
+                os.environ.get(name) == value
+                for name, value in dependencies.env_vars.items()
+            )
+        )
+
+
+def get_active_cache() -> YamlCache | None:
+    """Return the cache used for the YAML files loaded right now."""
+    return _ACTIVE_CACHE.get()
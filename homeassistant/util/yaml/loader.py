@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterator
 import fnmatch
+from functools import partial
 from io import StringIO, TextIOWrapper
 import logging
 import os
@@ -26,6 +27,7 @@ from propcache.api import cached_property
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import SecretReference, get_active_cache
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -163,6 +165,20 @@ def load_yaml(
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
+    # Secrets are never stored in the cache of parsed files
+    if (cache := get_active_cache()) is not None and (
+        os.path.basename(fname) != SECRET_YAML
+    ):
+        return cache.load(
+            os.fspath(fname), partial(_load_yaml, fname, secrets), secrets
+        )
+    return _load_yaml(fname, secrets)
+
+
+def _load_yaml(
+    fname: str | os.PathLike[str], secrets: Secrets | None = None
+) -> JSON_TYPE | None:
+    """Load a YAML file without the cache."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -341,12 +357,20 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(directory: str) -> list[str]:
+    """Return the YAML files in a directory and record them for the cache."""
+    files = list(_find_files(directory, "*.yaml"))
+    if (cache := get_active_cache()) is not None:
+        cache.record_directory(directory, "*.yaml", files)
+    return files
+
+
 @_raise_if_no_value
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -366,7 +390,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -383,7 +407,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loc)
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -396,7 +420,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -465,6 +489,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if (cache := get_active_cache()) is not None:
+        cache.record_env_var(args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -480,7 +506,11 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
-    return loader.secrets.get(loader.get_name, node.value)
+    value = loader.secrets.get(loader.get_name, node.value)
+    if get_active_cache() is not None:
+        # The value is looked up again whenever the cached file is used
+        return SecretReference(loader.get_name, node.value)
+    return value
 
 
 def add_constructor(tag: Any, constructor: Any) -> None:
@@ -8,7 +8,11 @@ from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.auth import auth_store
+from homeassistant.auth.permissions import PolicyPermissions
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from tests.common import MockConfigEntry
 
 MOCK_STORAGE_DATA = {
     "version": 1,
@@ -379,3 +383,41 @@ async def test_set_expiry_date(
 
     store.async_set_expiry(token, enable_expiry=True)
     assert token.expire_at is not None
+
+
+async def test_entity_permissions_follow_registry_changes(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test remembered entity permissions are updated on registry changes."""
+    store = auth_store.AuthStore(hass)
+    await store.async_load()
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "device")}
+    )
+    entity = entity_registry.async_get_or_create("light", "test", "kitchen")
+
+    permissions = PolicyPermissions(
+        {"entities": {"area_ids": {"kitchen": {"read": True}}}},
+        store._perm_lookup,
+    )
+    assert not permissions.check_entity(entity.entity_id, "read")
+
+    entity_registry.async_update_entity(entity.entity_id, device_id=device.id)
+    device_registry.async_update_device(device.id, area_id="kitchen")
+    await hass.async_block_till_done()
+    assert permissions.check_entity(entity.entity_id, "read")
+
+    # Changes which do not affect permissions keep the remembered results
+    generation = store._perm_lookup.generation
+    entity_registry.async_update_entity(entity.entity_id, name="Kitchen")
+    await hass.async_block_till_done()
+    assert store._perm_lookup.generation == generation
+
+    device_registry.async_update_device(device.id, area_id="living_room")
+    await hass.async_block_till_done()
+    assert not permissions.check_entity(entity.entity_id, "read")
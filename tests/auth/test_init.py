@@ -590,6 +590,53 @@ async def test_remove_refresh_token(hass: HomeAssistant) -> None:
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_access_token_cache(hass: HomeAssistant) -> None:
+    """Test verified access tokens are cached until they are invalidated."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    now = dt_util.utcnow()
+    with freeze_time(now) as frozen_time:
+        refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+        access_token = manager.async_create_access_token(refresh_token)
+
+        with patch(
+            "homeassistant.auth.jwt_wrapper.verify_and_decode",
+            wraps=auth.jwt_wrapper.verify_and_decode,
+        ) as mock_verify:
+            for _ in range(3):
+                assert (
+                    manager.async_validate_access_token(access_token) is refresh_token
+                )
+            assert mock_verify.call_count == 1
+            assert manager.async_access_token_cache_info() == {
+                "hits": 2,
+                "misses": 1,
+                "size": 1,
+            }
+
+            # The token is verified again once the cache entry is stale
+            frozen_time.tick(auth_const.ACCESS_TOKEN_CACHE_TTL + 1)
+            assert manager.async_validate_access_token(access_token) is refresh_token
+            assert mock_verify.call_count == 2
+
+            # Expired tokens are not returned from the cache
+            frozen_time.tick(auth_const.ACCESS_TOKEN_EXPIRATION.total_seconds())
+            assert manager.async_validate_access_token(access_token) is None
+            assert manager.async_access_token_cache_info()["size"] == 0
+
+        access_token = manager.async_create_access_token(refresh_token)
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        await manager.async_deactivate_user(user)
+        assert manager.async_access_token_cache_info()["size"] == 0
+        assert manager.async_validate_access_token(access_token) is None
+
+        await manager.async_activate_user(user)
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        manager.async_remove_refresh_token(refresh_token)
+        assert manager.async_access_token_cache_info()["size"] == 0
+        assert manager.async_validate_access_token(access_token) is None
+
+
 async def test_remove_expired_refresh_token(hass: HomeAssistant) -> None:
     """Test that expired refresh tokens are deleted."""
     manager = await auth.auth_manager_from_config(hass, [], [])
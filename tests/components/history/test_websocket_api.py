@@ -10,6 +10,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.websocket_api.stream_hub import async_get_live_stream_hub
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -1329,6 +1330,89 @@ async def test_history_stream_live_no_attributes_minimal_response_specific_entit
     }
 
 
+async def test_history_stream_live_shared_between_subscribers(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test identical live history streams share one subscription."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {history.DOMAIN: {}})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    other_client = await hass_ws_client()
+    init_listeners = hass.bus.async_listeners()
+    hub = async_get_live_stream_hub(hass)
+
+    for ws_client, entity_ids in (
+        (client, ["sensor.one", "sensor.two"]),
+        (other_client, ["sensor.two", "sensor.one"]),
+    ):
+        await ws_client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": entity_ids,
+                "start_time": now.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await ws_client.receive_json()
+        assert response["success"]
+        response = await ws_client.receive_json()
+        assert response["event"]["states"]["sensor.one"][0]["s"] == "on"
+
+    assert hub.stream_count == 1
+    assert hub.subscriber_count == 2
+    batches_processed = hub.batches_processed
+
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    sensor_one_last_updated_timestamp = hass.states.get(
+        "sensor.one"
+    ).last_updated_timestamp
+
+    for ws_client in (client, other_client):
+        response = await ws_client.receive_json()
+        assert response == {
+            "event": {
+                "states": {
+                    "sensor.one": [
+                        {
+                            "lu": pytest.approx(sensor_one_last_updated_timestamp),
+                            "s": "off",
+                        }
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+    assert hub.batches_processed == batches_processed + 1
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["success"]
+    assert hub.stream_count == 1
+    assert hub.subscriber_count == 1
+
+    await other_client.send_json(
+        {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+    )
+    response = await other_client.receive_json()
+    assert response["success"]
+    assert hub.stream_count == 0
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) == listeners_without_writes(init_listeners)
+
+
 async def test_history_stream_live_with_future_end_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
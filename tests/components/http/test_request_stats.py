@@ -0,0 +1,137 @@
+"""Test request stats middleware."""
+
+import asyncio
+from contextlib import suppress
+from http import HTTPStatus
+from pathlib import Path
+from unittest.mock import patch
+
+from aiohttp import web
+
+from homeassistant.components.http.request_stats import (
+    KEY_REQUEST_STATS,
+    LATENCY_BUCKETS,
+    setup_request_stats,
+)
+from homeassistant.components.http.static import CachingStaticResource
+
+from tests.typing import ClientSessionGenerator
+
+
+async def test_request_stats_middleware(
+    aiohttp_client: ClientSessionGenerator,
+) -> None:
+    """Test the latency and size of responses are recorded per route."""
+    app = web.Application()
+
+    async def mock_handler(request: web.Request) -> web.Response:
+        """Return the name as text."""
+        return web.Response(text=f"hi {request.match_info['name']}!")
+
+    async def mock_error_handler(request: web.Request) -> web.Response:
+        """Raise an error."""
+        raise web.HTTPInternalServerError
+
+    app.router.add_get("/hello/{name}", mock_handler)
+    app.router.add_get("/error", mock_error_handler)
+    setup_request_stats(app)
+    mock_api_client = await aiohttp_client(app)
+
+    # Each request takes 3 milliseconds
+    with patch(
+        "homeassistant.components.http.request_stats.monotonic",
+        side_effect=[0, 0.003] * 4,
+    ):
+        for name in ("paulus", "ha"):
+            resp = await mock_api_client.get(f"/hello/{name}")
+            assert resp.status == HTTPStatus.OK
+        resp = await mock_api_client.get("/error")
+        assert resp.status == HTTPStatus.INTERNAL_SERVER_ERROR
+        resp = await mock_api_client.get("/unknown")
+        assert resp.status == HTTPStatus.NOT_FOUND
+
+    stats = app[KEY_REQUEST_STATS].as_dict()
+    assert stats["latency_buckets"] == LATENCY_BUCKETS
+    assert set(stats["routes"]) == {"/hello/{name}", "/error", "unmatched"}
+    hello = stats["routes"]["/hello/{name}"]
+    assert hello["requests"] == 2
+    assert hello["errors"] == 0
+    assert hello["in_flight"] == 0
+    assert hello["response_bytes"] == len("hi paulus!") + len("hi ha!")
+    assert hello["latency_p50"] == 0.005
+    assert hello["latency_p95"] == 0.005
+    assert hello["latency_buckets"] == [0, 0, 2] + [0] * 11
+    assert stats["routes"]["/error"]["requests"] == 1
+    assert stats["routes"]["/error"]["errors"] == 1
+    assert stats["routes"]["unmatched"]["requests"] == 1
+    assert stats["routes"]["unmatched"]["errors"] == 0
+
+
+async def test_request_stats_static_files_and_streams(
+    aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test files are recorded with their size and streams are not recorded."""
+    app = web.Application()
+    (tmp_path / "app.js").write_bytes(b"x" * 10000)
+
+    async def mock_stream_handler(request: web.Request) -> web.StreamResponse:
+        """Stream two chunks."""
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"frame 1")
+        await response.write(b"frame 2")
+        return response
+
+    app.router.register_resource(CachingStaticResource("/static", tmp_path))
+    app.router.add_get("/stream", mock_stream_handler)
+    setup_request_stats(app)
+    mock_api_client = await aiohttp_client(app)
+
+    resp = await mock_api_client.get("/static/app.js")
+    assert resp.status == HTTPStatus.OK
+    assert len(await resp.read()) == 10000
+    resp = await mock_api_client.get("/stream")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"frame 1frame 2"
+
+    routes = app[KEY_REQUEST_STATS].as_dict()["routes"]
+    assert routes["/static"]["requests"] == 1
+    assert routes["/static"]["response_bytes"] == 10000
+    assert routes["/static"]["in_flight"] == 0
+    assert routes["/stream"]["requests"] == 0
+    assert routes["/stream"]["in_flight"] == 0
+
+
+async def test_request_stats_cancelled_request(
+    aiohttp_client: ClientSessionGenerator,
+) -> None:
+    """Test a request cancelled when the client disconnects is not an error."""
+    app = web.Application()
+    started = asyncio.Event()
+
+    async def mock_slow_handler(request: web.Request) -> web.Response:
+        """Wait until cancelled."""
+        started.set()
+        await asyncio.Event().wait()
+        return web.Response()
+
+    app.router.add_get("/slow", mock_slow_handler)
+    setup_request_stats(app)
+    mock_api_client = await aiohttp_client(
+        app, server_kwargs={"handler_cancellation": True}
+    )
+
+    request = asyncio.ensure_future(mock_api_client.get("/slow"))
+    await started.wait()
+    routes = app[KEY_REQUEST_STATS].as_dict()["routes"]
+    assert routes["/slow"]["in_flight"] == 1
+
+    request.cancel()
+    with suppress(asyncio.CancelledError):
+        await request
+    await mock_api_client.close()
+
+    routes = app[KEY_REQUEST_STATS].as_dict()["routes"]
+    assert routes["/slow"]["requests"] == 0
+    assert routes["/slow"]["errors"] == 0
+    assert routes["/slow"]["in_flight"] == 0
@@ -2,12 +2,14 @@
 
 from http import HTTPStatus
 from pathlib import Path
+import time
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import ETAG_CACHE_TIME, CachingStaticResource
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +65,43 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_not_modified(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test clients with a recently served ETag get not modified responses."""
+    app = hass.http.app
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    (tmp_path / "app.js").write_text("console.log('app');")
+
+    resp = await mock_http_client.get("/static/app.js")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+    resp = await mock_http_client.get("/static/app.js")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] == etag
+
+    # The ETag is trusted without looking at the file
+    (tmp_path / "app.js").unlink()
+    resp = await mock_http_client.get("/static/app.js", headers={"If-None-Match": etag})
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+    assert resp.headers["Cache-Control"] == "public, max-age=2678400"
+    assert "Last-Modified" in resp.headers
+
+    resp = await mock_http_client.get(
+        "/static/app.js", headers={"If-None-Match": '"other"'}
+    )
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+    with patch(
+        "homeassistant.components.http.static.monotonic",
+        return_value=time.monotonic() + ETAG_CACHE_TIME,
+    ):
+        resp = await mock_http_client.get(
+            "/static/app.js", headers={"If-None-Match": etag}
+        )
+    assert resp.status == HTTPStatus.NOT_FOUND
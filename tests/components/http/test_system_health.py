@@ -0,0 +1,24 @@
+"""Test HTTP system health."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+from tests.typing import ClientSessionGenerator
+
+
+async def test_http_system_health(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test HTTP system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(hass, "api", {})
+    client = await hass_client()
+    resp = await client.get("/api/")
+    assert resp.status == 200
+
+    info = await get_system_health_info(hass, "http")
+
+    assert info["requests"] == 1
+    assert info["requests_in_flight"] == 0
+    assert info["slowest_routes"].startswith("/api/ (<= ")
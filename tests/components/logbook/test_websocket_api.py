@@ -17,6 +17,7 @@ from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api import TYPE_RESULT
+from homeassistant.components.websocket_api.stream_hub import async_get_live_stream_hub
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
@@ -1952,6 +1953,69 @@ async def test_subscribe_unsubscribe_logbook_stream_device(
     ) == listeners_without_writes(init_listeners)
 
 
+async def test_logbook_stream_device_not_shared_after_registry_change(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test a subscriber joining after a registry change gets its own stream."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await _async_mock_logbook_platform(hass)
+    other_entry = MockConfigEntry(domain="other")
+    other_entry.add_to_hass(hass)
+    test_entry = MockConfigEntry(domain="test")
+    test_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=other_entry.entry_id,
+        identifiers={("bridgeid", "0123")},
+        name="device name",
+    )
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+    hub = async_get_live_stream_hub(hass)
+
+    async def _subscribe() -> Any:
+        client = await hass_ws_client()
+        await client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "device_ids": [device.id],
+            }
+        )
+        msg = await asyncio.wait_for(client.receive_json(), 2)
+        assert msg["success"]
+        for _ in range(2):
+            msg = await asyncio.wait_for(client.receive_json(), 2)
+            assert msg["event"]["events"] == []
+        return client
+
+    await _subscribe()
+    assert hub.stream_count == 1
+
+    # The device now belongs to the integration describing mock_event
+    device_registry.async_update_device(
+        device.id, add_config_entry_id=test_entry.entry_id
+    )
+    client = await _subscribe()
+    assert hub.stream_count == 2
+
+    hass.bus.async_fire("mock_event", {"device_id": device.id})
+    await hass.async_block_till_done()
+    msg = await asyncio.wait_for(client.receive_json(), 2)
+    assert msg["event"]["events"] == [
+        {"domain": "test", "message": "is on fire", "name": "device name", "when": ANY}
+    ]
+
+
 async def test_event_stream_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2380,7 +2444,7 @@ async def test_subscribe_disconnected(
 async def test_stream_consumer_stop_processing(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
-    """Test we unsubscribe if the stream consumer fails or is canceled."""
+    """Test we unsubscribe if the client cannot keep up with the stream."""
     now = dt_util.utcnow()
     await asyncio.gather(
         *[
@@ -2400,10 +2464,7 @@ async def test_stream_consumer_stop_processing(
 
     after_ws_created_listeners = hass.bus.async_listeners()
 
-    with (
-        patch.object(websocket_api, "MAX_PENDING_LOGBOOK_EVENTS", 5),
-        patch.object(websocket_api, "_async_events_consumer"),
-    ):
+    with patch.object(websocket_api, "MAX_PENDING_LOGBOOK_EVENTS", 5):
         await websocket_client.send_json(
             {
                 "id": 7,
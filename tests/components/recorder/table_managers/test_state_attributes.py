@@ -0,0 +1,171 @@
+"""The tests for the state attributes table manager."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import bloom_filter
+from homeassistant.components.recorder.bloom_filter import HashBloomFilter
+from homeassistant.components.recorder.db_schema import StateAttributes, States
+from homeassistant.components.recorder.tasks import LoadStateAttributesHashesTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def test_hash_bloom_filter() -> None:
+    """Test the bloom filter never has false negatives."""
+    bloom = HashBloomFilter(1000)
+    assert bloom.capacity >= 2000
+    hashes = [(i * 2654435761) & 0xFFFFFFFF for i in range(1000)]
+    for hash_ in hashes:
+        bloom.add(hash_)
+    assert all(hash_ in bloom for hash_ in hashes)
+    assert bloom.count == 1000
+    assert not bloom.is_full
+    false_positives = sum(
+        (i * 40503 + 7) & 0xFFFFFFFF in bloom for i in range(1000, 11000)
+    )
+    assert false_positives < 100
+
+
+async def test_new_attributes_skip_database_lookup(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test attributes the filter knows are new are inserted without a lookup."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_wait_recording_done(hass)
+    manager = instance.state_attributes_manager
+    stats = manager.as_dict()
+    assert stats["known_hashes"] is not None
+
+    for i in range(5):
+        hass.states.async_set("weather.home", "sunny", {"forecast": i})
+    await async_wait_recording_done(hass)
+
+    new_stats = manager.as_dict()
+    assert new_stats["known_new"] - stats["known_new"] == 5
+    assert new_stats["db_lookups"] == stats["db_lookups"]
+    assert new_stats["known_hashes"] == stats["known_hashes"] + 5
+
+
+async def test_uncached_attributes_resolved_in_one_lookup(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test cache misses for known attributes are looked up once per commit."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    for i in range(3):
+        hass.states.async_set(f"sensor.test_{i}", "on", {"value": i})
+    await async_wait_recording_done(hass)
+
+    manager = instance.state_attributes_manager
+    # Simulate the attributes falling out of the LRU
+    manager._id_map.clear()
+    stats = manager.as_dict()
+
+    for i in range(3):
+        for state in ("off", "on"):
+            hass.states.async_set(f"sensor.test_{i}", state, {"value": i})
+    # Make sure all the states are in the session before the commit
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    new_stats = manager.as_dict()
+    assert new_stats["cache_misses"] - stats["cache_misses"] == 3
+    assert new_stats["db_lookups"] - stats["db_lookups"] == 1
+    assert new_stats["db_lookup_hashes"] - stats["db_lookup_hashes"] == 3
+    assert new_stats["known_new"] == stats["known_new"]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StateAttributes).count() == 3
+        assert session.query(States).filter(States.attributes_id.is_(None)).count() == 0
+
+
+async def test_known_hashes_not_rebuilt_at_maximum_size(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a full filter is only rebuilt while it can grow."""
+    # A filter with the minimum size has room for 4 hashes, one
+    # with the maximum size for 8 hashes
+    with (
+        patch.object(bloom_filter, "BITS_PER_ITEM", 16384),
+        patch.object(bloom_filter, "MAX_BITS", bloom_filter.MIN_BITS * 2),
+    ):
+        instance = await async_setup_recorder_instance(
+            hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+        )
+        await async_wait_recording_done(hass)
+        manager = instance.state_attributes_manager
+        assert manager.as_dict()["known_hashes"] == 0
+
+        with patch.object(
+            manager, "load_known_hashes", wraps=manager.load_known_hashes
+        ) as load_known_hashes:
+            for i in range(5):
+                hass.states.async_set("weather.home", "sunny", {"forecast": i})
+            await async_wait_recording_done(hass)
+            await async_recorder_block_till_done(hass)
+            assert load_known_hashes.call_count == 1
+            assert manager.as_dict()["known_hashes"] == 5
+
+            for i in range(5, 10):
+                hass.states.async_set("weather.home", "sunny", {"forecast": i})
+            await async_wait_recording_done(hass)
+            await async_recorder_block_till_done(hass)
+            assert manager.as_dict()["known_hashes"] is None
+
+            for i in range(10, 20):
+                hass.states.async_set("weather.home", "sunny", {"forecast": i})
+            await async_wait_recording_done(hass)
+            await async_recorder_block_till_done(hass)
+            assert load_known_hashes.call_count == 1
+            assert not manager.rebuild_known_hashes
+
+    # Attributes are still deduplicated without the filter
+    hass.states.async_set("weather.home", "sunny", {"forecast": 0})
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 20
+
+
+async def test_known_hashes_full_after_load(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test no filter is used when it is full right after loading."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    for i in range(5):
+        hass.states.async_set("weather.home", "sunny", {"forecast": i})
+    await async_wait_recording_done(hass)
+    manager = instance.state_attributes_manager
+
+    # A filter with the maximum size has room for 4 hashes
+    with (
+        patch.object(bloom_filter, "BITS_PER_ITEM", 16384),
+        patch.object(bloom_filter, "MAX_BITS", bloom_filter.MIN_BITS),
+    ):
+        instance.queue_task(LoadStateAttributesHashesTask())
+        await async_recorder_block_till_done(hass)
+        assert manager.as_dict()["known_hashes"] is None
+
+        hass.states.async_set("weather.home", "sunny", {"forecast": 5})
+        await async_wait_recording_done(hass)
+        assert not manager.rebuild_known_hashes
@@ -0,0 +1,122 @@
+"""Test the adaptive recorder commit controller."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.commit_controller import (
+    INITIAL_TRANSACTION_SIZE,
+    MAX_TRANSACTION_SIZE,
+    MIN_TRANSACTION_SIZE,
+    CommitController,
+)
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+
+
+def _commit(controller: CommitController, events: int, latency: float) -> None:
+    """Simulate a commit of events that took latency seconds."""
+    for _ in range(events):
+        controller.record_event()
+    controller.record_commit(latency, 0)
+
+
+def test_shrinks_slow_large_commits() -> None:
+    """Test slow commits of full transactions make transactions smaller."""
+    controller = CommitController(5, 0.1)
+    _commit(controller, INITIAL_TRANSACTION_SIZE, 0.5)
+    assert controller.last_decision == "shrink"
+    assert controller.transaction_size == INITIAL_TRANSACTION_SIZE // 2
+    assert controller.early_commits == 1
+
+    for _ in range(10):
+        _commit(controller, controller.transaction_size, 0.5)
+    assert controller.transaction_size == MIN_TRANSACTION_SIZE
+
+
+def test_grows_fast_full_commits() -> None:
+    """Test fast commits of full transactions make transactions larger."""
+    controller = CommitController(5, 0.1)
+    _commit(controller, INITIAL_TRANSACTION_SIZE, 0.01)
+    assert controller.last_decision == "grow"
+    assert controller.transaction_size == INITIAL_TRANSACTION_SIZE * 2
+
+    for _ in range(10):
+        _commit(controller, controller.transaction_size, 0.01)
+    assert controller.transaction_size == MAX_TRANSACTION_SIZE
+
+
+def test_grows_with_backlog() -> None:
+    """Test a large backlog allows larger transactions when commits are fast."""
+    controller = CommitController(5, 0.1)
+    controller.record_event()
+    controller.record_commit(0.01, INITIAL_TRANSACTION_SIZE + 1)
+    assert controller.last_decision == "grow"
+
+    controller.record_event()
+    controller.record_commit(0.01, 0)
+    assert controller.last_decision == "hold"
+    assert controller.transaction_size == INITIAL_TRANSACTION_SIZE * 2
+
+
+def test_defers_slow_small_commits() -> None:
+    """Test timed commits are deferred while small commits are slow."""
+    controller = CommitController(1, 0.1)
+    assert controller.should_commit(0) is True
+
+    _commit(controller, 10, 0.5)
+    assert controller.last_decision == "hold"
+    assert controller.transaction_size == INITIAL_TRANSACTION_SIZE
+
+    controller.record_event()
+    assert controller.should_commit(0) is False
+    assert controller.deferred_commits == 1
+    # A large backlog or enough pending events commits right away
+    assert controller.should_commit(INITIAL_TRANSACTION_SIZE) is True
+    for _ in range(INITIAL_TRANSACTION_SIZE // 2):
+        controller.record_event()
+    assert controller.should_commit(0) is True
+
+
+def test_defers_at_most_max_intervals() -> None:
+    """Test a commit is never deferred for too long."""
+    controller = CommitController(1, 0.1)
+    with patch(
+        "homeassistant.components.recorder.commit_controller.time.monotonic",
+        return_value=100,
+    ):
+        _commit(controller, 10, 0.5)
+    with patch(
+        "homeassistant.components.recorder.commit_controller.time.monotonic",
+        return_value=104,
+    ):
+        assert controller.should_commit(0) is False
+    with patch(
+        "homeassistant.components.recorder.commit_controller.time.monotonic",
+        return_value=105,
+    ):
+        assert controller.should_commit(0) is True
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"commit_interval": 30, "commit_latency_target": 1}]
+)
+async def test_commit_when_transaction_full(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the recorder commits once the transaction is full."""
+    await async_wait_recording_done(hass)
+    recorder_mock._commit_controller.transaction_size = 2
+    assert recorder_mock.commit_info["early_commits"] == 0
+
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.test", "2")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(recorder_mock.block_till_done)
+
+    commit_info = recorder_mock.commit_info
+    assert commit_info["early_commits"] == 1
+    assert commit_info["last_commit_size"] == 2
+    assert commit_info["pending_events"] == 0
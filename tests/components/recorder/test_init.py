@@ -13,6 +13,7 @@ from unittest.mock import Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -23,6 +24,7 @@ from homeassistant.components.recorder import (
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
+    CONF_DB_READ_WORKERS,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
     CONFIG_SCHEMA,
@@ -34,6 +36,8 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
+    DB_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -2797,3 +2801,45 @@ async def test_empty_entity_id(
     hass.bus.async_fire("hello", {"entity_id": ""})
     await async_wait_recording_done(hass)
     assert "Invalid entity ID" not in caplog.text
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{CONF_DB_READ_WORKERS: 2}])
+async def test_read_pool(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test read jobs run in the read pool with read-only connections."""
+    hass.states.async_set("test.read_pool", "on")
+    await async_wait_recording_done(hass)
+    assert recorder_mock.read_engine is not None
+
+    def _read_states() -> tuple[str, list[str]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is recorder_mock.read_engine
+            states = [state.state for state in session.query(States)]
+            with pytest.raises(OperationalError, match="readonly"):
+                session.execute(text("DELETE FROM states"))
+        return threading.current_thread().name, states
+
+    thread_name, states = await recorder_mock.async_add_read_executor_job(_read_states)
+    assert thread_name.startswith(DB_READ_WORKER_PREFIX)
+    assert states == ["on"]
+
+
+async def test_read_pool_in_memory_sqlite(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    recorder_db_url: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test read jobs use the db executor when there is no read pool."""
+    if recorder_db_url != "sqlite://":
+        pytest.skip("Only in-memory SQLite has no read pool")
+    instance = await async_setup_recorder_instance(hass, {CONF_DB_READ_WORKERS: 2})
+    assert instance.read_engine is None
+    assert "A read pool is not supported" in caplog.text
+
+    thread_name = await instance.async_add_read_executor_job(
+        lambda: threading.current_thread().name
+    )
+    assert thread_name.startswith(DB_WORKER_PREFIX)
@@ -0,0 +1,166 @@
+"""Test spilling recorder events to disk."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import (
+    CONF_COMMIT_INTERVAL,
+    CONF_SPILL_BACKLOG,
+    history,
+)
+from homeassistant.components.recorder.db_schema import EventTypes
+from homeassistant.components.recorder.spill import (
+    RecorderSpill,
+    event_from_spill_bytes,
+    event_to_spill_bytes,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Context,
+    Event,
+    EventOrigin,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+)
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def test_state_changed_event_round_trip() -> None:
+    """Test a state changed event survives being spilled."""
+    context = Context(user_id="abc", parent_id="def")
+    old_state = State("sensor.test", "1", {"unit": "W"}, context=context)
+    new_state = State(
+        "sensor.test",
+        "2",
+        {"unit": "W", "raw": [1, 2]},
+        context=context,
+        state_info={"unrecorded_attributes": frozenset({"raw"})},
+    )
+    event = Event[EventStateChangedData](
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.test", "old_state": old_state, "new_state": new_state},
+        EventOrigin.local,
+        context=context,
+    )
+
+    restored = event_from_spill_bytes(event_to_spill_bytes(event))
+
+    assert restored.event_type == EVENT_STATE_CHANGED
+    assert restored.origin is EventOrigin.local
+    assert restored.time_fired_timestamp == event.time_fired_timestamp
+    assert restored.context == context
+    assert restored.data["entity_id"] == "sensor.test"
+    assert restored.data["old_state"].as_dict() == old_state.as_dict()
+    assert restored.data["new_state"].as_dict() == new_state.as_dict()
+    assert restored.data["new_state"].state_info == {
+        "unrecorded_attributes": frozenset({"raw"})
+    }
+
+
+def test_event_round_trip() -> None:
+    """Test a regular event survives being spilled."""
+    event = Event("custom_event", {"some": "data"}, EventOrigin.remote)
+
+    restored = event_from_spill_bytes(event_to_spill_bytes(event))
+
+    assert restored.event_type == "custom_event"
+    assert restored.data == {"some": "data"}
+    assert restored.origin is EventOrigin.remote
+    assert restored.time_fired_timestamp == event.time_fired_timestamp
+    assert restored.context == event.context
+
+
+async def test_spill_and_drain(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events are spilled at max backlog and replayed once caught up."""
+    hass.config.config_dir = str(tmp_path)
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_COMMIT_INTERVAL: 0, CONF_SPILL_BACKLOG: True}
+    )
+    await async_wait_recording_done(hass)
+    assert instance.spill_info["active"] is False
+
+    with patch.object(instance, "_reached_max_backlog", return_value=True):
+        instance._async_check_queue()
+    assert instance.spill_info["active"] is True
+    assert instance.recording
+
+    hass.states.async_set("sensor.spilled", "1")
+    hass.states.async_set("sensor.spilled", "2")
+    await hass.async_block_till_done()
+    assert instance.backlog == 0
+    assert instance.spill_info["buffered_events"] == 2
+
+    instance._async_check_queue()
+    assert instance.spill_info["draining"] is True
+    hass.states.async_set("sensor.spilled", "3")
+    # Draining hands off between the event loop and the recorder thread
+    # for every segment, so wait until the spill reports it is done
+    for _ in range(10):
+        await async_wait_recording_done(hass)
+        if not instance.spill_info["active"]:
+            break
+
+    spill_info = instance.spill_info
+    assert spill_info["active"] is False
+    assert spill_info["draining"] is False
+    assert spill_info["spilled_events"] >= 2
+    assert spill_info["drained_events"] == spill_info["spilled_events"]
+    assert spill_info["dropped_events"] == 0
+    assert spill_info["segments"] == 0
+    assert spill_info["spill_size"] == 0
+    assert spill_info["last_drain"] is not None
+    assert not list(tmp_path.joinpath(".storage", "recorder_spill").iterdir())
+
+    states = history.get_significant_states(
+        hass,
+        instance.recorder_runs_manager.recording_start,
+        entity_ids=["sensor.spilled"],
+    )
+    assert [state.state for state in states["sensor.spilled"]] == ["1", "2", "3"]
+
+
+async def test_leftover_segments_replayed_on_start(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test segments spilled by a previous run are replayed at startup."""
+    hass.config.config_dir = str(tmp_path)
+    previous_run = RecorderSpill(hass, hass.config.path(".storage", "recorder_spill"))
+    previous_run._run_prefix = "0" * 20
+    event = Event("previous_run_event", {"some": "data"})
+    await hass.async_add_executor_job(
+        previous_run._write_segment,
+        previous_run.path.joinpath(f"{previous_run._run_prefix}-0.jsonl"),
+        [event],
+    )
+
+    await async_setup_recorder_instance(hass, {CONF_SPILL_BACKLOG: True})
+    await async_wait_recording_done(hass)
+
+    assert not list(previous_run.path.iterdir())
+    with session_scope(hass=hass, read_only=True) as session:
+        assert (
+            session.query(EventTypes).filter_by(event_type="previous_run_event").count()
+            == 1
+        )
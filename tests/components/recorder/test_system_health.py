@@ -128,3 +128,19 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
     }
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"commit_interval": 1, "commit_latency_target": 0.5}]
+)
+async def test_recorder_system_health_adaptive_commit(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the adaptive commit controller."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["commit_transaction_size"] == 1000
+    assert info["commit_latency"].endswith(" ms")
+    assert info["commit_decision"] == "hold"
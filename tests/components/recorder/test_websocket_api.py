@@ -2560,11 +2560,14 @@ async def test_recorder_info(
     response = await client.receive_json()
     assert response["success"]
     assert response["result"] == {
+        "attributes_cache": ANY,
         "backlog": 0,
+        "commit": None,
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
         "recording": True,
+        "spill": None,
         "thread_running": True,
     }
 
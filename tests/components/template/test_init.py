@@ -260,6 +260,45 @@ async def test_reload_sensors_that_reference_other_template_sensors(
     assert hass.states.get("sensor.test3").state == "2"
 
 
+@pytest.mark.parametrize(("count", "domain"), [(1, "sensor")])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "sensor": {
+                "platform": DOMAIN,
+                "sensors": {
+                    "legacy": {"unique_id": "legacy", "value_template": "{{ 1 }}"},
+                },
+            },
+            "template": {
+                "unique_id": "section",
+                "sensor": [
+                    {"name": "unchanged", "unique_id": "unchanged", "state": "{{ 2 }}"},
+                    {"name": "changed", "unique_id": "changed", "state": "{{ 3 }}"},
+                    {"name": "removed", "unique_id": "removed", "state": "{{ 5 }}"},
+                ],
+            },
+        },
+    ],
+)
+@pytest.mark.usefixtures("start_ha")
+async def test_reload_keeps_unchanged_entities(hass: HomeAssistant) -> None:
+    """Test reloading only recreates template entities with a changed config."""
+    legacy = hass.states.get("sensor.legacy")
+    unchanged = hass.states.get("sensor.unchanged")
+    changed = hass.states.get("sensor.changed")
+    assert changed.state == "3"
+    assert hass.states.get("sensor.removed").state == "5"
+
+    await async_yaml_patch_helper(hass, "unique_id_configuration.yaml")
+
+    assert hass.states.get("sensor.legacy") is legacy
+    assert hass.states.get("sensor.unchanged") is unchanged
+    assert hass.states.get("sensor.changed").state == "4"
+    assert hass.states.get("sensor.removed").state == "unavailable"
+
+
 async def async_yaml_patch_helper(hass: HomeAssistant, filename: str) -> None:
     """Help update configuration.yaml."""
     yaml_path = get_fixture_path(filename, "template")
@@ -25,6 +25,7 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
@@ -706,6 +707,50 @@ async def test_get_services(
         assert msg["result"].keys() == hass.services.async_services().keys()
 
 
+async def test_get_services_delta(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_services only returns the domains which changed."""
+    hass.services.async_register("domain_a", "service_a", lambda call: None)
+    hass.services.async_register("domain_b", "service_b", lambda call: None)
+
+    await websocket_client.send_json({"id": 5, "type": "get_services", "hashes": {}})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    result = msg["result"]
+    assert result["services"].keys() == hass.services.async_services().keys()
+    assert result["hashes"].keys() == result["services"].keys()
+    assert result["removed"] == []
+    hashes = result["hashes"]
+    version = result["version"]
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "get_services", "hashes": hashes}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {
+        "version": version,
+        "hashes": hashes,
+        "services": {},
+        "removed": [],
+    }
+
+    hass.services.async_register("domain_a", "service_c", lambda call: None)
+    hass.services.async_remove("domain_b", "service_b")
+    await websocket_client.send_json(
+        {"id": 7, "type": "get_services", "hashes": hashes}
+    )
+    msg = await websocket_client.receive_json()
+    result = msg["result"]
+    assert result["version"] != version
+    assert result["services"].keys() == {"domain_a"}
+    assert result["services"]["domain_a"].keys() == {"service_a", "service_c"}
+    assert result["removed"] == ["domain_b"]
+    assert {
+        domain for domain in hashes if result["hashes"].get(domain) == hashes[domain]
+    } == set(hashes) - {"domain_a", "domain_b"}
+
+
 async def test_get_config(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -910,6 +955,123 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities_since(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities with the changes since a sequence."""
+
+    def _token(sequence: int) -> str:
+        return f"{hass.states.change_run_id}:{sequence}"
+
+    hass.states.async_set("light.permitted", "on")
+    hass.states.async_set("light.removed", "on")
+    hass.states.async_set("light.unchanged", "on")
+    hass.states.async_set("light.not_permitted", "on")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {
+                    "light.permitted": True,
+                    "light.removed": True,
+                    "light.unchanged": True,
+                }
+            }
+        }
+    )
+
+    # A token of a previous run
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "since": "previous:1"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # Unknown sequences get all states
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+            "light.removed": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+            "light.unchanged": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+        },
+        "s": _token(hass.states.async_change_sequence()),
+        "f": True,
+        "r": [],
+    }
+    sequence = hass.states.async_change_sequence()
+    assert msg["event"]["s"] == _token(sequence)
+
+    hass.states.async_set("light.permitted", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "off"}}},
+        "s": _token(sequence + 1),
+    }
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.permitted", "on")
+    hass.states.async_set("light.not_permitted", "off")
+    hass.states.async_remove("light.removed")
+    hass.states.async_remove("light.not_permitted")
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "since": _token(sequence + 1)}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["event"] == {
+        "a": {"light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "s": _token(sequence + 5),
+        "f": False,
+        "r": ["light.removed"],
+    }
+
+    await websocket_client.send_json(
+        {
+            "id": 10,
+            "type": "subscribe_entities",
+            "since": _token(sequence + 1),
+            "entity_ids": ["light.unchanged"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert msg["event"] == {"a": {}, "s": _token(sequence + 5), "f": False, "r": []}
+
+
+async def test_subscribe_entities_since_invalid_token(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities with an invalid token gets all states."""
+    hass.states.async_set("light.permitted", "on")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "since": "invalid"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["f"] is True
+    assert set(msg["event"]["a"]) == {"light.permitted"}
+
+
 async def test_subscribe_entities_with_unserializable_state(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2868,6 +3030,50 @@ async def test_integration_descriptions(
     assert response["result"]
 
 
+async def test_poll_timeline(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test we can get the timeline of upcoming polls."""
+    async_get_poll_scheduler(hass).async_next_poll(object(), "sensor.power", 30)
+
+    await websocket_client.send_json_auto_id({"type": "poll_scheduler/timeline"})
+    response = await websocket_client.receive_json()
+
+    assert response["success"]
+    result = response["result"]
+    assert result["bucket_seconds"] == 1
+    assert sum(result["histogram"]) == 2
+    assert [poller["name"] for poller in result["pollers"]] == ["sensor.power"]
+
+
+async def test_executor_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test we can get the executor job statistics."""
+    await hass.async_add_executor_job(len, [])
+
+    await websocket_client.send_json_auto_id({"type": "executor/stats"})
+    response = await websocket_client.receive_json()
+
+    assert response["success"]
+    result = response["result"]
+    assert result["max_jobs_per_integration"] == 16
+    assert result["integrations"]["homeassistant"]["by_job"]["len"]["jobs"] == 1
+
+
+async def test_http_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test we can get the stats of the HTTP routes."""
+    await websocket_client.send_json_auto_id({"type": "http/stats"})
+    response = await websocket_client.receive_json()
+
+    assert response["success"]
+    websocket_stats = response["result"]["routes"]["/api/websocket"]
+    assert websocket_stats["in_flight"] == 1
+    assert websocket_stats["requests"] == 0
+
+
 async def test_subscribe_entities_chained_state_change(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -6,6 +6,7 @@ from typing import Any, cast
 from unittest.mock import patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 import pytest
 
 from homeassistant.components.websocket_api import (
@@ -16,10 +17,15 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -523,3 +529,86 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_send_stats(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test messages and frames sent are counted and small frames not compressed."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    for idx in range(20):
+        hass.states.async_set(f"light.kitchen_{idx}", "on", {"brightness": 255})
+    # Size and RSV1 bit of the text frames sent by the server
+    text_frames: list[tuple[int, bool]] = []
+    send_frame = WebSocketWriter.send_frame
+
+    async def _send_frame(
+        writer: WebSocketWriter,
+        message: bytes,
+        opcode: int,
+        compress: int | None = None,
+    ) -> None:
+        if writer.use_mask or opcode != WSMsgType.TEXT:
+            await send_frame(writer, message, opcode, compress)
+            return
+        transport = writer.transport
+        with patch.object(transport, "write", wraps=transport.write) as mock_write:
+            await send_frame(writer, message, opcode, compress)
+        header = mock_write.call_args_list[0][0][0]
+        text_frames.append((len(message), bool(header[0] & 0x40)))
+
+    client = await hass_client_no_auth()
+    with patch.object(WebSocketWriter, "send_frame", _send_frame):
+        websocket_client = await client.ws_connect(const.URL, compress=15)
+        assert websocket_client.compress
+
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "auth_required"
+        await websocket_client.send_json(
+            {"type": "auth", "access_token": hass_access_token}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "auth_ok"
+
+        await websocket_client.send_json({"id": 1, "type": "ping"})
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "pong"
+        await websocket_client.send_json({"id": 2, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert len(msg["result"]) == 20
+
+        await websocket_client.send_json({"id": 3, "type": "websocket/stats"})
+        msg = await websocket_client.receive_json()
+    assert msg["success"]
+    stats = msg["result"]
+    # auth_required, auth_ok, pong and the get_states result
+    assert stats["frames"] == 4
+    assert stats["compressed_frames"] == 1
+    assert stats["messages"]["pong"]["count"] == 1
+    assert stats["messages"]["result"]["count"] == 1
+    assert stats["messages"]["result"]["bytes"] > 20 * 100
+    assert stats["frame_bytes"] > stats["messages"]["result"]["bytes"]
+    # auth_required is sent before the message queue is used
+    assert stats["messages"]["auth_required"]["count"] == 0
+    # Small frames are written with a 2 byte header, the result is compressed
+    assert stats["messages"]["auth_required"]["sent_bytes"] == text_frames[0][0] + 2
+    assert stats["messages"]["pong"]["sent_bytes"] == text_frames[2][0] + 2
+    assert (
+        0
+        < stats["messages"]["result"]["sent_bytes"]
+        < stats["messages"]["result"]["bytes"] / 2
+    )
+    assert stats["sent_bytes"] == sum(
+        message["sent_bytes"] for message in stats["messages"].values()
+    )
+    assert stats["sent_bytes"] < stats["frame_bytes"]
+
+    # Only the get_states result is compressed, the stats result is also sent
+    assert [rsv1 for _, rsv1 in text_frames] == [False, False, False, True, True]
+    assert all(
+        rsv1 == (size >= const.COMPRESS_MIN_FRAME_SIZE) for size, rsv1 in text_frames
+    )
+
+    await websocket_client.close()
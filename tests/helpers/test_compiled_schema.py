@@ -0,0 +1,103 @@
+"""Test compiled voluptuous schemas."""
+
+from typing import Any
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.compiled_schema import CompiledSchema
+
+SCHEMA = {
+    vol.Required("name"): cv.string,
+    vol.Optional("count", default=1): cv.positive_int,
+    vol.Optional("mode"): vol.In(["fast", "slow"]),
+    vol.Optional("nested"): {vol.Required("value"): int, "text": str},
+    vol.Remove("metadata"): dict,
+    "tags": [cv.string],
+}
+
+
+def _validate(schema: Any, data: Any) -> tuple[Any, str | None, list | None]:
+    """Return the validated data or the error of a schema."""
+    try:
+        return schema(data), None, None
+    except vol.Invalid as err:
+        return None, str(err), err.path
+
+
+@pytest.mark.parametrize(
+    "extra", [vol.PREVENT_EXTRA, vol.ALLOW_EXTRA, vol.REMOVE_EXTRA]
+)
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"name": "test"},
+        {"name": 5, "count": 3, "mode": "slow", "tags": ["a", 1]},
+        {"name": "test", "nested": {"value": 1, "text": "yes"}},
+        {"name": "test", "metadata": {}, "other": True},
+        {"name": "test", "metadata": "invalid"},
+        {"name": "test", "count": -1},
+        {"name": "test", "count": "2"},
+        {"name": "test", "mode": "medium"},
+        {"name": "test", "nested": {"text": "no"}},
+        {"name": "test", "nested": {"value": 1, "other": 2}},
+        {"name": None},
+        {"count": 1},
+        {},
+        ["name"],
+        None,
+    ],
+)
+def test_compiled_schema(extra: int, data: Any) -> None:
+    """Test compiled schemas return the same data and errors as vol.Schema."""
+    assert _validate(CompiledSchema(SCHEMA, extra=extra), data) == _validate(
+        vol.Schema(SCHEMA, extra=extra), data
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": "ALL"},
+        {"entity_id": "light.kitchen, light.living_room"},
+        {"entity_id": ["light.kitchen", "light.Living_Room"]},
+        {"entity_id": "{{ 'light.kitchen' }}"},
+        {"entity_id": ["light.kitchen", "{{ 'light.living_room' }}"]},
+        {"entity_id": "invalid"},
+        {"entity_id": None},
+        {"device_id": "none", "area_id": "kitchen"},
+        {"area_id": ["kitchen", "{{ area }}"]},
+        {"label_id": ["kitchen", 5]},
+        {"floor_id": {}},
+        {"metadata": {}, "entity_id": "light.kitchen"},
+        {"brightness": 5},
+    ],
+)
+async def test_entity_service_schema(hass: HomeAssistant, data: Any) -> None:
+    """Test the fast validators of entity service fields."""
+    compiled = cv.make_entity_service_schema({vol.Optional("brightness"): int})
+    regular = vol.All(
+        vol.Schema(
+            {
+                vol.Remove("metadata"): dict,
+                vol.Optional("brightness"): int,
+                **cv.ENTITY_SERVICE_FIELDS,
+            }
+        ),
+        cv.has_at_least_one_key(*cv.ENTITY_SERVICE_FIELDS),
+    )
+    assert _validate(compiled, data) == _validate(regular, data)
+
+
+def test_extend() -> None:
+    """Test extended compiled schemas are compiled."""
+    schema = CompiledSchema({vol.Required("id"): cv.positive_int}).extend(
+        {vol.Required("type"): "ping"}
+    )
+    assert isinstance(schema, CompiledSchema)
+    assert schema({"id": 1, "type": "ping"}) == {"id": 1, "type": "ping"}
+    with pytest.raises(vol.Invalid, match="not a valid value for dictionary value"):
+        schema({"id": 1, "type": "pong"})
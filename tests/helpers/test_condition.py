@@ -278,6 +278,97 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_and_condition_reorder(hass: HomeAssistant) -> None:
+    """Test the 'and' condition evaluates cheap conditions first when asked."""
+    config = {
+        "condition": "and",
+        "reorder": True,
+        "conditions": [
+            {"condition": "template", "value_template": "{{ 1 == 1 }}"},
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 120)
+    assert not test(hass)
+    condition_trace = trace.trace_get(clear=False)
+    trace.trace_clear()
+    # The template is skipped and the state condition keeps its index
+    assert list(condition_trace) == ["", "conditions/1", "conditions/1/entity_id/0"]
+    result = condition_trace[""][0]._result
+    assert result["result"] is False
+    assert result["order"] == [1, 0]
+    assert result["saved_time"] >= 0
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+    condition_trace = trace.trace_get(clear=False)
+    trace.trace_clear()
+    assert list(condition_trace) == [
+        "",
+        "conditions/1",
+        "conditions/1/entity_id/0",
+        "conditions/0",
+    ]
+    assert condition_trace[""][0]._result["saved_time"] == 0
+
+
+async def test_or_condition_reorder(hass: HomeAssistant) -> None:
+    """Test reordering an 'or' condition does not change the result or errors."""
+    config = {
+        "condition": "or",
+        "reorder": True,
+        "conditions": [
+            {"condition": "template", "value_template": "{{ false }}"},
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.temperature",
+                "below": 110,
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    with pytest.raises(ConditionError) as err:
+        test(hass)
+    # The errors are reported in the declared order
+    assert [error.index for error in err.value.errors] == [1, 2]
+
+    for state, expected in (("100", True), ("105", True), ("120", False)):
+        hass.states.async_set("sensor.temperature", state)
+        assert test(hass) is expected
+
+
+def test_condition_plan_keeps_device_conditions_in_place() -> None:
+    """Test conditions are only reordered between device conditions."""
+    state = {"condition": "state", "entity_id": "light.kitchen", "state": "on"}
+    template = {"condition": "template", "value_template": "{{ true }}"}
+    device = {"condition": "device", "device_id": "abcd", "domain": "light"}
+    plan = condition._ConditionPlan([template, state, device, template, state])
+    assert plan.order == [1, 0, 2, 4, 3]
+
+    # A condition which turns out to be slow moves back
+    for _ in range(16):
+        plan.record(1, 1.0, False)
+        plan.record(0, 1e-6, False)
+        plan.finish()
+    assert plan.order == [0, 1, 2, 4, 3]
+
+
 async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     """Test the 'and' condition shorthand."""
     config = {
@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -44,6 +45,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -2665,3 +2667,77 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_async_write_ha_state_coalesced(hass: HomeAssistant) -> None:
+    """Test writes in the same loop iteration are collapsed when opted in."""
+
+    class CoalescingEntity(entity.Entity):
+        _coalesce_state_writes = True
+
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    ent = CoalescingEntity()
+    ent.entity_id = "test.coalesced"
+    ent.hass = hass
+    ent.platform = MockEntityPlatform(hass, domain="test")
+
+    for value in range(3):
+        ent._attr_state = str(value)
+        ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id) is None
+
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "2"
+    assert len(state_changes) == 1
+    assert ent._state_writes_coalesced == 2
+
+    ent._attr_state = "3"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "3"
+    assert len(state_changes) == 2
+    assert ent._state_writes_coalesced == 2
+
+
+async def test_static_attributes_cached(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test attributes which do not depend on the state are only built on change."""
+    ent = entity.Entity()
+    ent.entity_id = "test.static"
+    ent.hass = hass
+    ent.platform = MockEntityPlatform(hass, domain="test")
+    ent._attr_name = "Power"
+    ent._attr_unit_of_measurement = "W"
+    ent.registry_entry = entity_registry.async_get_or_create(
+        "test", "test", "static", suggested_object_id="static"
+    )
+
+    with patch.object(
+        ent, "_friendly_name_internal", wraps=ent._friendly_name_internal
+    ) as friendly_name_mock:
+        for value in range(5):
+            ent._attr_state = str(value)
+            ent.async_write_ha_state()
+        assert len(friendly_name_mock.mock_calls) == 1
+        state = hass.states.get(ent.entity_id)
+        assert state.state == "4"
+        assert state.attributes == {
+            ATTR_FRIENDLY_NAME: "Power",
+            "unit_of_measurement": "W",
+        }
+
+        ent._attr_icon = "mdi:flash"
+        ent.async_write_ha_state()
+        assert len(friendly_name_mock.mock_calls) == 2
+        assert hass.states.get(ent.entity_id).attributes["icon"] == "mdi:flash"
+
+        ent.registry_entry = entity_registry.async_update_entity(
+            ent.entity_id, name="Grid power"
+        )
+        ent.async_write_ha_state()
+        assert hass.states.get(ent.entity_id).attributes == {
+            ATTR_FRIENDLY_NAME: "Grid power",
+            "icon": "mdi:flash",
+            "unit_of_measurement": "W",
+        }
@@ -37,6 +37,7 @@ from homeassistant.helpers.entity_component import (
     EntityComponent,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import dt as dt_util
 
@@ -126,6 +127,33 @@ async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     assert entity_platform._async_polling_timer is None
 
 
+async def test_reload_stops_and_restarts_polling(hass: HomeAssistant) -> None:
+    """Test polling is stopped during a reload and started for kept entities."""
+    entity_platform = MockEntityPlatform(hass)
+
+    def _reload_entity() -> MockEntity:
+        entity = MockEntity(should_poll=True, unique_id="poll")
+        entity._reload_config = {"name": "poll"}
+        return entity
+
+    poll_ent = _reload_entity()
+    await entity_platform.async_add_entities([poll_ent])
+    assert entity_platform._async_polling_timer is not None
+
+    await entity_platform.async_begin_reload()
+    assert entity_platform._async_polling_timer is None
+
+    await entity_platform.async_add_entities([_reload_entity()])
+    # The entity is kept instead of added, so it does not start polling
+    assert entity_platform._async_polling_timer is None
+
+    stats = await entity_platform.async_finish_reload()
+    assert stats.kept == 1
+    assert entity_platform.entities[poll_ent.entity_id] is poll_ent
+    assert entity_platform._async_polling_timer is not None
+    entity_platform.async_unsub_polling()
+
+
 async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> None:
     """Test the updated entities that not break with an exception."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -236,12 +264,10 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
-        await component.async_setup({DOMAIN: {"platform": "platform"}})
-
-        await hass.async_block_till_done()
-    assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+    pollers = async_get_poll_scheduler(hass).async_timeline()["pollers"]
+    assert [poller["interval"] for poller in pollers] == [30.0]
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -0,0 +1,142 @@
+"""Test the poll scheduler."""
+
+from datetime import timedelta
+import logging
+from unittest.mock import AsyncMock
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.poll_scheduler import (
+    TIMELINE_WINDOW,
+    async_get_poll_scheduler,
+    poll_offset,
+)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from tests.common import async_fire_time_changed
+
+
+async def test_polls_are_spread_across_the_interval(hass: HomeAssistant) -> None:
+    """Test pollers with the same interval get different slots."""
+    scheduler = async_get_poll_scheduler(hass)
+    now = hass.loop.time()
+    next_polls = [
+        scheduler.async_next_poll(poller, f"light.poller_{poller}", 30)
+        for poller in range(100)
+    ]
+    assert all(now < next_poll <= now + 30.001 for next_poll in next_polls)
+    # Each 3 second window of the interval gets some polls but not all
+    windows = {int((next_poll - now) // 3) for next_poll in next_polls}
+    assert len(windows) >= 8
+
+    timeline = scheduler.async_timeline()
+    assert len(timeline["histogram"]) == TIMELINE_WINDOW
+    # Every poller polls twice in the next 60 seconds
+    assert sum(timeline["histogram"]) == 200
+    assert len(timeline["pollers"]) == 100
+
+
+async def test_slot_is_stable(hass: HomeAssistant) -> None:
+    """Test a poller keeps its slot in the interval."""
+    scheduler = async_get_poll_scheduler(hass)
+    offset = poll_offset("sensor.power", 30)
+    assert offset == poll_offset("sensor.power", 30)
+    assert 0 <= offset < 30
+
+    first = scheduler.async_next_poll("poller", "sensor.power", 30)
+    second = scheduler.async_next_poll("poller", "sensor.power", 30)
+    assert first == second
+    assert (first - offset) % 30 < 0.001 or (first - offset) % 30 > 29.999
+
+    # Polling in the slot, also a bit late, keeps the next slot
+    assert scheduler.async_next_poll("poller", "sensor.power", 30, first) == first + 30
+    assert (
+        scheduler.async_next_poll("poller", "sensor.power", 30, first + 2) == first + 30
+    )
+    # Polling just before the slot waits for the slot after it
+    assert (
+        scheduler.async_next_poll("poller", "sensor.power", 30, first - 1) == first + 30
+    )
+
+    scheduler.async_record_poll("poller", 0.25)
+    (poller,) = scheduler.async_timeline()["pollers"]
+    assert poller["name"] == "sensor.power"
+    assert poller["polls"] == 1
+    assert poller["last_duration"] == 0.25
+
+    scheduler.async_remove("poller")
+    assert scheduler.async_timeline()["pollers"] == []
+
+
+async def test_coordinator_refresh_in_slot(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a coordinator refreshes in its slot and records the refresh."""
+    update_method = AsyncMock(return_value=1)
+    coordinator = DataUpdateCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        name="test",
+        update_method=update_method,
+        update_interval=timedelta(seconds=30),
+    )
+    coordinator.async_add_listener(lambda: None)
+    await coordinator.async_refresh()
+    assert update_method.call_count == 1
+
+    (poller,) = async_get_poll_scheduler(hass).async_timeline()["pollers"]
+    assert poller["name"] == "test"
+    assert 27 <= poller["next_poll"] < 57
+
+    freezer.tick(timedelta(seconds=60))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == 2
+    (poller,) = async_get_poll_scheduler(hass).async_timeline()["pollers"]
+    assert poller["polls"] == 1
+
+    await coordinator.async_shutdown()
+    assert async_get_poll_scheduler(hass).async_timeline()["pollers"] == []
+
+
+async def test_requested_refresh_waits_an_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a refresh just before the slot moves the next refresh an interval on."""
+    now = hass.loop.time()
+    # Find a name with a slot coming up shortly
+    name = next(
+        name
+        for name in (f"test_{index}" for index in range(10000))
+        if 0.5 <= (poll_offset(name, 30) - now) % 30 < 1.5
+    )
+    update_method = AsyncMock(return_value=1)
+    coordinator = DataUpdateCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        name=name,
+        update_method=update_method,
+        update_interval=timedelta(seconds=30),
+    )
+    coordinator.async_add_listener(lambda: None)
+    (poller,) = async_get_poll_scheduler(hass).async_timeline()["pollers"]
+    assert poller["next_poll"] < 1.5
+
+    await coordinator.async_request_refresh()
+    assert update_method.call_count == 1
+    (poller,) = async_get_poll_scheduler(hass).async_timeline()["pollers"]
+    assert 29 < poller["next_poll"] < 31.5
+
+    # No refresh in the slot right after the requested refresh
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == 1
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == 2
+
+    await coordinator.async_shutdown()
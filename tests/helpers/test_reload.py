@@ -21,6 +21,7 @@ from homeassistant.helpers.reload import (
 from homeassistant.loader import async_get_integration
 
 from tests.common import (
+    MockEntity,
     MockModule,
     MockPlatform,
     get_fixture_path,
@@ -73,6 +74,69 @@ async def test_reload_platform(hass: HomeAssistant) -> None:
     assert not async_get_platform_without_config_entry(hass, PLATFORM, DOMAIN)
 
 
+async def test_reload_platform_keeps_unchanged_entities(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test reloading a platform only recreates entities with a changed config."""
+    component_setup = Mock(return_value=True)
+
+    added_entities: dict[str, MockEntity] = {}
+
+    async def setup_platform(hass, config, async_add_entities, discovery_info=None):
+        entities = []
+        for name, sensor_config in (config.get("sensors") or {}).items():
+            entity = MockEntity(name=name, unique_id=name)
+            entity._reload_config = sensor_config
+            added_entities[name] = entity
+            entities.append(entity)
+        entities.append(MockEntity(name="no_unique_id"))
+        async_add_entities(entities)
+
+    mock_integration(hass, MockModule(DOMAIN, setup=component_setup))
+    mock_integration(hass, MockModule(PLATFORM, dependencies=[DOMAIN]))
+    mock_platform(
+        hass, f"{PLATFORM}.{DOMAIN}", MockPlatform(async_setup_platform=setup_platform)
+    )
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    sensors = {
+        "combined_sensor_energy_usage": {
+            "friendly_name": "Combined Sense Energy Usage",
+            "unit_of_measurement": "kW",
+            "value_template": (
+                "{{ ((states('sensor.energy_usage') | float) + "
+                "(states('sensor.energy_usage_2') | float)) / 1000 }}"
+            ),
+        },
+        "watching_tv_in_master_bedroom": {"friendly_name": "Old name"},
+        "removed_sensor": {"friendly_name": "Removed"},
+    }
+    await component.async_setup({DOMAIN: {"platform": PLATFORM, "sensors": sensors}})
+    await hass.async_block_till_done()
+
+    kept = added_entities["combined_sensor_energy_usage"]
+    changed = added_entities["watching_tv_in_master_bedroom"]
+    removed = added_entities["removed_sensor"]
+    assert len(hass.states.async_entity_ids(DOMAIN)) == 4
+
+    yaml_path = get_fixture_path("helpers/reload_configuration.yaml")
+    with patch.object(config, "YAML_CONFIG_FILE", yaml_path):
+        await async_reload_integration_platforms(hass, PLATFORM, [DOMAIN])
+    await hass.async_block_till_done()
+
+    entities = async_get_platform_without_config_entry(hass, PLATFORM, DOMAIN).entities
+    # The unchanged entity is kept, the changed one is replaced
+    assert entities[kept.entity_id] is kept
+    assert added_entities["combined_sensor_energy_usage"] is not kept
+    assert (
+        entities[changed.entity_id] is added_entities["watching_tv_in_master_bedroom"]
+    )
+    assert entities[changed.entity_id] is not changed
+    assert removed.entity_id not in entities
+    assert hass.states.get(removed.entity_id).attributes["restored"] is True
+    assert "1 entities kept, 1 recreated, 2 removed, 1 added" in caplog.text
+
+
 async def test_setup_reload_service(hass: HomeAssistant) -> None:
     """Test setting up a reload service."""
     component_setup = Mock(return_value=True)
@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Iterable
 from copy import deepcopy
+from functools import partial
 import io
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -39,15 +40,20 @@ from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
+    floor_registry as fr,
     service,
+    template,
 )
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
+    MockEntityPlatform,
     MockModule,
+    MockPlatform,
     MockUser,
     async_mock_service,
     mock_area_registry,
@@ -615,6 +621,89 @@ async def test_service_call_entry_id(
     assert dict(calls[0].data) == {"entity_id": ["hello.world"]}
 
 
+async def test_compiled_service_call(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test only the parts of a compiled service call with templates are rendered."""
+    config = cv.SERVICE_SCHEMA(
+        {
+            "action": "test_domain.test_service",
+            "target": {"entity_id": "light.kitchen"},
+            "data": {"brightness": 100},
+            "data_template": {"transition": "{{ transition }}"},
+        }
+    )
+    compiled = service.CompiledServiceCall(hass, config)
+
+    with patch(
+        "homeassistant.helpers.service.template.render_complex",
+        wraps=template.render_complex,
+    ) as mock_render:
+        params = compiled.async_render({"transition": 2})
+    # Only the data template is rendered
+    assert [call.args[0] for call in mock_render.call_args_list[:1]] == [
+        config["data_template"]
+    ]
+    assert params == {
+        "domain": "test_domain",
+        "service": "test_service",
+        "service_data": {"brightness": 100, "transition": 2},
+        "target": {"entity_id": ["light.kitchen"]},
+    }
+    assert params == service.async_prepare_call_from_config(
+        hass, config, {"transition": 2}
+    )
+
+    # The static parts can be changed by the service call
+    params["service_data"]["entity_id"] = "light.kitchen"
+    params["target"]["area_id"] = "kitchen"
+    assert compiled.async_render({"transition": 2}) == {
+        "domain": "test_domain",
+        "service": "test_service",
+        "service_data": {"brightness": 100, "transition": 2},
+        "target": {"entity_id": ["light.kitchen"]},
+    }
+
+    # Entities referred to by registry id are resolved for each call
+    entry = entity_registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="hall"
+    )
+    compiled = service.CompiledServiceCall(
+        hass,
+        cv.SERVICE_SCHEMA(
+            {"action": "test_domain.test_service", "target": {"entity_id": entry.id}}
+        ),
+    )
+    assert compiled.async_render()["target"] == {"entity_id": ["light.hall"]}
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.porch")
+    assert compiled.async_render()["target"] == {"entity_id": ["light.porch"]}
+
+
+async def test_compiled_service_call_copies_nested_data(hass: HomeAssistant) -> None:
+    """Test changing nested data of a rendered service call does not change the next."""
+    compiled = service.CompiledServiceCall(
+        hass,
+        cv.SERVICE_SCHEMA(
+            {
+                "action": "light.turn_on",
+                "target": {"entity_id": ["light.kitchen", "light.hall"]},
+                "data": {"rgb_color": [255, 0, 0], "effect": {"speed": 2}},
+            }
+        ),
+    )
+    params = compiled.async_render()
+    params["service_data"]["rgb_color"].append(0)
+    params["service_data"]["effect"]["speed"] = 5
+    params["target"]["entity_id"].remove("light.hall")
+
+    params = compiled.async_render()
+    assert params["service_data"] == {
+        "rgb_color": [255, 0, 0],
+        "effect": {"speed": 2},
+    }
+    assert params["target"] == {"entity_id": ["light.kitchen", "light.hall"]}
+
+
 @pytest.mark.parametrize("target", ["all", "none"])
 async def test_service_call_all_none(hass: HomeAssistant, target) -> None:
     """Test service call targeting all."""
@@ -801,6 +890,157 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_entity_ids_follows_registry_updates(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+) -> None:
+    """Test resolved targets are updated when the registries change."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    floor = floor_registry.async_create("Upstairs")
+    kitchen = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entity_registry.async_get_or_create(
+        "light", "test", "device_light", device_id=device.id
+    )
+    own_area = entity_registry.async_get_or_create("light", "test", "own_area")
+
+    floor_call = ServiceCall(hass, "light", "turn_on", {"floor_id": floor.floor_id})
+    area_call = ServiceCall(hass, "light", "turn_on", {"area_id": kitchen.id})
+    assert await service.async_extract_entity_ids(hass, floor_call) == set()
+    assert await service.async_extract_entity_ids(hass, area_call) == set()
+
+    area_registry.async_update(kitchen.id, floor_id=floor.floor_id)
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    entity_registry.async_update_entity(own_area.entity_id, area_id=kitchen.id)
+    assert await service.async_extract_entity_ids(hass, floor_call) == {
+        "light.test_device_light",
+        "light.test_own_area",
+    }
+    assert await service.async_extract_entity_ids(hass, area_call) == {
+        "light.test_device_light",
+        "light.test_own_area",
+    }
+
+    entity_registry.async_update_entity(
+        "light.test_device_light", hidden_by=er.RegistryEntryHider.USER
+    )
+    entity_registry.async_remove(own_area.entity_id)
+    assert await service.async_extract_entity_ids(hass, area_call) == set()
+
+    area_registry.async_update(kitchen.id, floor_id=None)
+    assert await service.async_extract_entity_ids(hass, floor_call) == set()
+
+
+async def test_extract_entity_ids_follows_disabled_entities(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test disabling and enabling an entity updates its device and area targets."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    entity_registry.async_get_or_create(
+        "light", "test", "device_light", device_id=device.id
+    )
+
+    device_call = ServiceCall(hass, "light", "turn_on", {"device_id": device.id})
+    area_call = ServiceCall(hass, "light", "turn_on", {"area_id": kitchen.id})
+    assert await service.async_extract_entity_ids(hass, device_call) == {
+        "light.test_device_light"
+    }
+    assert await service.async_extract_entity_ids(hass, area_call) == {
+        "light.test_device_light"
+    }
+
+    entity_registry.async_update_entity(
+        "light.test_device_light", disabled_by=er.RegistryEntryDisabler.USER
+    )
+    assert await service.async_extract_entity_ids(hass, device_call) == set()
+    assert await service.async_extract_entity_ids(hass, area_call) == set()
+
+    entity_registry.async_update_entity("light.test_device_light", disabled_by=None)
+    assert await service.async_extract_entity_ids(hass, device_call) == {
+        "light.test_device_light"
+    }
+    assert await service.async_extract_entity_ids(hass, area_call) == {
+        "light.test_device_light"
+    }
+
+
+async def test_extract_entity_ids_large_registry(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+) -> None:
+    """Test resolving targets in a large registry only walks it once."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    floors = [floor_registry.async_create(f"Floor {i}") for i in range(5)]
+    areas = [
+        area_registry.async_create(f"Area {i}", floor_id=floors[i % 5].floor_id)
+        for i in range(50)
+    ]
+    for device_number in range(1000):
+        device = device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            identifiers={("test", str(device_number))},
+        )
+        device_registry.async_update_device(
+            device.id, area_id=areas[device_number % 50].id
+        )
+        for entity_number in range(5):
+            entity_registry.async_get_or_create(
+                "light",
+                "test",
+                f"{device_number}-{entity_number}",
+                device_id=device.id,
+            )
+    assert len(entity_registry.entities) == 5000
+
+    call = ServiceCall(hass, "light", "turn_off", {"floor_id": floors[2].floor_id})
+    expected = {
+        entry.entity_id
+        for entry in entity_registry.entities.values()
+        if int(entry.unique_id.split("-")[0]) % 5 == 2
+    }
+    assert len(expected) == 1000
+    assert await service.async_extract_entity_ids(hass, call) == expected
+
+    with (
+        patch.object(
+            entity_registry.entities,
+            "get_entries_for_device_id",
+            side_effect=AssertionError,
+        ),
+        patch.object(
+            device_registry.devices,
+            "get_devices_for_area_id",
+            side_effect=AssertionError,
+        ),
+        patch.object(
+            area_registry.areas, "get_areas_for_floor", side_effect=AssertionError
+        ),
+    ):
+        for _ in range(10):
+            assert await service.async_extract_entity_ids(hass, call) == expected
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
@@ -1400,6 +1640,85 @@ async def test_call_with_sync_attr(hass: HomeAssistant, mock_entities) -> None:
     assert mock_method.mock_calls[0][2] == {}
 
 
+@pytest.mark.parametrize("handled", [True, False])
+async def test_call_with_platform_batch(
+    hass: HomeAssistant, mock_entities, handled: bool
+) -> None:
+    """Test a platform can handle a service call for all its entities at once."""
+    batch_handler = AsyncMock(return_value=handled)
+    platform = MockEntityPlatform(
+        hass, platform=MockPlatform(), platform_name="batching"
+    )
+    platform.platform.async_handle_entity_service_batch = batch_handler
+    for entity_id in ("light.kitchen", "light.living_room"):
+        mock_entities[entity_id].platform = platform
+    calls: list[str] = []
+    for entity in mock_entities.values():
+        entity.async_turn_on = partial(
+            AsyncMock(side_effect=calls.append), entity.entity_id
+        )
+
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        "async_turn_on",
+        ServiceCall(
+            hass,
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.living_room", "light.bedroom"]},
+        ),
+    )
+
+    assert len(batch_handler.mock_calls) == 1
+    _, batch, method, data = batch_handler.mock_calls[0].args
+    assert sorted(entity.entity_id for entity in batch) == [
+        "light.kitchen",
+        "light.living_room",
+    ]
+    assert method == "async_turn_on"
+    assert data == {}
+    if handled:
+        assert calls == ["light.bedroom"]
+    else:
+        assert sorted(calls) == ["light.bedroom", "light.kitchen", "light.living_room"]
+
+
+async def test_call_with_platform_batch_parallel_updates(
+    hass: HomeAssistant, mock_entities
+) -> None:
+    """Test a platform batch holds the platform's parallel updates semaphore."""
+    parallel_updates = asyncio.Semaphore(1)
+    locked_during_batch: list[bool] = []
+
+    async def batch_handler(*args: Any) -> bool:
+        locked_during_batch.append(parallel_updates.locked())
+        return True
+
+    platform = MockEntityPlatform(
+        hass, platform=MockPlatform(), platform_name="batching"
+    )
+    platform.platform.async_handle_entity_service_batch = batch_handler
+    for entity_id in ("light.kitchen", "light.living_room"):
+        mock_entities[entity_id].platform = platform
+        mock_entities[entity_id].parallel_updates = parallel_updates
+
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        "async_turn_on",
+        ServiceCall(
+            hass,
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.living_room"]},
+        ),
+    )
+
+    assert locked_during_batch == [True]
+    assert not parallel_updates.locked()
+
+
 async def test_call_context_user_not_exist(hass: HomeAssistant) -> None:
     """Check we don't allow deleted users to do things."""
     with pytest.raises(exceptions.UnknownUser) as err:
@@ -1,6 +1,9 @@
 """Test the translation helper."""
 
 import asyncio
+from datetime import timedelta
+import json
+import os
 import pathlib
 from typing import Any
 from unittest.mock import Mock, call, patch
@@ -8,10 +11,16 @@ from unittest.mock import Mock, call, patch
 import pytest
 
 from homeassistant import loader
-from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+)
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture(autouse=True)
@@ -712,3 +721,202 @@ async def test_get_translations_still_has_title_without_translations_files(
     assert translations == {
         "component.component1.title": "Component 1",
     }
+
+
+async def test_translation_packs(hass: HomeAssistant, tmp_path: pathlib.Path) -> None:
+    """Test translations are stored in packs and reused while unchanged."""
+    hass.config.config_dir = str(tmp_path / "config")
+    (tmp_path / "config" / ".storage").mkdir(parents=True)
+    integrations: dict[str, Mock] = {}
+    for domain in ("component1", "component2"):
+        translations_dir = tmp_path / domain / "translations"
+        translations_dir.mkdir(parents=True)
+        (translations_dir / "en.json").write_text(
+            json.dumps(
+                {
+                    "entity": {"sensor": {"power": {"name": "Power"}}},
+                    "exceptions": {"failed": {"message": "Failed"}},
+                }
+            )
+        )
+        (translations_dir / "de.json").write_text(
+            json.dumps({"entity": {"sensor": {"power": {"name": "Leistung"}}}})
+        )
+        integration = Mock(file_path=tmp_path / domain, has_translations=True)
+        integration.name = domain.title()
+        integrations[domain] = integration
+
+    with patch(
+        "homeassistant.helpers.translation.async_get_integrations",
+        side_effect=lambda hass, domains: {
+            domain: integrations[domain] for domain in domains
+        },
+    ):
+        assert await translation.async_get_translations(
+            hass, "de", "entity", integrations
+        ) == {
+            "component.component1.entity.sensor.power.name": "Leistung",
+            "component.component2.entity.sensor.power.name": "Leistung",
+        }
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow()
+            + timedelta(seconds=translation.TRANSLATION_PACK_SAVE_DELAY),
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert (
+            tmp_path / "config" / ".storage" / "translation_packs" / "de.pack"
+        ).is_file()
+
+        # Only the translations which changed are loaded from their files
+        component2_de = tmp_path / "component2" / "translations" / "de.json"
+        component2_de.write_text(
+            json.dumps({"entity": {"sensor": {"power": {"name": "Wirkleistung"}}}})
+        )
+        stat = component2_de.stat()
+        os.utime(component2_de, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache = translation._TranslationCache(hass)
+        with patch(
+            "homeassistant.helpers.translation._load_translations_files_by_language",
+            side_effect=translation._load_translations_files_by_language,
+        ) as mock_load:
+            await cache.async_load("de", set(integrations))
+
+    assert mock_load.call_args[0][0] == {
+        "en": {"component2": tmp_path / "component2" / "translations" / "en.json"},
+        "de": {"component2": component2_de},
+    }
+    assert cache.get_cached("de", "entity", set(integrations)) == {
+        "component.component1.entity.sensor.power.name": "Leistung",
+        "component.component2.entity.sensor.power.name": "Wirkleistung",
+    }
+    assert cache.get_cached("de", "exceptions", set(integrations)) == {
+        "component.component1.exceptions.failed.message": "Failed",
+        "component.component2.exceptions.failed.message": "Failed",
+    }
+    assert cache.get_cached("de", "title", {"component1"}) == {
+        "component.component1.title": "Component1"
+    }
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=translation.TRANSLATION_PACK_SAVE_DELAY),
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_translation_pack_keeps_unchanged_categories_packed(
+    hass: HomeAssistant, tmp_path: pathlib.Path
+) -> None:
+    """Test saving a pack only decodes the categories which changed."""
+    hass.config.config_dir = str(tmp_path / "config")
+    (tmp_path / "config" / ".storage").mkdir(parents=True)
+    integrations: dict[str, Mock] = {}
+    for domain, resources in (
+        (
+            "component1",
+            {
+                "entity": {"sensor": {"power": {"name": "Leistung"}}},
+                "exceptions": {"failed": {"message": "Fehlgeschlagen"}},
+            },
+        ),
+        ("component2", {"entity": {"sensor": {"energy": {"name": "Energie"}}}}),
+    ):
+        translations_dir = tmp_path / domain / "translations"
+        translations_dir.mkdir(parents=True)
+        (translations_dir / "en.json").write_text(json.dumps(resources))
+        (translations_dir / "de.json").write_text(json.dumps(resources))
+        integration = Mock(file_path=tmp_path / domain, has_translations=True)
+        integration.name = domain.title()
+        integrations[domain] = integration
+
+    async def _save_pack() -> None:
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow()
+            + timedelta(seconds=translation.TRANSLATION_PACK_SAVE_DELAY),
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    with patch(
+        "homeassistant.helpers.translation.async_get_integrations",
+        side_effect=lambda hass, domains: {
+            domain: integrations[domain] for domain in domains
+        },
+    ):
+        await translation.async_get_translations(hass, "de", "entity", {"component1"})
+        await _save_pack()
+
+        # A new component only adds to the categories it has translations for
+        cache = translation._TranslationCache(hass)
+        await cache.async_load("de", {"component1", "component2"})
+        pack = cache.cache_data.packs["de"]
+        assert set(pack.packed) == {"entity", "exceptions", "title"}
+        with patch(
+            "homeassistant.helpers.translation.json_loads",
+            wraps=translation.json_loads,
+        ) as mock_loads:
+            await _save_pack()
+        assert mock_loads.call_count == 2
+        assert set(pack.packed) == {"exceptions"}
+        assert set(pack.unpacked) == {"entity", "title"}
+
+        cache = translation._TranslationCache(hass)
+        with patch(
+            "homeassistant.helpers.translation._load_translations_files_by_language",
+        ) as mock_load:
+            await cache.async_load("de", {"component1", "component2"})
+    mock_load.assert_not_called()
+    assert cache.get_cached("de", "entity", {"component1", "component2"}) == {
+        "component.component1.entity.sensor.power.name": "Leistung",
+        "component.component2.entity.sensor.energy.name": "Energie",
+    }
+    assert cache.get_cached("de", "exceptions", {"component1", "component2"}) == {
+        "component.component1.exceptions.failed.message": "Fehlgeschlagen",
+    }
+
+
+async def test_translation_pack_written_on_final_write(
+    hass: HomeAssistant, tmp_path: pathlib.Path
+) -> None:
+    """Test a pack is written on the final write instead of after the delay."""
+    hass.config.config_dir = str(tmp_path / "config")
+    (tmp_path / "config" / ".storage").mkdir(parents=True)
+    translations_dir = tmp_path / "component1" / "translations"
+    translations_dir.mkdir(parents=True)
+    (translations_dir / "en.json").write_text(
+        json.dumps({"entity": {"sensor": {"power": {"name": "Power"}}}})
+    )
+    integration = Mock(file_path=tmp_path / "component1", has_translations=True)
+    integration.name = "Component1"
+
+    with (
+        patch(
+            "homeassistant.helpers.translation.async_get_integrations",
+            return_value={"component1": integration},
+        ),
+        patch(
+            "homeassistant.helpers.translation._write_translation_pack",
+            wraps=translation._write_translation_pack,
+        ) as mock_write,
+    ):
+        await translation.async_get_translations(hass, "en", "entity", {"component1"})
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert mock_write.call_count == 1
+
+        # The delayed write was cancelled
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow()
+            + timedelta(seconds=translation.TRANSLATION_PACK_SAVE_DELAY),
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert mock_write.call_count == 1
+
+    pack = translation._read_translation_pack(hass.config.config_dir, "en")
+    assert pack.sources["component1"][0] == "Component1"
+    assert json.loads(pack.packed["entity"]) == {
+        "component1": {"component.component1.entity.sensor.power.name": "Power"}
+    }
+    hass.set_state(CoreState.running)
@@ -1,13 +1,17 @@
 """The tests for the trigger helper."""
 
-from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
+import asyncio
+from datetime import timedelta
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, call, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
 from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.trigger import (
     DATA_PLUGGABLE_ACTIONS,
+    DATA_SHARED_TRIGGERS,
     PluggableAction,
     _async_get_trigger_platform,
     async_initialize_triggers,
@@ -15,6 +19,8 @@ from homeassistant.helpers.trigger import (
 )
 from homeassistant.setup import async_setup_component
 
+from tests.common import async_fire_time_changed
+
 
 async def test_bad_trigger_platform(hass: HomeAssistant) -> None:
     """Test bad trigger platform."""
@@ -351,6 +357,148 @@ async def test_async_initialize_triggers(
         unsub()
 
 
+async def test_shared_triggers(hass: HomeAssistant) -> None:
+    """Test identical triggers of different automations share one trigger."""
+    log_cb = MagicMock()
+    calls: dict[str, list[dict]] = {"first": [], "second": [], "template": []}
+
+    def _action(name: str):
+        @callback
+        def action(run_variables, context=None):
+            calls[name].append(run_variables)
+
+        return action
+
+    trigger = {"platform": "state", "entity_id": "binary_sensor.motion", "to": "on"}
+    unsubs = {}
+    for name, config in (
+        ("first", {**trigger, "id": "first"}),
+        ("second", {**trigger, "id": "second", "variables": {"room": "hall"}}),
+        ("template", {**trigger, "for": "{{ 0 }}"}),
+    ):
+        trigger_config = await async_validate_trigger_config(hass, [config])
+        unsubs[name] = await async_initialize_triggers(
+            hass, trigger_config, _action(name), "automation", name, log_cb
+        )
+
+    # The trigger with a template is attached separately
+    (shared,) = hass.data[DATA_SHARED_TRIGGERS].values()
+    assert len(shared.subscribers) == 2
+
+    hass.states.async_set("binary_sensor.motion", "on")
+    await hass.async_block_till_done()
+    assert [call["trigger"]["id"] for call in calls["first"]] == ["first"]
+    assert [call["trigger"]["id"] for call in calls["second"]] == ["second"]
+    assert calls["second"][0]["room"] == "hall"
+    assert "room" not in calls["first"][0]
+    assert calls["first"][0]["trigger"]["to_state"].state == "on"
+
+    unsubs["first"]()
+    hass.states.async_set("binary_sensor.motion", "off")
+    hass.states.async_set("binary_sensor.motion", "on")
+    await hass.async_block_till_done()
+    assert len(calls["first"]) == 1
+    assert len(calls["second"]) == 2
+
+    unsubs["second"]()
+    unsubs["template"]()
+    assert not hass.data[DATA_SHARED_TRIGGERS]
+    hass.states.async_set("binary_sensor.motion", "off")
+    hass.states.async_set("binary_sensor.motion", "on")
+    await hass.async_block_till_done()
+    assert len(calls["second"]) == 2
+
+
+async def test_trigger_with_duration_not_shared(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a trigger attached during the duration of another does not fire."""
+    calls: dict[str, list[dict]] = {"first": [], "second": []}
+
+    def _action(name: str):
+        @callback
+        def action(run_variables, context=None):
+            calls[name].append(run_variables)
+
+        return action
+
+    trigger_config = await async_validate_trigger_config(
+        hass,
+        [
+            {
+                "platform": "state",
+                "entity_id": "binary_sensor.motion",
+                "to": "on",
+                "for": {"seconds": 5},
+            }
+        ],
+    )
+    unsub_first = await async_initialize_triggers(
+        hass, trigger_config, _action("first"), "automation", "first", MagicMock()
+    )
+    hass.states.async_set("binary_sensor.motion", "on")
+    await hass.async_block_till_done()
+
+    freezer.tick(timedelta(seconds=3))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    unsub_second = await async_initialize_triggers(
+        hass, trigger_config, _action("second"), "automation", "second", MagicMock()
+    )
+    assert not hass.data.get(DATA_SHARED_TRIGGERS)
+
+    freezer.tick(timedelta(seconds=3))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(calls["first"]) == 1
+    # The state did not change since the second trigger was attached
+    assert not calls["second"]
+
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(calls["first"]) == 1
+    assert not calls["second"]
+
+    unsub_first()
+    unsub_second()
+
+
+async def test_shared_trigger_removed_while_attaching(hass: HomeAssistant) -> None:
+    """Test a shared trigger is detached when removed before it was attached."""
+    attached = asyncio.Event()
+    remove = Mock()
+
+    async def _attach_trigger(*args):
+        await attached.wait()
+        return remove
+
+    trigger_config = await async_validate_trigger_config(
+        hass, [{"platform": "state", "entity_id": "binary_sensor.motion", "to": "on"}]
+    )
+    with patch(
+        "homeassistant.components.homeassistant.triggers.state.async_attach_trigger",
+        side_effect=_attach_trigger,
+    ):
+        task = hass.async_create_task(
+            async_initialize_triggers(
+                hass, trigger_config, Mock(), "automation", "test", MagicMock()
+            )
+        )
+        await asyncio.sleep(0)
+        (shared,) = hass.data[DATA_SHARED_TRIGGERS].values()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not hass.data[DATA_SHARED_TRIGGERS]
+        remove.assert_not_called()
+
+        attached.set()
+        await shared.attach
+    remove.assert_called_once_with()
+
+
 async def test_pluggable_action(
     hass: HomeAssistant, service_calls: list[ServiceCall]
 ) -> None:
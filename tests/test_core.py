@@ -1488,6 +1488,56 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_changes_since(hass: HomeAssistant) -> None:
+    """Test the states changed and entities removed after a change sequence."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.ceiling", "on")
+    run_id = hass.states.change_run_id
+    sequence = hass.states.async_change_sequence()
+    assert hass.states.async_changes_since(run_id, sequence) == ([], [])
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("light.ceiling")
+    # Setting the same state again is not a change
+    hass.states.async_set("light.kitchen", "off")
+    assert hass.states.async_change_sequence() == sequence + 2
+    assert hass.states.async_changes_since(run_id, sequence) == (
+        [hass.states.get("light.kitchen")],
+        ["light.ceiling"],
+    )
+    assert hass.states.async_changes_since(run_id, sequence + 2) == ([], [])
+
+    # Entities added again are no longer removed
+    hass.states.async_set("light.ceiling", "off")
+    assert hass.states.async_changes_since(run_id, sequence) == (
+        [hass.states.get("light.kitchen"), hass.states.get("light.ceiling")],
+        [],
+    )
+
+    # Unknown sequences and the sequences of a previous run are not supported
+    assert hass.states.async_changes_since(run_id, sequence + 4) is None
+    assert hass.states.async_changes_since("previous run", sequence) is None
+
+
+async def test_statemachine_changes_since_removals_retained(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes since a sequence are unknown once removals are forgotten."""
+    run_id = hass.states.change_run_id
+    sequence = hass.states.async_change_sequence()
+    with patch.object(ha, "MAX_RETAINED_STATE_REMOVALS", 2):
+        for entity_id in ("light.bowl", "light.kitchen", "light.ceiling"):
+            hass.states.async_set(entity_id, "on")
+            hass.states.async_remove(entity_id)
+
+    assert hass.states.async_changes_since(run_id, sequence) is None
+    assert hass.states.async_changes_since(run_id, sequence + 2) == (
+        [],
+        ["light.kitchen", "light.ceiling"],
+    )
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -3013,6 +3063,16 @@ async def test_async_add_import_executor_job(hass: HomeAssistant) -> None:
     assert hass.import_executor._max_workers == 1
 
 
+async def test_async_add_priority_executor_job(hass: HomeAssistant) -> None:
+    """Test async_add_priority_executor_job runs in the priority executor."""
+
+    def executor_func() -> str:
+        return threading.current_thread().name
+
+    thread_name = await hass.async_add_priority_executor_job(executor_func)
+    assert thread_name.startswith("PriorityExecutor")
+
+
 async def test_async_run_job_deprecated(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -0,0 +1,155 @@
+"""Test executor admission control."""
+
+import asyncio
+from functools import partial
+import threading
+
+import pytest
+
+from homeassistant.util.executor_admission import (
+    CORE_KEY,
+    ExecutorAdmission,
+    job_origin,
+)
+
+
+def _blocking_job(event: threading.Event, value: int) -> int:
+    """Wait for the event and return the value."""
+    event.wait(5)
+    return value
+
+
+def _failing_job() -> None:
+    """Raise an error."""
+    raise ValueError("boom")
+
+
+def _integration_job(func, integration: str):
+    """Return a copy of a job which looks like it belongs to an integration."""
+
+    def job(*args):
+        return func(*args)
+
+    job.__module__ = f"homeassistant.components.{integration}.sensor"
+    job.__qualname__ = f"{integration}_{func.__name__}"
+    return job
+
+
+def test_job_origin() -> None:
+    """Test the integration and name of a job."""
+    job = _integration_job(_blocking_job, "demo")
+    assert job_origin(job) == ("demo", "demo__blocking_job")
+    assert job_origin(partial(partial(job, 1), 2)) == ("demo", "demo__blocking_job")
+    assert job_origin(_blocking_job) == (None, "_blocking_job")
+    assert job_origin(len) == (None, "len")
+
+    custom = _integration_job(_blocking_job, "demo")
+    custom.__module__ = "custom_components.my_custom.sensor"
+    assert job_origin(custom)[0] == "my_custom"
+
+
+async def test_cancelled_job_keeps_slot_until_it_returns() -> None:
+    """Test a cancelled job which is still running holds its slot."""
+    loop = asyncio.get_running_loop()
+    admission = ExecutorAdmission(loop, 1)
+    started = threading.Event()
+    event = threading.Event()
+    job = _integration_job(_blocking_job, "demo")
+
+    def _start_and_block(value: int) -> int:
+        started.set()
+        return _blocking_job(event, value)
+
+    first = admission.run_in_executor(
+        None, _integration_job(_start_and_block, "demo"), 1
+    )
+    await loop.run_in_executor(None, started.wait, 5)
+    first.cancel()
+    await asyncio.sleep(0)
+
+    second = admission.run_in_executor(None, job, event, 2)
+    stats = admission.as_dict()
+    assert stats["running"] == {"demo": 1}
+    assert stats["waiting"] == {"demo": 1}
+
+    event.set()
+    assert await second == 2
+    assert admission.as_dict()["running"] == {"demo": 0}
+    assert admission.stats["demo"].jobs == 2
+
+
+async def test_integration_limit() -> None:
+    """Test an integration only runs a limited number of jobs at the same time."""
+    loop = asyncio.get_running_loop()
+    admission = ExecutorAdmission(loop, 2)
+    event = threading.Event()
+    job = _integration_job(_blocking_job, "demo")
+
+    futures = [admission.run_in_executor(None, job, event, value) for value in range(5)]
+    # Jobs of other integrations and the core are not held back
+    other_event = threading.Event()
+    other = admission.run_in_executor(
+        None, _integration_job(_blocking_job, "other"), other_event, 5
+    )
+    unlimited = admission.run_in_executor(None, len, [1, 2])
+    assert await unlimited == 2
+
+    stats = admission.as_dict()
+    assert stats["running"] == {"demo": 2, "other": 1}
+    assert stats["waiting"] == {"demo": 3}
+    assert stats["integrations"]["demo"]["throttled"] == 3
+
+    event.set()
+    assert await asyncio.gather(*futures) == [0, 1, 2, 3, 4]
+    stats = admission.as_dict()
+    assert stats["running"]["demo"] == 0
+    assert stats["waiting"] == {}
+    demo = stats["integrations"]["demo"]
+    assert demo["jobs"] == 5
+    assert sum(demo["wait_histogram"]) == 5
+    assert sum(demo["run_histogram"]) == 5
+    assert demo["by_job"]["demo__blocking_job"]["jobs"] == 5
+    assert stats["integrations"][CORE_KEY]["by_job"]["len"]["jobs"] == 1
+    other_event.set()
+    assert await other == 5
+
+
+async def test_waiting_job_errors_and_cancel() -> None:
+    """Test errors of waiting jobs are passed on and cancelled jobs are skipped."""
+    loop = asyncio.get_running_loop()
+    admission = ExecutorAdmission(loop, 1)
+    event = threading.Event()
+    job = _integration_job(_blocking_job, "demo")
+
+    first = admission.run_in_executor(None, job, event, 1)
+    cancelled = admission.run_in_executor(None, job, event, 2)
+    failing = admission.run_in_executor(None, _integration_job(_failing_job, "demo"))
+    cancelled.cancel()
+    event.set()
+
+    assert await first == 1
+    with pytest.raises(ValueError, match="boom"):
+        await failing
+    assert admission.as_dict()["running"] == {"demo": 0}
+    assert admission.stats["demo"].jobs == 2
+
+
+async def test_waiting_job_started_after_max_queue_wait() -> None:
+    """Test a job waiting too long starts above the limit of its integration."""
+    loop = asyncio.get_running_loop()
+    admission = ExecutorAdmission(loop, 1, max_queue_wait=0.05)
+    event = threading.Event()
+
+    # The first job waits on the second job, which would never get a slot
+    first = admission.run_in_executor(
+        None, _integration_job(_blocking_job, "demo"), event, 1
+    )
+    second = admission.run_in_executor(None, _integration_job(event.set, "demo"))
+    assert admission.as_dict()["waiting"] == {"demo": 1}
+
+    assert await asyncio.wait_for(asyncio.gather(first, second), 5) == [1, None]
+    stats = admission.as_dict()
+    assert stats["running"] == {"demo": 0}
+    assert stats["waiting"] == {}
+    assert stats["integrations"]["demo"]["throttled"] == 1
+    assert stats["integrations"]["demo"]["overdue"] == 1
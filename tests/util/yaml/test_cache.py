@@ -0,0 +1,149 @@
+"""Test the cache of parsed YAML files."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import yaml as yaml_util
+from homeassistant.util.json import json_loads
+from homeassistant.util.yaml.cache import CACHE_VERSION, YamlCache
+
+
+def _load(config_dir: Path, cache_path: Path) -> tuple[dict, YamlCache]:
+    """Load the configuration with the cache stored in a file."""
+    cache = YamlCache.from_file(str(cache_path))
+    with cache.activate():
+        config = yaml_util.load_yaml_dict(
+            config_dir / "configuration.yaml",
+            yaml_util.Secrets(config_dir),
+        )
+    cache.save(str(cache_path))
+    return config, cache
+
+
+def _write(path: Path, content: str) -> None:
+    """Write a file with a new modification time."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_yaml_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test unchanged files are reused and changed files are parsed again."""
+    monkeypatch.setenv("YAML_CACHE_TEST", "from env")
+    config_dir = tmp_path / "config"
+    (config_dir / "sensors").mkdir(parents=True)
+    cache_path = tmp_path / "yaml_cache"
+    _write(
+        config_dir / "configuration.yaml",
+        "automation: !include automations.yaml\n"
+        "sensor: !include_dir_merge_named sensors\n"
+        "name: !env_var YAML_CACHE_TEST\n",
+    )
+    _write(config_dir / "automations.yaml", "- alias: !secret alias\n")
+    _write(config_dir / "secrets.yaml", "alias: Wake up\n")
+    _write(config_dir / "sensors" / "one.yaml", "one:\n  value: 1\n")
+
+    config, cache = _load(config_dir, cache_path)
+    expected = {
+        "automation": [{"alias": "Wake up"}],
+        "sensor": {"one": {"value": 1}},
+        "name": "from env",
+    }
+    assert config == expected
+    assert len(cache.parsed) == 3
+
+    config, cache = _load(config_dir, cache_path)
+    assert config == expected
+    assert cache.parsed == []
+    assert len(cache.unchanged) == 3
+    # The location of the configuration is kept
+    assert config["automation"][0]["alias"].__line__ == 1
+    assert config["automation"][0].__config_file__ == str(
+        config_dir / "automations.yaml"
+    )
+
+    # Secrets are resolved again without parsing the files using them
+    _write(config_dir / "secrets.yaml", "alias: Sleep\n")
+    config, cache = _load(config_dir, cache_path)
+    assert config["automation"] == [{"alias": "Sleep"}]
+    assert cache.parsed == []
+
+    # Only the changed file and the files including it are parsed again
+    _write(config_dir / "automations.yaml", "- alias: !secret alias\n  id: 1\n")
+    config, cache = _load(config_dir, cache_path)
+    assert config["automation"] == [{"alias": "Sleep", "id": 1}]
+    assert {Path(path).name for path in cache.parsed} == {
+        "configuration.yaml",
+        "automations.yaml",
+    }
+
+    # Touching a file does not parse it again
+    os.utime(config_dir / "sensors" / "one.yaml")
+    _write(config_dir / "sensors" / "two.yaml", "two:\n  value: 2\n")
+    config, cache = _load(config_dir, cache_path)
+    assert config["sensor"] == {"one": {"value": 1}, "two": {"value": 2}}
+    assert {Path(path).name for path in cache.parsed} == {
+        "configuration.yaml",
+        "two.yaml",
+    }
+
+    monkeypatch.setenv("YAML_CACHE_TEST", "changed")
+    config, cache = _load(config_dir, cache_path)
+    assert config["name"] == "changed"
+    assert [Path(path).name for path in cache.parsed] == ["configuration.yaml"]
+
+
+def test_yaml_cache_invalid_file(tmp_path: Path) -> None:
+    """Test an invalid cache file is ignored."""
+    cache_path = tmp_path / "yaml_cache"
+    cache_path.write_bytes(b"invalid")
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    _write(config_dir / "configuration.yaml", "name: test\n")
+
+    config, cache = _load(config_dir, cache_path)
+    assert config == {"name": "test"}
+    assert len(cache.parsed) == 1
+    config, cache = _load(config_dir, cache_path)
+    assert config == {"name": "test"}
+    assert cache.parsed == []
+
+
+def test_yaml_cache_stored_as_json_without_secrets(tmp_path: Path) -> None:
+    """Test the cache is stored as JSON without the values of secrets."""
+    cache_path = tmp_path / "yaml_cache"
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    _write(
+        config_dir / "configuration.yaml",
+        "password: !secret password\n"
+        "nested:\n  - !secret password\n"
+        "numbers: {1: .inf, 2: 2.5, 3: true}\n"
+        "input: !input name\n",
+    )
+    _write(config_dir / "secrets.yaml", "password: very_secret\n")
+
+    expected = {
+        "password": "very_secret",
+        "nested": ["very_secret"],
+        "numbers": {1: float("inf"), 2: 2.5, 3: True},
+        "input": yaml_util.Input("name"),
+    }
+    config, _ = _load(config_dir, cache_path)
+    assert config == expected
+    content = cache_path.read_bytes()
+    assert json_loads(content)["version"] == CACHE_VERSION
+    assert b"very_secret" not in content
+
+    config, cache = _load(config_dir, cache_path)
+    assert cache.parsed == []
+    assert config == expected
+    assert config["nested"].__line__ == 3
+    assert config["nested"].__config_file__ == str(config_dir / "configuration.yaml")
+
+    _write(config_dir / "secrets.yaml", "other: value\n")
+    with pytest.raises(HomeAssistantError, match="Secret password not defined"):
+        _load(config_dir, cache_path)